@@ -1,71 +1,98 @@
 from manim import *
 import numpy as np
 
-class RepeatedTransformation(Scene):
+from ArrowField import ArrowField
+from EigenScene import EigenScene
+from EigenSystem import EigenSystem
+from GlyphCounter import GlyphCounter
+from MatrixPower import MatrixPowerEngine
+from PlaneFactory import cached_plane
+
+class RepeatedTransformation(EigenScene):
+    # The counter's digit atlas is built at runtime, so declare it for precompilation.
+    TEX_MANIFEST = [("MathTex", (r"\text{Applied: }" + str(d),)) for d in range(10)]
+
+    # Any 2x2 matrix with two distinct real eigenvalues; see BatchRender.py.
+    matrix = [[2, 1],
+              [1, 2]]
+
+    @classmethod
+    def tex_manifest(cls):
+        # The matrix-dependent MathTex strings of construct(), for the precompile prescan.
+        eigen = EigenSystem(cls.matrix)
+        return [
+            ("MathTex", (eigen.matrix_tex(),)),
+            ("MathTex", (r"\vec{v}_1 \; \text{Eigenvalue: }" + eigen.eigenvalue_tex(0),)),
+            ("MathTex", (r"\vec{v}_2 \; \text{Eigenvalue: }" + eigen.eigenvalue_tex(1),)),
+        ]
+
     def construct(self):
+        eigen = EigenSystem(self.matrix)
+
         # Create a larger NumberPlane for better visibility of large vectors.
-        plane = NumberPlane(
-            x_range=[-20, 20, 1],
-            y_range=[-20, 20, 1],
+        # The plane is scaled to show more of the grid.
+        plane = cached_plane(
             background_line_style={
                 "stroke_color": BLUE_D,
                 "stroke_width": 1,
                 "stroke_opacity": 0.6
-            }
+            },
+            scale=0.5,
+            lod=True
         )
-        # Scale the plane to show more of the grid.
-        self.add(plane.scale(0.5))
+        self.add_static_layer(plane)
 
         # Display the transformation matrix in the top left corner.
-        matrix_tex = MathTex(r"A = \begin{pmatrix} 2 & 1 \\ 1 & 2 \end{pmatrix}")
+        matrix_tex = MathTex(eigen.matrix_tex())
         matrix_tex.to_corner(UL)
         self.add(matrix_tex)
 
         # Create a counter ValueTracker and counter display.
         counter_tracker = ValueTracker(0)
-        counter_tex = always_redraw(lambda: MathTex(
-            r"\text{Applied: }" + str(int(counter_tracker.get_value()))
-        ).next_to(matrix_tex, DOWN))
+        # The label and digits are compiled once; the updater only swaps digit outlines.
+        counter_tex = GlyphCounter(r"\text{Applied: }", num_digits=1).next_to(matrix_tex, DOWN)
+        counter_tex.add_updater(lambda m: m.set_value(counter_tracker.get_value()))
         self.add(counter_tex)
 
-        # Draw the full-screen line for eigenvector v2 (v2 = (1, -1)) in YELLOW.
-        eigen2_full_line = Line(
-            start=plane.c2p(20, 20),
-            end=plane.c2p(-20, -20),
+        # Draw the full-screen span of the dominant eigenvector v1 in YELLOW;
+        # the repeated transformation pulls every vector towards it.
+        span_end, span_start = EigenSystem.span_endpoints(eigen.eigenvectors[0])
+        eigen1_full_line = Line(
+            start=plane.c2p(*span_end[:2]),
+            end=plane.c2p(*span_start[:2]),
             color=YELLOW,
             stroke_width=2
         )
-        self.add(eigen2_full_line)
+        self.add(eigen1_full_line)
 
         # Draw the eigenvector for v1.
-        # Dominant eigenvector: v1 = (1, 1) (Eigenvalue: 3)
-        eigen1_vec = Vector([1, 1], color=BLUE)
+        # Dominant eigenvector v1, with the largest |eigenvalue|.
+        eigen1_vec = Vector(eigen.eigenvectors[0], color=BLUE)
         eigen1_line = Line(
             start=plane.c2p(0, 0),
             end=plane.c2p(7, 1.2),
             color=BLUE
         )
-        eigen1_label = MathTex(r"\vec{v}_1 \; \text{Eigenvalue: }3").next_to(eigen1_line.get_end(), UP)
+        eigen1_label = MathTex(r"\vec{v}_1 \; \text{Eigenvalue: }" + eigen.eigenvalue_tex(0)).next_to(eigen1_line.get_end(), UP)
         self.play(GrowArrow(eigen1_vec))
         self.add(eigen1_label)
         self.wait(0.5)
 
         # Draw the eigenvector for v2.
-        # Secondary eigenvector: v2 = (1, -1) (Eigenvalue: 1)
-        eigen2_vec = Vector([1, -1], color=GREEN)
+        # Secondary eigenvector v2.
+        eigen2_vec = Vector(eigen.eigenvectors[1], color=GREEN)
         eigen2_line = Line(
             start=plane.c2p(0, 0),
             end=plane.c2p(7, -1.2),
             color=GREEN
         )
-        eigen2_label = MathTex(r"\vec{v}_2 \; \text{Eigenvalue: }1").next_to(eigen2_line.get_end(), DOWN)
+        eigen2_label = MathTex(r"\vec{v}_2 \; \text{Eigenvalue: }" + eigen.eigenvalue_tex(1)).next_to(eigen2_line.get_end(), DOWN)
         self.play(GrowArrow(eigen2_vec))
         self.add(eigen2_label)
         self.wait(1)
 
         # Define the transformation matrix A as a NumPy array.
-        A = np.array([[2, 1],
-                      [1, 2]])
+        A = np.array(self.matrix)
 
         # Create a group of 12 evenly spaced vectors around a circle of radius 0.5.
         vectors = VGroup()
@@ -80,16 +107,20 @@ class RepeatedTransformation(Scene):
         self.wait(2)
 
         # Apply the transformation repeatedly without distorting the arrowheads.
+        # Every endpoint A^k v is computed in closed form from the original vectors,
+        # for all iterations at once, instead of being read back from the arrows.
         iterations = 5  # Number of repeated transformations.
-        for _ in range(iterations):
+        engine = MatrixPowerEngine(A)
+        starts = np.array([vec.get_start() for vec in vectors])
+        trajectory = engine.apply(
+            np.array([vec.get_end() for vec in vectors]),
+            np.arange(1, iterations + 1)
+        )
+        for ends in trajectory:
             self.play(
                 *[
-                    vec.animate.put_start_and_end_on(
-                        vec.get_start(),
-                        # Compute the new endpoint by applying matrix A to the current endpoint's (x,y) coordinates.
-                        np.append(A.dot(np.array(vec.get_end()[:2])), 0)
-                    )
-                    for vec in vectors
+                    vec.animate.put_start_and_end_on(start, end)
+                    for vec, start, end in zip(vectors, starts, ends)
                 ],
                 # Increment the counter concurrently.
                 counter_tracker.animate.increment_value(1),
@@ -98,3 +129,53 @@ class RepeatedTransformation(Scene):
             self.wait(0.75)
 
         self.wait(2)
+
+
+class PowerFlow(EigenScene):
+    # Fractional powers are only real for non-negative eigenvalues.
+    matrix = [[2, 1],
+              [1, 2]]
+
+    @classmethod
+    def tex_manifest(cls):
+        return [("MathTex", (r"A^k, \quad " + EigenSystem(cls.matrix).matrix_tex(),))]
+
+    def construct(self):
+        # Continuous version of RepeatedTransformation: a dense ring of vectors
+        # flows through A^k as k grows smoothly, so every direction can be seen
+        # turning towards the dominant eigenvector.
+        eigen = EigenSystem(self.matrix)
+        plane = cached_plane(
+            background_line_style={
+                "stroke_color": BLUE_D,
+                "stroke_width": 1,
+                "stroke_opacity": 0.6
+            },
+            scale=0.5,
+            lod=True
+        )
+        self.add_static_layer(plane)
+
+        power_tex = MathTex(r"A^k, \quad " + eigen.matrix_tex())
+        power_tex.to_corner(UL)
+        self.add(power_tex)
+
+        engine = MatrixPowerEngine(self.matrix)
+
+        # Sample vectors evenly spaced around a circle of radius 0.5.
+        n = 240
+        radius = 0.5
+        angles = TAU * np.arange(n) / n
+        initial_ends = np.stack([radius * np.cos(angles), radius * np.sin(angles), np.zeros(n)], axis=1)
+        starts = np.zeros_like(initial_ends)
+
+        k_tracker = ValueTracker(0)
+        field = ArrowField(starts, initial_ends, color=RED, stroke_width=2, tip_length=0.12)
+        field.add_updater(
+            lambda m: m.put_starts_and_ends_on(starts, engine.apply(initial_ends, k_tracker.get_value()))
+        )
+        self.add(field)
+        self.wait(1)
+
+        self.play(k_tracker.animate.set_value(3), run_time=6, rate_func=linear)
+        self.wait(2)
@@ -0,0 +1,123 @@
+from manim import *
+import numpy as np
+
+# Every arrow is four straight cubic curves: the shaft, then the three sides of its tip.
+CURVES_PER_ARROW = 4
+POINTS_PER_ARROW = 4 * CURVES_PER_ARROW
+# Index of the tip apex (the arrow's end point) inside one arrow's points.
+END_POINT_INDEX = 7
+
+
+def arrow_field_points(starts, ends, tip_length=DEFAULT_ARROW_TIP_LENGTH, max_tip_length_to_length_ratio=0.25):
+    # Build the bezier points of all arrows at once, shaped (n * POINTS_PER_ARROW, 3).
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    vectors = ends - starts
+    lengths = np.linalg.norm(vectors, axis=1)
+    units = vectors / np.where(lengths > 0, lengths, 1)[:, None]
+    normals = np.stack([-units[:, 1], units[:, 0], np.zeros(len(units))], axis=1)
+
+    # Like Arrow, short arrows get proportionally shorter tips.
+    tip_lengths = np.minimum(tip_length, max_tip_length_to_length_ratio * lengths)[:, None]
+    bases = ends - units * tip_lengths
+    left = bases + normals * tip_lengths / 2
+    right = bases - normals * tip_lengths / 2
+
+    # Start and end anchors of the four straight curves of each arrow.
+    curve_starts = np.stack([starts, left, ends, right], axis=1)
+    curve_ends = np.stack([bases, ends, right, left], axis=1)
+    handles = np.array([0, 1 / 3, 2 / 3, 1])[None, None, :, None]
+    points = curve_starts[:, :, None, :] + handles * (curve_ends - curve_starts)[:, :, None, :]
+    return points.reshape(-1, 3)
+
+
+class ArrowField(VMobject):
+    # Many straight arrows held by a single VMobject.
+    # All shafts and tips share one contiguous points array, so growing,
+    # apply_matrix and rendering touch one mobject instead of one per arrow.
+    # Indexing (field[4]) returns a standalone copy of one arrow for layout,
+    # e.g. next_to(field[4], UP).
+    def __init__(
+        self,
+        starts,
+        ends,
+        color=WHITE,
+        stroke_width=6,
+        tip_length=DEFAULT_ARROW_TIP_LENGTH,
+        max_tip_length_to_length_ratio=0.25,
+        **kwargs
+    ):
+        self.tip_length = tip_length
+        self.max_tip_length_to_length_ratio = max_tip_length_to_length_ratio
+        # Tips are filled; shafts have no area, so the fill only shows on the tips.
+        super().__init__(
+            color=color,
+            fill_opacity=1,
+            stroke_width=stroke_width,
+            joint_type=LineJointType.ROUND,
+            **kwargs
+        )
+        self.put_starts_and_ends_on(starts, ends)
+
+    @classmethod
+    def along(cls, direction, lengths, start=ORIGIN, **kwargs):
+        # Arrows from a common start along one direction, one per length.
+        direction = np.asarray(direction, dtype=float)
+        direction = direction / np.linalg.norm(direction)
+        lengths = np.asarray(lengths, dtype=float)
+        starts = np.tile(np.asarray(start, dtype=float), (len(lengths), 1))
+        return cls(starts, starts + lengths[:, None] * direction, **kwargs)
+
+    def put_starts_and_ends_on(self, starts, ends):
+        self.set_points(arrow_field_points(
+            starts,
+            ends,
+            tip_length=self.tip_length,
+            max_tip_length_to_length_ratio=self.max_tip_length_to_length_ratio,
+        ))
+        return self
+
+    def get_num_arrows(self):
+        return len(self.points) // POINTS_PER_ARROW
+
+    def get_starts(self):
+        return self.points[::POINTS_PER_ARROW].copy()
+
+    def get_ends(self):
+        return self.points[END_POINT_INDEX::POINTS_PER_ARROW].copy()
+
+    def get_arrow(self, index):
+        index = range(self.get_num_arrows())[index]
+        arrow = VMobject()
+        arrow.set_points(self.points[index * POINTS_PER_ARROW:(index + 1) * POINTS_PER_ARROW])
+        arrow.match_style(self, family=False)
+        return arrow
+
+    def __getitem__(self, value):
+        if isinstance(value, slice):
+            return VGroup(*(self.get_arrow(i) for i in range(self.get_num_arrows())[value]))
+        return self.get_arrow(value)
+
+    def __len__(self):
+        return self.get_num_arrows()
+
+
+class GrowArrowField(Animation):
+    # Grows every arrow of an ArrowField out of its own start point in one
+    # vectorized update. With lag_ratio=1 the arrows grow one after another,
+    # matching a run of consecutive GrowArrow plays.
+    def __init__(self, arrow_field, lag_ratio=0, **kwargs):
+        super().__init__(arrow_field, lag_ratio=lag_ratio, introducer=True, **kwargs)
+
+    def begin(self):
+        self.target_points = self.mobject.points.copy()
+        self.start_points = np.repeat(self.target_points[::POINTS_PER_ARROW], POINTS_PER_ARROW, axis=0)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        num_arrows = self.mobject.get_num_arrows()
+        full_length = (num_arrows - 1) * self.lag_ratio + 1
+        raw_alphas = np.clip(alpha * full_length - np.arange(num_arrows) * self.lag_ratio, 0, 1)
+        sub_alphas = np.array([self.rate_func(a) for a in raw_alphas])
+        sub_alphas = np.repeat(sub_alphas, POINTS_PER_ARROW)[:, None]
+        self.mobject.points = self.start_points + sub_alphas * (self.target_points - self.start_points)
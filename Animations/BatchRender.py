@@ -0,0 +1,202 @@
+from manim import *
+import argparse
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from Derivation import derive
+from EigenSystem import EigenSystem
+from SceneRunner import QUALITIES, load_scene_class, render_config
+
+# Render the eigen scenes for many matrices at once.
+# Every scene reads its matrix from a `matrix` class attribute, so a job is just
+# a subclass with a different matrix. Jobs run in a bounded process pool, one
+# fresh worker process per job, and failed jobs are retried. A summary table is
+# printed and a JSON report is written next to the videos.
+#
+#     python BatchRender.py --matrix "2,1;1,2" --matrix "3,1;0,2" -q m -j 4
+#     python BatchRender.py --matrices matrices.json --scene FinalVisualization
+#     python BatchRender.py --matrix "2,0,0;0,3,4;0,4,-3" --scene SymbolicEigenvalueExample
+#
+# matrices.json holds a list of matrices, e.g. [[[2, 1], [1, 2]], [[3, 1], [0, 2]]].
+# Each scene is only given the matrices it can show: SymbolicEigenvalueExample
+# takes any 2x2 to 4x4, the others need two distinct real eigenvalues.
+BATCH_DIR = Path(__file__).resolve().parent / "media" / "batch"
+
+# Scene class -> file that defines it.
+SCENES = {
+    "GeometricEigenvectorVisualization": "GeometricInterpretation.py",
+    "FinalVisualization": "DetailsAndIntuitionVisualization.py",
+    "DetailedEigenvalueExample": "MathematicalComputation.py",
+    "SymbolicEigenvalueExample": "MathematicalComputation.py",
+    "RepeatedTransformation": "Applications.py",
+    "PowerFlow": "Applications.py",
+}
+# Scenes built from Derivation.py rather than EigenSystem.
+SYMBOLIC_SCENES = {"SymbolicEigenvalueExample"}
+# Scenes that take fractional powers, which are only real for non-negative eigenvalues.
+NONNEGATIVE_SCENES = {"PowerFlow"}
+# PowerFlow needs non-negative eigenvalues, so it is only rendered on request.
+DEFAULT_SCENES = [
+    "GeometricEigenvectorVisualization",
+    "FinalVisualization",
+    "DetailedEigenvalueExample",
+    "RepeatedTransformation",
+]
+
+
+def parse_matrix(text):
+    # "2,1;1,2" -> [[2.0, 1.0], [1.0, 2.0]]
+    return [[float(x) for x in row.split(",")] for row in text.split(";")]
+
+
+def matrix_tag(matrix):
+    # File name safe: [[2, 1], [-1, 0.5]] -> "2_1_m1_0p5"
+    return "_".join(f"{x:g}".replace("-", "m").replace(".", "p") for row in matrix for x in row)
+
+
+def render_job(scene_name, matrix, quality, output_dir):
+    # Worker: render one scene for one matrix. Returns (movie path, seconds).
+    start = time.perf_counter()
+    base = load_scene_class(Path(__file__).resolve().parent / SCENES[scene_name], scene_name)
+    tag = matrix_tag(matrix)
+    scene_class = type(f"{scene_name}_{tag}", (base,), {
+        "matrix": matrix,
+        "__module__": base.__module__,
+        # One worker per job already keeps every core busy.
+        "PRECOMPILE_WORKERS": 0,
+    })
+    # A media folder per job, so concurrent jobs never share LaTeX or partial movie files.
+    media_dir = Path(output_dir) / tag / scene_name
+    with tempconfig(render_config(quality, media_dir=str(media_dir), output_file=f"{scene_name}_{tag}")):
+        scene = scene_class()
+        scene.render()
+        movie_path = Path(scene.renderer.file_writer.movie_file_path)
+    return str(movie_path), time.perf_counter() - start
+
+
+def check_matrix(scene_name, matrix):
+    # Raises ValueError when the scene cannot show the matrix.
+    if scene_name in SYMBOLIC_SCENES:
+        # Solved here once, so every worker finds the derivation in the memo.
+        derive(matrix)
+    else:
+        eigen = EigenSystem(matrix)
+        if scene_name in NONNEGATIVE_SCENES and min(eigen.eigenvalues) < 0:
+            raise ValueError(f"{matrix} has a negative eigenvalue, so its fractional powers are not real")
+
+
+def validate(matrices, scenes=DEFAULT_SCENES):
+    # Split the (matrix, scene) pairs into renderable ones and (matrix, scene, reason) for the rest.
+    valid, invalid = [], []
+    for matrix in matrices:
+        for scene_name in scenes:
+            try:
+                check_matrix(scene_name, matrix)
+            except ValueError as error:
+                invalid.append((matrix, scene_name, str(error)))
+            else:
+                valid.append((matrix, scene_name))
+    return valid, invalid
+
+
+def render_batch(matrices, scenes=DEFAULT_SCENES, quality="l", workers=None, retries=1, output_dir=BATCH_DIR):
+    output_dir = Path(output_dir)
+    valid, invalid = validate(matrices, scenes)
+    for matrix, scene_name, reason in invalid:
+        logger.warning(f"Skipping {scene_name} for {matrix}: {reason}")
+
+    jobs = [
+        {"scene": scene_name, "matrix": matrix, "tag": matrix_tag(matrix), "attempts": 0, "seconds": [], "status": "pending"}
+        for matrix, scene_name in valid
+    ]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    logger.info(
+        f"Rendering {len(jobs)} videos ({len(matrices)} matrices x {len(scenes)} scenes, "
+        f"{len(invalid)} skipped) with {workers} workers"
+    )
+
+    start = time.perf_counter()
+    # A fresh process per job: manim keeps global state between renders.
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        def submit(job):
+            job["attempts"] += 1
+            job["submitted"] = time.perf_counter()
+            return pool.submit(render_job, job["scene"], job["matrix"], quality, str(output_dir))
+
+        running = {submit(job): job for job in jobs}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                try:
+                    job["output"], elapsed = future.result()
+                except Exception as error:
+                    job["seconds"].append(round(time.perf_counter() - job.pop("submitted"), 2))
+                    job["error"] = f"{type(error).__name__}: {error}"
+                    # A ValueError is a matrix the scene cannot show; trying again won't help.
+                    if job["attempts"] <= retries and not isinstance(error, ValueError):
+                        logger.warning(f"{job['scene']} {job['tag']} failed ({job['error']}), retrying")
+                        running[submit(job)] = job
+                    else:
+                        job["status"] = "failed"
+                        logger.error(f"{job['scene']} {job['tag']} failed: {job['error']}")
+                    continue
+                job.pop("submitted")
+                job.pop("error", None)
+                job["seconds"].append(round(elapsed, 2))
+                job["status"] = "done"
+                logger.info(f"{job['scene']} {job['tag']} rendered in {elapsed:.1f}s")
+    wall_time = time.perf_counter() - start
+
+    rendered = sum(job["status"] == "done" for job in jobs)
+    report = {
+        "quality": QUALITIES[quality],
+        "workers": workers,
+        "wall_seconds": round(wall_time, 2),
+        "rendered": rendered,
+        "failed": len(jobs) - rendered,
+        "videos_per_hour": round(rendered / wall_time * 3600, 1) if wall_time > 0 else 0.0,
+        "jobs": jobs,
+        "invalid": [{"matrix": matrix, "scene": scene_name, "reason": reason} for matrix, scene_name, reason in invalid],
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "report.json").write_text(json.dumps(report, indent=2))
+    print_summary(report)
+    return report
+
+
+def print_summary(report):
+    rows = [(job["scene"], job["tag"], job["status"], str(job["attempts"]), f"{sum(job['seconds']):.1f}s")
+            for job in report["jobs"]]
+    rows += [(entry["scene"], matrix_tag(entry["matrix"]), "invalid", "0", "-") for entry in report["invalid"]]
+    header = ("scene", "matrix", "status", "attempts", "time")
+    widths = [max(len(row[i]) for row in rows + [header]) for i in range(len(header))]
+    for row in [header] + rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+    print(
+        f"\n{report['rendered']} rendered, {report['failed']} failed, {len(report['invalid'])} invalid "
+        f"in {report['wall_seconds']:.0f}s with {report['workers']} workers: "
+        f"{report['videos_per_hour']} videos/hour"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the eigen scenes for a list of matrices.")
+    parser.add_argument("--matrix", action="append", default=[], type=parse_matrix, help='e.g. "2,1;1,2"')
+    parser.add_argument("--matrices", default=None, help="JSON file with a list of matrices")
+    parser.add_argument("--scene", action="append", choices=sorted(SCENES), default=None)
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--retries", type=int, default=1)
+    parser.add_argument("-o", "--output-dir", default=str(BATCH_DIR))
+    args = parser.parse_args()
+
+    matrices = list(args.matrix)
+    if args.matrices:
+        matrices += json.loads(Path(args.matrices).read_text())
+    if not matrices:
+        parser.error("give at least one --matrix or a --matrices file")
+    render_batch(matrices, args.scene or DEFAULT_SCENES, args.quality, args.workers, args.retries, args.output_dir)
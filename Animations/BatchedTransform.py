@@ -0,0 +1,100 @@
+from manim import *
+import numpy as np
+
+# ApplyMatrix for many mobjects at once.
+# ApplyMatrix copies its mobject twice (start and target) and then, every
+# frame, interpolates each submobject of the family in its own small NumPy
+# call. For a 40x40 plane that is hundreds of calls per frame.
+#
+# Here all animations of one play() share a PointBuffer. When the first of
+# them begins, the points of every submobject are gathered into one contiguous
+# array, the target is computed from it in a single call, and each submobject's
+# points are replaced by a view into the buffer. A frame is then one in-place
+# interpolation over the whole buffer, which every submobject sees through its
+# view; nothing is copied per submobject and the mobjects themselves are never
+# copied. The views stay in place after the animation, so the final points are
+# not copied back either.
+#
+# There is one animation per mobject (not one for a Group of them), so each
+# mobject stays where it is in the scene:
+#
+#     self.play(*batched_apply_matrix(matrix, grid, arrow1, arrow2, arrow3))
+#
+# Like ApplyMatrix, points move in straight lines, the matrix is applied about
+# the origin by default, and styles are left alone.
+
+
+class PointBuffer:
+    def __init__(self, function, mobjects):
+        self.function = function
+        self.mobjects = mobjects
+        self.alpha = None
+
+    def gather(self):
+        # Called by every animation's begin(); only the first call does the work.
+        if self.alpha is not None:
+            return
+        submobjects = list({
+            id(submobject): submobject
+            for mobject in self.mobjects
+            for submobject in mobject.family_members_with_points()
+        }.values())
+        self.start = np.concatenate([submobject.points for submobject in submobjects]) if submobjects else np.zeros((0, 3))
+        self.target = np.asarray(self.function(self.start.copy()), dtype=float)
+        self.delta = self.target - self.start
+        self.current = self.start.copy()
+        offset = 0
+        for submobject in submobjects:
+            size = len(submobject.points)
+            submobject.points = self.current[offset:offset + size]
+            offset += size
+        self.alpha = 0.0
+
+    def interpolate(self, alpha):
+        # Every animation calls this each frame with the same alpha; compute it once.
+        if alpha == self.alpha:
+            return
+        self.alpha = alpha
+        if alpha == 1:
+            np.copyto(self.current, self.target)
+            return
+        np.multiply(self.delta, alpha, out=self.current)
+        self.current += self.start
+
+
+class BatchedApplyFunction(Animation):
+    # One mobject's share of a PointBuffer; build these with batched_apply_function.
+    def __init__(self, buffer, mobject, **kwargs):
+        self.buffer = buffer
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self):
+        # The start points live in the buffer.
+        return Mobject()
+
+    def begin(self):
+        self.buffer.gather()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        # Animation.interpolate_mobject is where the rate function is applied; it is bypassed here.
+        self.buffer.interpolate(self.rate_func(alpha))
+
+
+def batched_apply_function(function, *mobjects, rate_func=smooth, **kwargs):
+    # function maps an (n, 3) array of points to their targets.
+    buffer = PointBuffer(function, mobjects)
+    return [BatchedApplyFunction(buffer, mobject, rate_func=rate_func, **kwargs) for mobject in mobjects]
+
+
+def batched_apply_matrix(matrix, *mobjects, about_point=ORIGIN, **kwargs):
+    # Same result as ApplyMatrix(matrix, mobject) for each of the mobjects.
+    full_matrix = np.identity(3)
+    matrix = np.array(matrix, dtype=float)
+    full_matrix[:matrix.shape[0], :matrix.shape[1]] = matrix
+    about_point = np.asarray(about_point, dtype=float)
+    return batched_apply_function(
+        lambda points: (points - about_point) @ full_matrix.T + about_point,
+        *mobjects,
+        **kwargs
+    )
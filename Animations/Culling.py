@@ -0,0 +1,134 @@
+from manim import *
+import numpy as np
+
+# Viewport culling for the Cairo camera.
+# Before a frame is drawn every mobject's bounding box is compared with the
+# camera frame. Mobjects that lie fully outside are not handed to Cairo at all.
+# Stroke-only VMobjects that reach past the frame are clipped curve by curve:
+# curves fully outside are dropped, and straight curves (grid lines, vector
+# shafts) are cut down to the part inside the frame. So a plane stretched to
+# y = ±80 costs as much as the part of it that is visible.
+#
+# The test region is the camera frame grown by a margin that covers stroke
+# widths and miter joins, so anything that would touch a pixel is still drawn.
+# Curves are only removed or shortened where they are already off screen, and
+# filled shapes are never clipped, only culled as a whole.
+#
+#     class CullingCamera(CullingCameraMixin, Camera): pass
+
+# Cairo's default miter limit; a join never reaches further than this many half widths.
+MITER_LIMIT = 10
+
+
+class CullingCameraMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reset_culling_stats()
+        self._viewport = None
+        self._crossing = set()
+
+    def reset_culling_stats(self):
+        # Totals since the last reset: mobjects skipped, curves dropped, curves shortened.
+        self.culling_stats = {"culled": 0, "dropped": 0, "clipped": 0}
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = super().get_mobjects_to_display(*args, **kwargs)
+        center, width, height = self.frame_center, self.frame_width, self.frame_height
+        self._viewport = (center[:2] - [width / 2, height / 2], center[:2] + [width / 2, height / 2])
+        self._crossing = set()
+
+        visible = []
+        low, high = self._viewport
+        for mobject in mobjects:
+            points = mobject.points
+            if len(points) == 0:
+                visible.append(mobject)
+                continue
+            margin = self.culling_margin(mobject)
+            mins, maxs = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+            if np.any(maxs < low - margin) or np.any(mins > high + margin):
+                self.culling_stats["culled"] += 1
+                continue
+            if np.any(mins < low - margin) or np.any(maxs > high + margin):
+                self._crossing.add(id(mobject))
+            visible.append(mobject)
+        return visible
+
+    def culling_margin(self, mobject):
+        # How far outside its points a mobject can still paint, in frame units.
+        if not isinstance(mobject, VMobject):
+            return 0
+        width = max(mobject.get_stroke_width(), mobject.get_stroke_width(background=True))
+        return width * self.cairo_line_width_multiple * MITER_LIMIT / 2
+
+    def set_cairo_context_path(self, ctx, vmobject):
+        # A fully clipped path would otherwise leave the previous mobject's path in the context.
+        ctx.new_path()
+        return super().set_cairo_context_path(ctx, vmobject)
+
+    def transform_points_pre_display(self, mobject, points):
+        points = super().transform_points_pre_display(mobject, points)
+        if (
+            id(mobject) not in self._crossing
+            or not isinstance(mobject, VMobject)
+            or np.any(mobject.get_fill_opacities() > 0)
+        ):
+            return points
+        nppcc = mobject.n_points_per_cubic_curve
+        if len(points) % nppcc:
+            return points
+        return self.clip_curves(points.reshape(-1, nppcc, 3), self.culling_margin(mobject)).reshape(-1, 3)
+
+    def clip_curves(self, curves, margin):
+        # curves: (n, 4, 3) cubic Bezier control points of a stroke-only path.
+        low, high = self._viewport[0] - margin, self._viewport[1] + margin
+        xy = curves[:, :, :2]
+        mins, maxs = xy.min(axis=1), xy.max(axis=1)
+        outside = np.any(maxs < low, axis=1) | np.any(mins > high, axis=1)
+        inside = np.all(mins >= low, axis=1) & np.all(maxs <= high, axis=1)
+        crossing = ~outside & ~inside
+
+        # Straight curves have both handles on the chord between the anchors.
+        start, end = curves[:, 0], curves[:, -1]
+        chord = end - start
+        length = np.linalg.norm(chord[:, :2], axis=1)
+        straight = crossing & (length > 0)
+        for handle in curves[:, 1:-1].transpose(1, 0, 2):
+            offset = handle - start
+            cross = np.abs(offset[:, 0] * chord[:, 1] - offset[:, 1] * chord[:, 0])
+            along = np.einsum("ij,ij->i", offset[:, :2], chord[:, :2])
+            straight &= (cross <= 1e-6 * length ** 2) & (along >= 0) & (along <= length ** 2)
+
+        # Liang-Barsky: the parameter range [t0, t1] of each chord inside the viewport.
+        t0, t1 = np.zeros(len(curves)), np.ones(len(curves))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for axis in range(2):
+                direction = chord[:, axis]
+                for p, q in ((-direction, start[:, axis] - low[axis]), (direction, high[axis] - start[:, axis])):
+                    ratio = q / p
+                    t0 = np.where(p < 0, np.maximum(t0, ratio), t0)
+                    t1 = np.where(p > 0, np.minimum(t1, ratio), t1)
+                    # Parallel to this edge and beyond it.
+                    t1 = np.where((p == 0) & (q < 0), -1, t1)
+        missed = straight & (t0 > t1)
+        shortened = straight & ~missed & ((t0 > 0) | (t1 < 1))
+
+        if not np.any(outside | missed | shortened):
+            return curves
+        curves = curves.copy()
+        fractions = np.linspace(0, 1, curves.shape[1])
+        new_start = start[shortened] + t0[shortened, None] * chord[shortened]
+        new_chord = (t1 - t0)[shortened, None] * chord[shortened]
+        curves[shortened] = new_start[:, None] + fractions[None, :, None] * new_chord[:, None]
+
+        self.culling_stats["dropped"] += int(np.count_nonzero(outside | missed))
+        self.culling_stats["clipped"] += int(np.count_nonzero(shortened))
+        return curves[~(outside | missed)]
+
+
+class CullingCamera(CullingCameraMixin, Camera):
+    pass
+
+
+class CullingMovingCamera(CullingCameraMixin, MovingCamera):
+    pass
@@ -0,0 +1,381 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+import numpy as np
+import sympy
+
+from EigenSystem import pmatrix_tex
+
+# Symbolic eigen derivation of a 2x2 to 4x4 matrix, as a sequence of TeX steps.
+# SymPy computes the characteristic polynomial, its factorization over the
+# rationals, the eigenvalues and a basis of every eigenspace in exact
+# arithmetic, and each step of the derivation is written out the way
+# DetailedEigenvalueExample presents it: the characteristic matrix, the
+# determinant and its expansion along the first row, the polynomial, its
+# factors, the eigenvalues and, per eigenvalue, the substituted matrix, the
+# row-reduced system and the eigenvectors.
+#
+# Eigenvalues from an irreducible factor of degree 3 or more have no readable
+# closed form; they are solved numerically and written as decimals.
+#
+# Factoring and solving a 4x4 takes seconds, so the results are memoized on
+# disk in media/derivation_cache (DERIVATION_CACHE_DIR), one JSON file per
+# matrix, and every later render of the same matrix, in any process, only
+# reads the file:
+#
+#     derivation = derive([[2, 0, 0], [0, 3, 4], [0, 4, -3]])
+#     for step in derivation.steps:
+#         step["title"], step["explanation"], step["tex"]
+#
+#     python Derivation.py "2,0,0;0,3,4;0,4,-3"
+#
+# Entries are exact: 0.5, "1/2" and Fraction(1, 2) are the same matrix.
+DERIVATION_CACHE_DIR = Path(os.environ.get("DERIVATION_CACHE_DIR", Path(__file__).resolve().parent / "media" / "derivation_cache"))
+# Bump when the steps change, so old entries are not read back.
+DERIVATION_VERSION = 2
+
+LAMBDA = sympy.Symbol("lambda")
+VARIABLES = "xyzw"
+DEGREE_NAMES = {2: "quadratic", 3: "cubic", 4: "quartic"}
+
+# Derivations already read or computed in this process.
+_MEMO = {}
+
+
+def exact_matrix(matrix):
+    # Rational entries: 0.5, "1/2" and Fraction(1, 2) all become 1/2.
+    rows = [[sympy.Rational(str(entry)) for entry in row] for row in matrix]
+    size = len(rows)
+    if not 2 <= size <= 4 or any(len(row) != size for row in rows):
+        raise ValueError(f"Expected a square matrix of size 2 to 4, got {matrix}")
+    return sympy.Matrix(rows)
+
+
+def derivation_key(matrix):
+    hasher = hashlib.sha256()
+    for part in (DERIVATION_VERSION, sympy.__version__, [[str(entry) for entry in row] for row in matrix.tolist()]):
+        hasher.update(repr(part).encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:32]
+
+
+def tex(expression):
+    return sympy.latex(expression)
+
+
+def parenthesized_tex(expression):
+    # Wrapped in parentheses when it would not read as one factor: 2-\lambda, -3.
+    expression = sympy.sympify(expression)
+    if expression.is_Add or expression.could_extract_minus_sign():
+        return rf"\left({tex(expression)}\right)"
+    return tex(expression)
+
+
+def approximate_tex(value):
+    # 1.247, -0.445+1.2i
+    if abs(value.imag) < 1e-12:
+        return f"{value.real:.4g}"
+    return f"{value.real:.4g}{'+' if value.imag >= 0 else '-'}{abs(value.imag):.4g}i"
+
+
+def value_text(value):
+    # Plain text for Text mobjects: 3, 1/2, 2 + √3.
+    text = re.sub(r"sqrt\((\d+)\)", r"√\1", str(value))
+    return text.replace("sqrt", "√").replace("*I", "i").replace("I", "i").replace("*", "")
+
+
+def matrix_tex(matrix, environment="pmatrix"):
+    body = pmatrix_tex([[tex(entry) for entry in row] for row in matrix.tolist()])
+    return body.replace("pmatrix", environment)
+
+
+def column_tex(entries):
+    return pmatrix_tex([[entry if isinstance(entry, str) else tex(entry)] for entry in entries])
+
+
+def linear_combination_tex(coefficients, symbols):
+    # [1, -1, 0], "xyz" -> x-y; coefficients are exact.
+    result = ""
+    for coefficient, symbol in zip(coefficients, symbols):
+        if coefficient == 0:
+            continue
+        if coefficient == 1:
+            term = f"+{symbol}"
+        elif coefficient == -1:
+            term = f"-{symbol}"
+        elif coefficient.is_Add:
+            term = rf"+\left({tex(coefficient)}\right){symbol}"
+        elif coefficient.could_extract_minus_sign():
+            term = f"-{tex(-coefficient)}{symbol}"
+        else:
+            term = f"+{tex(coefficient)}{symbol}"
+        result += term
+    return result.removeprefix("+") or "0"
+
+
+def shifted_matrix_name_tex(value):
+    # A-I, A-3I, A+2I, A-\left(2+\sqrt{3}\right)I; just A for λ = 0.
+    if value == 0:
+        return "A"
+    if value.is_Rational:
+        sign = "+" if value < 0 else "-"
+        magnitude = abs(value)
+        return f"A{sign}{'' if magnitude == 1 else tex(magnitude)}I"
+    if not value.is_Add:
+        return f"A+{tex(-value)}I" if value.could_extract_minus_sign() else f"A-{tex(value)}I"
+    return rf"A-{parenthesized_tex(value)}I"
+
+
+def expansion_tex(shifted):
+    # Cofactor expansion along the first row; 2x2 is the familiar ad-bc.
+    size = shifted.rows
+    result = ""
+    for column in range(size):
+        entry = shifted[0, column]
+        if entry == 0:
+            continue
+        minor = shifted.minor_submatrix(0, column)
+        if column % 2:
+            entry = -entry
+        if size == 2:
+            minor_entry = minor[0, 0]
+            factor = f"({tex(minor_entry)})" if minor_entry.is_Add else rf"\cdot{parenthesized_tex(minor_entry)}"
+        else:
+            factor = matrix_tex(minor, "vmatrix")
+        if entry.is_Add:
+            coefficient = f"+({tex(entry)})"
+        elif entry.could_extract_minus_sign():
+            coefficient = f"-{'' if entry == -1 and size > 2 else tex(-entry)}"
+        else:
+            coefficient = f"+{'' if entry == 1 and size > 2 else tex(entry)}"
+        result += coefficient + factor
+    return (result.removeprefix("+") or "0") + "=0"
+
+
+def clean_vector(vector):
+    # Small integers where the entries are rational, first nonzero entry positive;
+    # otherwise scaled so that the first nonzero entry is 1.
+    entries = [sympy.simplify(entry) for entry in vector]
+    first = next(entry for entry in entries if entry != 0)
+    if all(entry.is_Rational for entry in entries):
+        scale = sympy.ilcm(*(entry.q for entry in entries))
+        numerators = [int(entry * scale) for entry in entries]
+        divisor = sympy.igcd(*numerators)
+        sign = 1 if first > 0 else -1
+        return [sympy.Integer(sign * numerator // divisor) for numerator in numerators]
+    return [sympy.radsimp(sympy.simplify(entry / first)) for entry in entries]
+
+
+def numeric_null_space(matrix, tolerance=1e-8):
+    # Orthonormal basis of the null space of a float matrix, from its SVD.
+    _, singular_values, rows = np.linalg.svd(matrix)
+    rank = int(np.sum(singular_values > tolerance * max(singular_values[0], 1)))
+    basis = []
+    for vector in rows[rank:].conj():
+        # First nonzero entry real and positive, so the basis prints the same every run.
+        vector = vector / vector[np.argmax(np.abs(vector) > tolerance)]
+        basis.append(vector / np.linalg.norm(vector))
+    return basis
+
+
+def compute_derivation(matrix):
+    # The full derivation as JSON-ready data; this is the slow part.
+    size = matrix.rows
+    shifted = matrix - LAMBDA * sympy.eye(size)
+    determinant = sympy.expand(shifted.det(method="berkowitz"))
+    _, factors = sympy.factor_list(determinant, LAMBDA)
+    # A pure power such as lambda^2 comes back with a sympy Integer multiplicity, which JSON cannot store.
+    factors = [(factor, int(multiplicity)) for factor, multiplicity in factors]
+
+    eigenvalues = []
+    for factor, multiplicity in factors:
+        degree = sympy.degree(factor, LAMBDA)
+        if degree <= 2:
+            for value in sympy.roots(factor, LAMBDA):
+                eigenvalues.append((sympy.simplify(value), multiplicity, True))
+        else:
+            for value in sympy.Poly(factor, LAMBDA).nroots(n=15):
+                eigenvalues.append((value, multiplicity, False))
+    eigenvalues.sort(key=lambda item: (float(sympy.re(item[0])), float(sympy.im(item[0]))))
+
+    data = {
+        "version": DERIVATION_VERSION,
+        "matrix": [[str(entry) for entry in row] for row in matrix.tolist()],
+        "characteristic_polynomial": sympy.srepr(determinant),
+        "factors": [[sympy.srepr(factor), multiplicity] for factor, multiplicity in factors],
+        "eigenvalues": [],
+        "steps": [],
+    }
+    symbols = VARIABLES[:size]
+    unknowns = column_tex(list(symbols))
+    zeros = column_tex(["0"] * size)
+
+    def step(name, title, explanation, tex_string):
+        data["steps"].append({"name": name, "title": title, "explanation": explanation, "tex": tex_string})
+
+    step("matrix", "Display the matrix A with explanation", "We start with our matrix A.", f"A={matrix_tex(matrix)}")
+    step("characteristic_matrix", "Write (A - λI) for our specific matrix A", "For our matrix A, we have:", rf"A-\lambda I={matrix_tex(shifted)}")
+    step(
+        "determinant", "Determinant Condition for Non-trivial Solutions",
+        "Non-trivial solutions exist only if the matrix is singular.\nThus, we set its determinant to zero:",
+        rf"\det\left({matrix_tex(shifted)}\right)=0",
+    )
+    step(
+        "expansion", "Expand the Determinant Step-by-Step",
+        "Compute the determinant:" if size == 2 else "Expand the determinant along the first row:",
+        expansion_tex(shifted),
+    )
+    step(
+        "polynomial", "The Characteristic Polynomial",
+        f"This is the characteristic polynomial, a {DEGREE_NAMES[size]}:", f"{tex(determinant)}=0",
+    )
+    if len(factors) > 1 or factors[0][1] > 1:
+        step(
+            "factored", "Factor the Characteristic Polynomial",
+            f"Factor the {DEGREE_NAMES[size]} polynomial:", f"{tex(sympy.factor(determinant))}=0",
+        )
+    all_linear = all(sympy.degree(factor, LAMBDA) == 1 for factor, _ in factors)
+
+    value_texs = []
+    for value, multiplicity, exact in eigenvalues:
+        numeric = complex(sympy.N(value, 15))
+        entry = {
+            "value": sympy.srepr(value) if exact else None,
+            "numeric": [numeric.real, numeric.imag],
+            "exact": exact,
+            "multiplicity": multiplicity,
+            "tex": tex(value) if exact else approximate_tex(numeric),
+            "text": value_text(value) if exact else approximate_tex(numeric),
+        }
+        if exact:
+            shifted_value = sympy.simplify(matrix - value * sympy.eye(size))
+            basis = [clean_vector(vector) for vector in shifted_value.nullspace(simplify=True)]
+            reduced, pivots = shifted_value.rref(simplify=True)
+            reduced = reduced.applyfunc(lambda x: sympy.radsimp(sympy.simplify(x)))
+            equations = [
+                linear_combination_tex(reduced.row(row), symbols) + "=0"
+                for row in range(len(pivots))
+            ]
+            entry["basis"] = [[sympy.srepr(x) for x in vector] for vector in basis]
+            entry["basis_tex"] = [column_tex(vector) for vector in basis]
+            entry["basis_numeric"] = [[[complex(x).real, complex(x).imag] for x in vector] for vector in basis]
+            entry["system_tex"] = r",\quad ".join(equations)
+            entry["shifted_tex"] = matrix_tex(shifted_value)
+        else:
+            shifted_value = np.array(matrix.tolist(), dtype=complex) - numeric * np.eye(size)
+            basis = numeric_null_space(shifted_value)
+            entry["basis"] = None
+            entry["basis_tex"] = [column_tex([approximate_tex(complex(x)) for x in vector]) for vector in basis]
+            entry["basis_numeric"] = [[[x.real, x.imag] for x in vector] for vector in basis]
+            entry["system_tex"] = None
+            entry["shifted_tex"] = pmatrix_tex([[approximate_tex(complex(x)) for x in row] for row in shifted_value])
+        data["eigenvalues"].append(entry)
+        repeat = rf"\text{{ (multiplicity {multiplicity})}}" if multiplicity > 1 else ""
+        relation = "=" if exact else r"\approx "
+        value_texs.append(rf"\lambda{relation}{entry['tex']}{repeat}")
+
+    if all_linear:
+        explanation = "Setting each factor to zero gives the eigenvalues:"
+    elif all(exact for _, _, exact in eigenvalues):
+        explanation = "Its roots are the eigenvalues:"
+    else:
+        explanation = "Its roots, found numerically where they have no simple form, are the eigenvalues:"
+    step("eigenvalues", "Solve for Eigenvalues", explanation, r" \quad \text{or} \quad ".join(value_texs))
+
+    for index, entry in enumerate(data["eigenvalues"]):
+        title = f"Finding the Eigenvector for λ = {entry['text']}"
+        if entry["exact"]:
+            value = sympy.sympify(entry["value"])
+            name = shifted_matrix_name_tex(value)
+            name = name if name == "A" else f"({name})"
+            step(
+                "substitution", title,
+                f"{'Substitute' if index == 0 else 'Now substitute'} λ = {entry['text']} into (A - λI)x = 0:",
+                rf"{name}\mathbf{{x}}={entry['shifted_tex']}{unknowns}={zeros}",
+            )
+            # A scalar matrix leaves A - λI = 0, so there are no equations to show.
+            if entry["system_tex"]:
+                step("system", title, "Row reduction leaves the system:", entry["system_tex"])
+        else:
+            step(
+                "substitution", title,
+                f"{'Substitute' if index == 0 else 'Now substitute'} λ ≈ {entry['text']} into (A - λI)x = 0:",
+                rf"(A-\lambda I)\mathbf{{x}}\approx{entry['shifted_tex']}{unknowns}={zeros}",
+            )
+        relation = "=" if entry["exact"] else r"\approx"
+        if len(entry["basis_tex"]) == 1:
+            explanation = "Any nonzero multiple of this vector is an eigenvector:"
+            eigenvectors = rf"\mathbf{{x}}{relation}{entry['basis_tex'][0]}"
+        else:
+            explanation = f"The eigenvectors form a {len(entry['basis_tex'])}-dimensional space, spanned by:"
+            eigenvectors = rf"\mathbf{{x}}\in\operatorname{{span}}\left\{{{', '.join(entry['basis_tex'])}\right\}}"
+        step("eigenvectors", title, explanation, r"\text{Eigenvector: } " + eigenvectors)
+    return data
+
+
+class Derivation:
+    def __init__(self, data):
+        self.data = data
+        self.size = len(data["matrix"])
+        self.steps = data["steps"]
+        self.eigenvalues = data["eigenvalues"]
+
+    def matrix(self):
+        return sympy.Matrix([[sympy.Rational(entry) for entry in row] for row in self.data["matrix"]])
+
+    def characteristic_polynomial(self):
+        return sympy.sympify(self.data["characteristic_polynomial"])
+
+    def eigenvalue(self, index):
+        # Exact for eigenvalues with a closed form, a complex float otherwise.
+        entry = self.eigenvalues[index]
+        if entry["exact"]:
+            return sympy.sympify(entry["value"])
+        return complex(*entry["numeric"])
+
+    def is_real(self):
+        return all(abs(entry["numeric"][1]) < 1e-12 for entry in self.eigenvalues)
+
+    def basis(self, index):
+        # The eigenspace basis as float (or complex) arrays, for drawing.
+        vectors = [np.array([complex(*x) for x in vector]) for vector in self.eigenvalues[index]["basis_numeric"]]
+        return [vector.real if not np.any(vector.imag) else vector for vector in vectors]
+
+    def step(self, name):
+        return next(step for step in self.steps if step["name"] == name)
+
+
+def derive(matrix, cache_dir=DERIVATION_CACHE_DIR):
+    # The Derivation of matrix, read from the memo when it was computed before.
+    matrix = exact_matrix(matrix)
+    key = derivation_key(matrix)
+    if key in _MEMO:
+        return _MEMO[key]
+    path = Path(cache_dir) / f"{key}.json"
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        data = compute_derivation(matrix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name first, so concurrent renders never read half a file.
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(data, indent=1))
+        os.replace(temporary, path)
+    _MEMO[key] = Derivation(data)
+    return _MEMO[key]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the eigen derivation of a matrix and store it in the memo.")
+    parser.add_argument("matrix", nargs="+", help='Rows separated by ";", e.g. "2,0,0;0,3,4;0,4,-3".')
+    args = parser.parse_args()
+    for text in args.matrix:
+        start = time.perf_counter()
+        derivation = derive([row.split(",") for row in text.split(";")])
+        print(f"{text}: {len(derivation.steps)} steps in {time.perf_counter() - start:.2f}s")
+        for step in derivation.steps:
+            print(f"  [{step['name']}] {step['tex']}")
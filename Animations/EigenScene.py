@@ -0,0 +1,52 @@
+from manim import *
+
+from Culling import CullingCameraMixin
+from GridLOD import GridLODCameraMixin
+from HoldEncoding import HoldFileWriter
+from Memory import MemoryMixin
+from Precompile import PrecompileMixin
+from Profiling import ProfilingMixin
+from ProgressiveOutput import ProgressiveFileWriter, progressive_enabled
+from StaticLayer import StaticLayerCameraMixin, StaticLayerMixin
+from TexCache import enable_tex_cache
+
+# Base classes for every scene in this project.
+# They bundle the rendering setup the scenes share: the persistent TeX cache,
+# the parallel TeX prescan, the file writer that encodes static holds once,
+# a camera that skips or clips whatever a transformation throws off screen and
+# thins grid lines too dense or faint to see, and a static background layer
+# that is rasterized once per camera state. Profiling (Profiling.py) is
+# available to all of them and switched on with EIGEN_PROFILE=1, and so is
+# progressive HLS output (ProgressiveOutput.py), with EIGEN_PROGRESSIVE=1.
+# Removed mobjects are released at once and memory is reported per section
+# with EIGEN_MEMORY=1 (Memory.py).
+enable_tex_cache()
+
+
+# GridLOD drops grid lines before culling looks at the rest.
+class EigenCamera(StaticLayerCameraMixin, CullingCameraMixin, GridLODCameraMixin, Camera):
+    pass
+
+
+class EigenMovingCamera(StaticLayerCameraMixin, CullingCameraMixin, GridLODCameraMixin, MovingCamera):
+    pass
+
+
+class EigenScene(MemoryMixin, ProfilingMixin, StaticLayerMixin, PrecompileMixin, Scene):
+    file_writer_class = HoldFileWriter
+    renderer_class = CairoRenderer
+
+    def __init__(self, renderer=None, camera_class=EigenCamera, skip_animations=False, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = self.renderer_class(
+                file_writer_class=ProgressiveFileWriter if progressive_enabled(self) else self.file_writer_class,
+                camera_class=camera_class,
+                skip_animations=skip_animations,
+            )
+        super().__init__(renderer=renderer, camera_class=camera_class, skip_animations=skip_animations, **kwargs)
+
+
+class EigenMovingCameraScene(MovingCameraScene, EigenScene):
+    # MovingCameraScene passes the camera class on to EigenScene.__init__.
+    def __init__(self, camera_class=EigenMovingCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
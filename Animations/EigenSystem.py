@@ -0,0 +1,263 @@
+from fractions import Fraction
+import numpy as np
+
+# Eigen data of a 2x2 matrix, in the form the scenes draw and write it.
+# Scenes take their matrix from a class attribute and read everything else
+# (eigenvalues, eigenvector directions, span endpoints, TeX and labels) from
+# an EigenSystem, so one scene class renders any suitable matrix.
+#
+# Eigenpairs are ordered dominant first (largest |lambda|). Eigenvector
+# directions are scaled to small integers where possible, e.g. (1, -1) rather
+# than (0.707, -0.707), with the first nonzero entry positive.
+
+# Largest denominator still written as a fraction rather than a decimal.
+MAX_DENOMINATOR = 12
+
+
+def as_fraction(x, tolerance=1e-9):
+    # The exact small-denominator fraction equal to x, or None.
+    fraction = Fraction(float(x)).limit_denominator(MAX_DENOMINATOR)
+    return fraction if abs(float(fraction) - x) < tolerance else None
+
+
+def number_text(x):
+    # Plain text form for Text mobjects: 3, -1/2, 2.414.
+    fraction = as_fraction(x)
+    if fraction is None:
+        return f"{x:.4g}"
+    return str(fraction)
+
+
+def number_tex(x):
+    # TeX form: 3, -\frac{1}{2}, 2.414.
+    fraction = as_fraction(x)
+    if fraction is None:
+        return f"{x:.4g}"
+    if fraction.denominator == 1:
+        return str(fraction.numerator)
+    sign = "-" if fraction < 0 else ""
+    return rf"{sign}\frac{{{abs(fraction.numerator)}}}{{{fraction.denominator}}}"
+
+
+def pmatrix_tex(rows):
+    # rows holds TeX strings or numbers.
+    body = r"\\".join(" & ".join(entry if isinstance(entry, str) else number_tex(entry) for entry in row) for row in rows)
+    return rf"\begin{{pmatrix}}{body}\end{{pmatrix}}"
+
+
+def nice_direction(vector, tolerance=1e-9):
+    # Scale a direction to small integers if it has rational proportions.
+    vector = np.asarray(vector, dtype=float)
+    nonzero = vector[np.abs(vector) > tolerance]
+    vector = vector / np.min(np.abs(nonzero))
+    fractions = [as_fraction(x) if abs(x) > tolerance else Fraction(0) for x in vector]
+    if all(f is not None for f in fractions):
+        scale = np.lcm.reduce([f.denominator for f in fractions])
+        vector = np.array([float(f * scale) for f in fractions])
+    else:
+        vector = vector / np.linalg.norm(vector)
+    first = vector[np.abs(vector) > tolerance][0]
+    return vector if first > 0 else -vector
+
+
+class EigenSystem:
+    def __init__(self, matrix, tolerance=1e-9):
+        self.matrix = np.array(matrix, dtype=float)
+        if self.matrix.shape != (2, 2):
+            raise ValueError(f"Expected a 2x2 matrix, got shape {self.matrix.shape}")
+        self.tolerance = tolerance
+
+        values, vectors = np.linalg.eig(self.matrix)
+        if np.any(np.abs(values.imag) > tolerance):
+            raise ValueError(f"{self.matrix.tolist()} has complex eigenvalues, so no real eigenvectors to show")
+        if abs(values[0].real - values[1].real) < tolerance:
+            raise ValueError(
+                f"{self.matrix.tolist()} has a repeated eigenvalue, so it does not have "
+                "two distinct eigenvector directions to contrast"
+            )
+
+        order = np.argsort(-np.abs(values.real), kind="stable")
+        self.eigenvalues = [self._snap(values.real[i]) for i in order]
+        self.eigenvectors = [nice_direction(vectors.real[:, i]) for i in order]
+
+    def _snap(self, x):
+        # Round away floating point noise in rational eigenvalues.
+        fraction = as_fraction(x, tolerance=1e-7)
+        return float(fraction) if fraction is not None else float(x)
+
+    # Vectors
+
+    def eigenvector_3d(self, index, length=None):
+        vector = self.eigenvectors[index]
+        if length is not None:
+            vector = vector / np.linalg.norm(vector) * length
+        return np.array([vector[0], vector[1], 0.0])
+
+    def is_eigenvector(self, vector, degrees=10):
+        # True if vector lies within `degrees` of an eigenvector's span.
+        vector = np.asarray(vector, dtype=float)[:2]
+        for eigenvector in self.eigenvectors:
+            cosine = abs(vector @ eigenvector) / (np.linalg.norm(vector) * np.linalg.norm(eigenvector))
+            if cosine > np.cos(np.radians(degrees)):
+                return True
+        return False
+
+    def non_eigenvector(self, preferred=(2, 1)):
+        # A vector clearly off both eigenvector spans, `preferred` when it qualifies.
+        candidates = [preferred, (2, 1), (1, 2), (2, 0.5), (1, 0), (0, 1), (2, -1), (1, -2)]
+        for candidate in candidates:
+            if not self.is_eigenvector(candidate):
+                return np.array([candidate[0], candidate[1], 0.0], dtype=float)
+        raise ValueError(f"No clear non-eigenvector found for {self.matrix.tolist()}")
+
+    @staticmethod
+    def span_endpoints(vector, extent=20):
+        # Where the span of `vector` leaves the square grid [-extent, extent]^2,
+        # e.g. (20, 10) and (-20, -10) for (2, 1).
+        vector = np.array([vector[0], vector[1], 0.0], dtype=float)
+        end = vector * extent / np.max(np.abs(vector[:2]))
+        return end, -end
+
+    # Text and TeX
+
+    def matrix_tex(self, name="A"):
+        return rf"{name} = {pmatrix_tex(self.matrix)}"
+
+    def eigenvalue_text(self, index):
+        return number_text(self.eigenvalues[index])
+
+    def eigenvalue_tex(self, index):
+        return number_tex(self.eigenvalues[index])
+
+    def eigenvector_tex(self, index):
+        return pmatrix_tex([[x] for x in self.eigenvectors[index]])
+
+    def scaling_text(self, index):
+        # How the matrix acts along an eigenvector, for on-screen captions.
+        value = self.eigenvalues[index]
+        if abs(value) < self.tolerance:
+            return "Collapsed to Zero"
+        if value < 0:
+            return f"Flipped and Stretched by Factor of {number_text(-value)}"
+        return f"Stretched by Factor of {number_text(value)}"
+
+    def is_rational(self):
+        return all(as_fraction(value) is not None for value in self.eigenvalues)
+
+    def ascending(self):
+        # Eigenpair indices in increasing eigenvalue order, as a derivation lists them.
+        return sorted(range(2), key=lambda i: self.eigenvalues[i])
+
+    # Step-by-step derivation, as written in DetailedEigenvalueExample
+
+    def _parenthesized(self, x):
+        return f"({number_tex(x)})" if x < 0 else number_tex(x)
+
+    def _minus_lambda_tex(self, x):
+        return r"-\lambda" if abs(x) < self.tolerance else rf"{number_tex(x)}-\lambda"
+
+    def _characteristic_pmatrix(self):
+        (a, b), (c, d) = self.matrix
+        return pmatrix_tex([[self._minus_lambda_tex(a), b], [c, self._minus_lambda_tex(d)]])
+
+    def characteristic_matrix_tex(self):
+        return rf"A-\lambda I={self._characteristic_pmatrix()}"
+
+    def determinant_equation_tex(self):
+        return rf"\det\left({self._characteristic_pmatrix()}\right)=0"
+
+    def expanded_determinant_tex(self):
+        (a, b), (c, d) = self.matrix
+        return (
+            rf"({self._minus_lambda_tex(a)})({self._minus_lambda_tex(d)})"
+            rf"-{self._parenthesized(b)}\cdot{self._parenthesized(c)}=0"
+        )
+
+    def characteristic_polynomial_tex(self):
+        # lambda^2 - trace * lambda + det = 0
+        trace, determinant = np.trace(self.matrix), np.linalg.det(self.matrix)
+        return r"\lambda^2" + linear_terms_tex([(-trace, r"\lambda"), (self._snap(determinant), "")]) + "=0"
+
+    def factored_tex(self):
+        # Only meaningful when is_rational(); otherwise use characteristic_polynomial_tex().
+        factors = []
+        for index in self.ascending():
+            value = self.eigenvalues[index]
+            factors.append(r"\lambda" if abs(value) < self.tolerance else rf"(\lambda{linear_terms_tex([(-value, '')])})")
+        return "".join(factors) + "=0"
+
+    def eigenvalues_tex(self):
+        return r" \quad \text{or} \quad ".join(rf"\lambda={self.eigenvalue_tex(i)}" for i in self.ascending())
+
+    def shifted_matrix_name_tex(self, index):
+        # A-I, A-3I, A+2I, ...; just A for a zero eigenvalue.
+        value = self.eigenvalues[index]
+        if abs(value) < self.tolerance:
+            return "A"
+        sign = "+" if value < 0 else "-"
+        magnitude = abs(value)
+        coefficient = "" if abs(magnitude - 1) < self.tolerance else number_tex(magnitude)
+        return f"A{sign}{coefficient}I"
+
+    def _minus_eigenvalue_tex(self, x, value):
+        return number_tex(x) if abs(value) < self.tolerance else f"{number_tex(x)}-{self._parenthesized(value)}"
+
+    def substitution_tex(self, index):
+        value = self.eigenvalues[index]
+        (a, b), (c, d) = self.matrix
+        shifted = pmatrix_tex([
+            [self._minus_eigenvalue_tex(a, value), b],
+            [c, self._minus_eigenvalue_tex(d, value)],
+        ])
+        name = self.shifted_matrix_name_tex(index)
+        name = name if name == "A" else f"({name})"
+        return (
+            rf"{name}x={shifted}"
+            r"\begin{pmatrix}x\\y\end{pmatrix}=\begin{pmatrix}0\\0\end{pmatrix}"
+        )
+
+    def system_coefficients(self, index):
+        # The nonzero row of A - lambda I, i.e. the one equation p x + q y = 0.
+        shifted = self.matrix - self.eigenvalues[index] * np.eye(2)
+        row = shifted[np.argmax(np.linalg.norm(shifted, axis=1))]
+        return [self._snap(x) for x in row]
+
+    def system_text(self, index):
+        # Plain text with every coefficient spelled out: 1·x + 1·y = 0, (-1)x + 1·y = 0.
+        terms = [
+            f"({number_text(p)}){name}" if p < 0 else f"{number_text(p)}·{name}"
+            for p, name in zip(self.system_coefficients(index), "xy")
+        ]
+        return " + ".join(terms) + " = 0"
+
+    def system_equation_text(self, index):
+        # Simplified plain text: x + y = 0, -x + y = 0.
+        result = ""
+        for p, name in zip(self.system_coefficients(index), "xy"):
+            if abs(p) < self.tolerance:
+                continue
+            magnitude = "" if abs(abs(p) - 1) < self.tolerance else number_text(abs(p))
+            sign = ("-" if p < 0 else "") if not result else (" - " if p < 0 else " + ")
+            result += f"{sign}{magnitude}{name}"
+        return result + " = 0"
+
+    def system_tex(self, index):
+        # Simplified TeX: x+y=0, -x+y=0.
+        return linear_terms_tex(list(zip(self.system_coefficients(index), "xy")), leading=True) + "=0"
+
+
+def linear_terms_tex(terms, leading=False):
+    # Join (coefficient, symbol) pairs into a signed sum, dropping zero terms and unit
+    # coefficients: [(1, "x"), (-1, "y")] -> "x-y". With leading=False every term
+    # carries its sign, for appending to an expression.
+    result = ""
+    for coefficient, symbol in terms:
+        if abs(coefficient) < 1e-9:
+            continue
+        sign = "-" if coefficient < 0 else ("" if leading and not result else "+")
+        magnitude = abs(coefficient)
+        if symbol and abs(magnitude - 1) < 1e-9:
+            result += f"{sign}{symbol}"
+        else:
+            result += f"{sign}{number_tex(magnitude)}{symbol}"
+    return result or "0"
@@ -1,37 +1,122 @@
 from manim import *
 
-class GeometricEigenvectorVisualization(Scene):
+from BatchedTransform import batched_apply_matrix
+from EigenScene import EigenScene
+from EigenSystem import EigenSystem
+from PlaneFactory import cached_plane
+
+# Colours of the dense samples, from Av along v to the largest angle between them.
+SAMPLE_COLORS = [YELLOW, ORANGE, RED]
+
+
+def direction_text(eigenvalue):
+    # An eigenvector keeps its span; a negative eigenvalue reverses its direction.
+    if eigenvalue < 0:
+        return "✅ Span preserved (flipped)"
+    return "✅ Direction preserved"
+
+
+def direction_samples(mode, count, radius=2, extent=(7, 4)):
+    # count sample vectors as an (n, 3) array: evenly spaced on a circle, or a
+    # lattice filling the frame. Ordered by angle, so they can be revealed in a sweep.
+    if mode == "circle":
+        angles = np.linspace(0, TAU, count, endpoint=False)
+        return np.stack([radius * np.cos(angles), radius * np.sin(angles), np.zeros(count)], axis=1)
+    step = np.sqrt(4 * extent[0] * extent[1] / count)
+    x, y = np.meshgrid(np.arange(-extent[0], extent[0] + step / 2, step), np.arange(-extent[1], extent[1] + step / 2, step))
+    samples = np.stack([x.ravel(), y.ravel(), np.zeros(x.size)], axis=1)
+    samples = samples[np.hypot(samples[:, 0], samples[:, 1]) > step / 2]
+    return samples[np.argsort(np.arctan2(samples[:, 1], samples[:, 0]))]
+
+
+def span_angles(matrix, vectors):
+    # Angle between the lines through v and Av for every row of vectors, in one
+    # matmul. Flipped eigenvectors count as 0 too, vectors sent to zero as well.
+    vectors = vectors[:, :2]
+    images = vectors @ np.asarray(matrix, dtype=float).T
+    lengths = np.linalg.norm(vectors, axis=1)
+    image_lengths = np.linalg.norm(images, axis=1)
+    cosines = np.abs(np.einsum("ij,ij->i", vectors, images))
+    # Rounding leaves a null vector's image a hair off zero; that is still zero.
+    sent_to_zero = image_lengths <= 1e-9 * lengths
+    cosines = np.divide(cosines, lengths * image_lengths, out=np.ones_like(lengths), where=~sent_to_zero)
+    return np.arccos(np.clip(cosines, 0, 1))
+
+
+def angle_colors(angles, colors=SAMPLE_COLORS):
+    # RGBA per angle, interpolated along colors from 0 to the largest angle.
+    palette = np.array([color_to_rgba(color) for color in colors])
+    stops = np.linspace(0, max(angles.max(initial=0), 1e-6), len(colors))
+    return np.stack([np.interp(angles, stops, palette[:, channel]) for channel in range(4)], axis=1)
+
+
+def direction_cloud(matrix, mode="lattice", count=4000, stroke_width=3):
+    # All samples as one PMobject, each coloured by how far the matrix turns it.
+    samples = direction_samples(mode, count)
+    return PMobject(stroke_width=stroke_width).add_points(samples, rgbas=angle_colors(span_angles(matrix, samples)))
+
+
+class RevealPoints(Animation):
+    # PMobjects overwrite pixels instead of blending them, so they can't fade in;
+    # this adds the points in their order instead.
+    def interpolate_mobject(self, alpha):
+        self.mobject.pointwise_become_partial(self.starting_mobject, 0, self.rate_func(alpha))
+
+
+class GeometricEigenvectorVisualization(EigenScene):
+    # Any 2x2 matrix with two distinct real eigenvalues; see BatchRender.py.
+    matrix = [[2, 1],
+              [1, 2]]
+    # "circle" or "lattice" adds dense_samples sample vectors as one point
+    # cloud, coloured by the angle between v and Av; see DenseEigenvectorVisualization.
+    dense_mode = None
+    dense_samples = 4000
+
     def construct(self):
-        matrix = [[2, 1],
-                  [1, 2]]
+        matrix = self.matrix
+        eigen = EigenSystem(matrix)
 
         # === GRID ===
-        grid = NumberPlane(
-            x_range=[-20, 20, 1],
-            y_range=[-20, 20, 1],
+        grid = cached_plane(
             background_line_style={
                 "stroke_color": BLUE_E,
                 "stroke_width": 1,
                 "stroke_opacity": 0.8,
-            }
-        ).scale(0.5)
-        self.add(grid)
+            },
+            scale=0.5,
+            lod=True
+        )
+        # The grid stays put until the transformation, the legend for good.
+        self.add_static_layer(grid)
 
         # === LEGEND ===
         legend = VGroup(
             Text("Legend:", font_size=24),
-            Text("YELLOW → Eigenvector 1 (λ = 3)", font_size=20, color=YELLOW),
-            Text("GREEN → Eigenvector 2 (λ = 1)", font_size=20, color=GREEN),
+            Text(f"YELLOW → Eigenvector 1 (λ = {eigen.eigenvalue_text(0)})", font_size=20, color=YELLOW),
+            Text(f"GREEN → Eigenvector 2 (λ = {eigen.eigenvalue_text(1)})", font_size=20, color=GREEN),
             Text("RED → Not an Eigenvector", font_size=20, color=RED)
-        ).arrange(DOWN, aligned_edge=LEFT).to_corner(UL).shift(DOWN * 0.2 + RIGHT * 0.3)
+        )
+        if self.dense_mode:
+            legend.add(Text("Dots: YELLOW → RED as the angle of Av to v grows", font_size=20))
+        legend.arrange(DOWN, aligned_edge=LEFT).to_corner(UL).shift(DOWN * 0.2 + RIGHT * 0.3)
 
         self.play(FadeIn(legend))
+        self.add_static_layer(legend)
         self.wait(0.5)
 
+        # === DENSE SAMPLES ===
+        # Eigen-directions show up as the yellow bands.
+        clouds = []
+        if self.dense_mode:
+            clouds.append(direction_cloud(matrix, self.dense_mode, self.dense_samples))
+            self.play(RevealPoints(clouds[0], run_time=1.5))
+            self.wait(0.5)
+
         # === VECTORS ===
-        v1 = np.array([1, 1, 0])
-        v2 = np.array([1, -1, 0])
-        v3 = np.array([2, 0.5, 0])
+        # The two eigenvectors (dominant first) and one vector off both spans.
+        v1 = eigen.eigenvector_3d(0)
+        v2 = eigen.eigenvector_3d(1)
+        v3 = eigen.non_eigenvector(preferred=(2, 0.5))
 
         arrow1 = Arrow(ORIGIN, v1, color=YELLOW, buff=0)
         arrow2 = Arrow(ORIGIN, v2, color=GREEN, buff=0)
@@ -50,18 +135,17 @@ class GeometricEigenvectorVisualization(Scene):
         self.wait(1)
 
         # === APPLY TRANSFORMATION ===
-        self.play(
-            ApplyMatrix(matrix, grid),
-            ApplyMatrix(matrix, arrow1),
-            ApplyMatrix(matrix, arrow2),
-            ApplyMatrix(matrix, arrow3),
-        )
+        self.play(*batched_apply_matrix(matrix, grid, *clouds, arrow1, arrow2, arrow3))
         self.wait(1)
 
          # === STATUS INDICATORS ===
-        check = Text("✅ Direction preserved", font_size=20, color=YELLOW).move_to(arrow1.get_end()).shift(LEFT * 1.5 + UP * 0.5)
+        check = Text(direction_text(eigen.eigenvalues[0]), font_size=20, color=YELLOW).move_to(arrow1.get_end()).shift(LEFT * 1.5 + UP * 0.5)
         cross = Text("❌ Direction changed", font_size=20, color=RED).move_to(arrow3.get_end()).shift(RIGHT * 1.2 + DOWN * 0.6)
-        green_check = Text("✅ Direction preserved", font_size=20, color=GREEN).move_to(arrow2.get_start()).shift(DOWN * 1.8 + LEFT * 0.8)
+        green_check = Text(direction_text(eigen.eigenvalues[1]), font_size=20, color=GREEN).move_to(arrow2.get_start()).shift(DOWN * 1.8 + LEFT * 0.8)
 
         self.play(FadeIn(check), FadeIn(cross), FadeIn(green_check))
-        self.wait(4)
\ No newline at end of file
+        self.wait(4)
+
+
+class DenseEigenvectorVisualization(GeometricEigenvectorVisualization):
+    dense_mode = "lattice"
@@ -0,0 +1,56 @@
+from manim import *
+
+# A "label + integer" readout that never builds TeX while it counts.
+# For each digit d the string label + d * num_digits is compiled once when the
+# counter is created. TeX digits all have the same advance width, so the k-th
+# glyph of that string is exactly where digit d sits in slot k of any number.
+# set_value() then only copies the cached outlines of the right digits into
+# the slots, instead of building a new MathTex every frame.
+#
+#     counter = GlyphCounter(r"\text{Applied: }", num_digits=2).next_to(matrix_tex, DOWN)
+#     counter.add_updater(lambda m: m.set_value(int(tracker.get_value())))
+
+
+class GlyphCounter(VGroup):
+    def __init__(self, label, value=0, num_digits=3, **tex_kwargs):
+        super().__init__()
+        self.num_digits = num_digits
+        atlas = [MathTex(label + str(d) * num_digits, **tex_kwargs)[0] for d in range(10)]
+        num_label_glyphs = len(atlas[0]) - num_digits
+
+        # The label is identical in every string, so it is taken from the first one.
+        self.label = VGroup(*atlas[0][:num_label_glyphs])
+        self.slots = VGroup(*(VMobject().match_style(atlas[0][-1]) for _ in range(num_digits)))
+        self.add(self.label, self.slots)
+
+        # Outlines of digit d in slot k, relative to the label's upper left corner.
+        reference = self.label.get_corner(UL)
+        self.glyph_points = [
+            [atlas[d][num_label_glyphs + k].points - reference for d in range(10)]
+            for k in range(num_digits)
+        ]
+        self.reference_width = self.label.width
+        self.value = None
+        self.set_value(value)
+
+    def get_value(self):
+        return self.value
+
+    def set_value(self, value):
+        value = int(value)
+        digits = str(value)
+        if value < 0 or len(digits) > self.num_digits:
+            raise ValueError(f"GlyphCounter with {self.num_digits} digits cannot show {value}")
+        if value == self.value:
+            return self
+        self.value = value
+
+        # Follow the label, so the counter can be moved and scaled like any mobject.
+        origin = self.label.get_corner(UL)
+        scale = self.label.width / self.reference_width
+        for k, slot in enumerate(self.slots):
+            if k < len(digits):
+                slot.set_points(origin + scale * self.glyph_points[k][int(digits[k])])
+            else:
+                slot.clear_points()
+        return self
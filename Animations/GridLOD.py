@@ -0,0 +1,96 @@
+from manim import *
+import numpy as np
+
+# Level of detail for NumberPlane grid lines.
+# Zoomed out, or at -ql, the faint background lines of a 40x40 plane can be
+# closer together than a few pixels or thinner than a fraction of a pixel,
+# and stroking all of them costs far more than they add to the picture.
+#
+# enable_grid_lod(plane) numbers every background line by its distance from
+# the axis it runs along. Each frame the camera measures, per family of
+# parallel lines, their on-screen spacing and how much of a pixel their stroke
+# covers (width in pixels times opacity), and keeps only every step-th line:
+#   - the step doubles until the kept lines are min_spacing pixels apart;
+#   - lines covering less than min_coverage of a pixel are thinned to at
+#     least every coarse_step-th line.
+# The line through the origin is always kept, and axes, ticks and faded lines
+# are never touched. The measurement uses the lines as they are, so LOD
+# follows zooms of the camera frame, scale() and apply_matrix() alike.
+#
+#     plane = enable_grid_lod(cached_plane(...))
+
+# Largest step; beyond this only the line through the origin is left.
+MAX_STEP = 64
+
+
+class GridLOD:
+    def __init__(self, plane, min_spacing=6, min_coverage=0.2, coarse_step=2):
+        self.min_spacing = min_spacing
+        self.min_coverage = min_coverage
+        self.coarse_step = coarse_step
+
+        # Number the lines while the plane is still an axis-aligned grid.
+        steps = {"x": plane.x_range[2], "y": plane.y_range[2]}
+        indexed = {"x": {}, "y": {}}
+        for line in plane.background_lines:
+            start, end = line.get_start(), line.get_end()
+            # Lines parallel to the x axis are numbered by their y coordinate, and vice versa.
+            family = "x" if abs(end[0] - start[0]) > abs(end[1] - start[1]) else "y"
+            coordinate = plane.point_to_coords(line.get_center())[1 if family == "x" else 0]
+            index = int(round(coordinate / steps["y" if family == "x" else "x"]))
+            indexed[family][index] = line
+            line.grid_lod_index = (self, family, index)
+
+        # Two lines per family to measure the spacing from.
+        self.reference_lines = {}
+        for family, lines in indexed.items():
+            if len(lines) >= 2:
+                first, second = sorted(lines, key=abs)[:2]
+                self.reference_lines[family] = (lines[first], lines[second], abs(second - first))
+
+    def get_steps(self, pixels_per_unit, line_width_multiple=0.01):
+        steps = {}
+        for family, (line, other, index_distance) in self.reference_lines.items():
+            start = line.points[0]
+            direction = line.points[-1][:2] - start[:2]
+            length = np.linalg.norm(direction)
+            offset = other.points[0][:2] - start[:2]
+            if length == 0:
+                # A singular matrix collapsed the lines onto each other.
+                steps[family] = MAX_STEP
+                continue
+            spacing = abs(direction[0] * offset[1] - direction[1] * offset[0]) / length / index_distance * pixels_per_unit
+            width = line.get_stroke_width() * line_width_multiple * pixels_per_unit
+            coverage = min(width, 1) * line.get_stroke_opacity()
+
+            step = 1
+            while step < MAX_STEP and spacing * step < self.min_spacing:
+                step *= 2
+            if coverage < self.min_coverage:
+                step = max(step, self.coarse_step)
+            steps[family] = step
+        return steps
+
+
+def enable_grid_lod(plane, **settings):
+    # Call before the plane is transformed; returns the plane.
+    plane.grid_lod = GridLOD(plane, **settings)
+    return plane
+
+
+class GridLODCameraMixin:
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = super().get_mobjects_to_display(*args, **kwargs)
+        pixels_per_unit = self.pixel_width / self.frame_width
+        steps = {}
+        visible = []
+        for mobject in mobjects:
+            lod_index = getattr(mobject, "grid_lod_index", None)
+            if lod_index is not None:
+                grid, family, index = lod_index
+                if id(grid) not in steps:
+                    steps[id(grid)] = grid.get_steps(pixels_per_unit, self.cairo_line_width_multiple)
+                if index % steps[id(grid)].get(family, 1):
+                    continue
+            visible.append(mobject)
+        return visible
@@ -0,0 +1,54 @@
+from manim import *
+from dataclasses import replace
+from fractions import Fraction
+
+import av
+from manim.scene.video_segment_encoder import VideoSegmentEncoder
+
+# Static holds are encoded as two frames instead of fps x seconds.
+# manim already rasterizes a static wait() only once, but then hands the same
+# frame to the encoder `repeat` times, and every copy is colour-converted and
+# run through the codec. HoldSegmentEncoder writes the held frame once at the
+# start of the hold and once more at its last timestamp, leaving a gap in the
+# presentation timestamps. The second copy pins the segment's duration, so
+# players, manim's concat step and ffmpeg all see the full-length hold.
+#
+# B-frames have to be off for this: the encoder then emits decode timestamps
+# in frame order and the mp4 sample table loses the gap. A wait() is always a
+# segment of its own whose first write is the whole hold, so only those
+# segments are reopened without B-frames; animations keep the usual settings.
+#
+# GIF output renumbers frames when it is assembled, which would collapse the
+# gap, so GIFs keep the regular encoder.
+
+
+class HoldSegmentEncoder(VideoSegmentEncoder):
+    def write_frame(self, pixels, *, repeat=1):
+        if repeat <= 2 or self._next_pts != 0:
+            return super().write_frame(pixels, repeat=repeat)
+
+        self._validate_frame(pixels, repeat)
+        # Nothing has been written yet, so the segment can be reopened as a hold.
+        self._container.close()
+        super().__init__(target=self.target, spec=replace(self.spec, options=self.spec.options + (("bf", "0"),)))
+
+        time_base = Fraction(self.spec.frame_rate.denominator, self.spec.frame_rate.numerator)
+        try:
+            for pts in (self._next_pts, self._next_pts + repeat - 1):
+                frame = av.VideoFrame.from_ndarray(pixels, format="rgba")
+                frame.pts = pts
+                frame.time_base = time_base
+                for packet in self._stream.encode(frame):
+                    self._container.mux(packet)
+        except BaseException as error:
+            raise self._operation_error("encode", error) from error
+        self._next_pts += repeat
+
+
+class HoldFileWriter(SceneFileWriter):
+    def _create_segment_encoder(self, target):
+        if self.output_spec.is_gif:
+            return super()._create_segment_encoder(target)
+        if self.video_encoder is None:
+            raise RuntimeError("Video segment encoding requires resolved settings.")
+        return HoldSegmentEncoder(target=target, spec=self.video_encoder)
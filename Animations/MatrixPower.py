@@ -0,0 +1,46 @@
+import numpy as np
+
+
+class MatrixPowerEngine:
+    # Closed-form powers of a diagonalizable matrix.
+    # A is diagonalized once as A = V diag(lambda) V^-1, so A^k = V diag(lambda^k) V^-1
+    # for any k, including fractional k for continuous "power flow" animations.
+    # Positions are always computed from the original vectors, never read back
+    # from mobjects, so repeated application does not accumulate drift.
+    def __init__(self, matrix, tolerance=1e-9):
+        self.matrix = np.asarray(matrix, dtype=float)
+        self.dim = self.matrix.shape[0]
+        self.tolerance = tolerance
+
+        eigenvalues, eigenvectors = np.linalg.eig(self.matrix)
+        if np.linalg.cond(eigenvectors) > 1 / tolerance:
+            raise ValueError(f"Matrix {self.matrix.tolist()} is not diagonalizable")
+        self.eigenvalues = eigenvalues.astype(complex)
+        self.eigenvectors = eigenvectors.astype(complex)
+        self.inverse_eigenvectors = np.linalg.inv(self.eigenvectors)
+
+    def _real(self, values):
+        if np.max(np.abs(values.imag), initial=0) > self.tolerance * max(1, np.max(np.abs(values.real), initial=0)):
+            raise ValueError("Fractional power of a matrix with negative or complex eigenvalues is not real")
+        return values.real
+
+    def eigenvalue_powers(self, k):
+        # lambda^k for a scalar k (shape (dim,)) or an array of ks (shape (len(k), dim)).
+        k = np.asarray(k, dtype=float)
+        return self.eigenvalues ** k[..., None]
+
+    def power(self, k):
+        return self._real((self.eigenvectors * self.eigenvalue_powers(k)[..., None, :]) @ self.inverse_eigenvectors)
+
+    def apply(self, points, k):
+        # Apply A^k to every point in one batched operation.
+        # points has shape (n, dim) or manim's (n, 3); extra coordinates are kept.
+        # A scalar k returns the same shape as points, an array of ks stacks one result per k.
+        points = np.asarray(points, dtype=float)
+        coefficients = points[:, :self.dim] @ self.inverse_eigenvectors.T
+        powers = self.eigenvalue_powers(k)
+        transformed = self._real(np.einsum("ij,...j,nj->...ni", self.eigenvectors, powers, coefficients))
+
+        result = np.broadcast_to(points, transformed.shape[:-2] + points.shape).copy()
+        result[..., :self.dim] = transformed
+        return result
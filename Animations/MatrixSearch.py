@@ -0,0 +1,216 @@
+import argparse
+import json
+import time
+from pathlib import Path
+import numpy as np
+
+from EigenSystem import EigenSystem
+
+# Search for 2x2 example matrices that present well.
+# Every integer matrix [[a, b], [c, d]] with entries in a range is enumerated
+# at once (the default -20..20 is 2.8 million matrices) and its eigen data is
+# computed in closed form over the whole batch, with no np.linalg.eig:
+#
+#     trace t = a + d, det = ad - bc, discriminant = t^2 - 4 det = (a - d)^2 + 4bc
+#     eigenvalues (t +- sqrt(discriminant)) / 2
+#     eigenvector (b, lambda - a), or (lambda - d, c) when b = 0
+#
+# For an integer matrix the eigenvalues are rational exactly when the
+# discriminant is a perfect square, and then they are integers; that is also
+# when the characteristic polynomial factors over the rationals, so the
+# factored form DetailedEigenvalueExample and Derivation.py write out exists.
+# A matrix is kept when
+#   - its eigenvalues are distinct nonzero integers with different magnitudes,
+#     so one eigenvector dominates, and at most MAX_EIGENVALUE in magnitude;
+#   - both eigenvectors reduce to integer directions with entries at most
+#     MAX_VECTOR_ENTRY, e.g. (2, 1);
+#   - both spans leave the +-20 grid at integer points, as (2, 1) does at
+#     (20, 10) (EigenSystem.span_endpoints);
+#   - it is not diagonal, whose eigenvectors are just the axes, nor singular,
+#     which collapses the plane onto a line;
+#   - with --iterations k, the dominant eigenvalue grows the circle of vectors
+#     RepeatedTransformation starts from, and A^1 .. A^k keep it on screen.
+# Matrices are ranked simplest first: smallest entries, eigenvalues and
+# eigenvector entries, then those whose repeated images fill more of the screen.
+#
+#     python MatrixSearch.py --top 20
+#     python MatrixSearch.py --entries 0 6 --iterations 2 -o matrices.json
+#     python BatchRender.py --matrices matrices.json
+#
+# -o writes the matrices in the form BatchRender.py and the scenes' `matrix`
+# attribute take.
+MAX_EIGENVALUE = 5
+MAX_VECTOR_ENTRY = 3
+# The grid the scenes draw spans, [-SPAN_EXTENT, SPAN_EXTENT]^2.
+SPAN_EXTENT = 20
+# RepeatedTransformation: 12 vectors on a circle of this radius, transformed
+# repeatedly on manim's default frame.
+CIRCLE_RADIUS = 0.5
+FRAME_WIDTH = 8 * 16 / 9
+FRAME_HEIGHT = 8.0
+# How far steps_on_screen counts.
+MAX_ITERATIONS = 10
+
+
+def enumerate_matrices(low, high):
+    # Entries a, b, c, d of every integer matrix with entries in [low, high], one array each.
+    values = np.arange(low, high + 1, dtype=np.int64)
+    return [entry.ravel() for entry in np.meshgrid(values, values, values, values, indexing="ij")]
+
+
+def integer_sqrt(values):
+    # sqrt of each value that is a perfect square, -1 for the rest.
+    roots = np.rint(np.sqrt(np.maximum(values, 0))).astype(np.int64)
+    return np.where((values >= 0) & (roots * roots == values), roots, -1)
+
+
+def eigenvectors(a, b, c, d, eigenvalue):
+    # Integer direction of each matrix's eigenvector for `eigenvalue`, reduced,
+    # with the first nonzero entry positive. The eigenvalues must be distinct.
+    x = np.where(b != 0, b, np.where(c != 0, eigenvalue - d, (eigenvalue == a).astype(np.int64)))
+    y = np.where(b != 0, eigenvalue - a, np.where(c != 0, c, (eigenvalue == d).astype(np.int64)))
+    divisor = np.gcd(x, y)
+    sign = np.where(x != 0, np.sign(x), np.sign(y))
+    return x // divisor * sign, y // divisor * sign
+
+
+def nice_spans(x, y, extent=SPAN_EXTENT):
+    # True where the span of (x, y) leaves the grid at integer points.
+    largest = np.maximum(np.abs(x), np.abs(y))
+    return (extent * x % largest == 0) & (extent * y % largest == 0)
+
+
+def steps_on_screen(a, b, c, d, radius=CIRCLE_RADIUS, limit=MAX_ITERATIONS):
+    # How many applications keep the circle of vectors on screen, up to limit.
+    # The image of a circle under M is an ellipse whose half-width is radius
+    # times the norm of M's first row, and whose half-height that of the second.
+    # Also returns the share of the frame the last on-screen image fills.
+    power = np.broadcast_to(np.identity(2), (len(a), 2, 2)).copy()
+    matrix = np.stack([np.stack([a, b], axis=-1), np.stack([c, d], axis=-1)], axis=1).astype(float)
+    steps = np.zeros(len(a), dtype=np.int64)
+    fill = np.zeros(len(a))
+    on_screen = np.ones(len(a), dtype=bool)
+    for _ in range(limit):
+        power = matrix @ power
+        half_width, half_height = radius * np.linalg.norm(power, axis=2).T
+        on_screen &= (half_width <= FRAME_WIDTH / 2) & (half_height <= FRAME_HEIGHT / 2)
+        steps += on_screen
+        fill = np.where(on_screen, np.maximum(half_width / (FRAME_WIDTH / 2), half_height / (FRAME_HEIGHT / 2)), fill)
+    return steps, fill
+
+
+def search(
+    entries=(-20, 20),
+    max_eigenvalue=MAX_EIGENVALUE,
+    max_vector_entry=MAX_VECTOR_ENTRY,
+    iterations=None,
+    nonnegative=False,
+    diagonal=False,
+    singular=False,
+    top=None,
+):
+    # Ranked candidates, best first, as dicts; each "matrix" can be a scene's `matrix`.
+    a, b, c, d = enumerate_matrices(*entries)
+    count = len(a)
+
+    trace = a + d
+    discriminant = (a - d) ** 2 + 4 * b * c
+    root = integer_sqrt(discriminant)
+    # Distinct integer eigenvalues; (trace +- root) is always even.
+    keep = root > 0
+    if not diagonal:
+        keep &= (b != 0) | (c != 0)
+    a, b, c, d, trace, discriminant, root = (array[keep] for array in (a, b, c, d, trace, discriminant, root))
+
+    # Dominant first, as EigenSystem orders them.
+    larger, smaller = (trace + root) // 2, (trace - root) // 2
+    first = np.where(np.abs(larger) >= np.abs(smaller), larger, smaller)
+    second = trace - first
+    keep = (np.abs(first) != np.abs(second)) & (np.abs(first) <= max_eigenvalue)
+    if nonnegative:
+        keep &= second >= 0
+    if not singular:
+        keep &= second != 0
+    a, b, c, d, discriminant, first, second = (array[keep] for array in (a, b, c, d, discriminant, first, second))
+
+    x1, y1 = eigenvectors(a, b, c, d, first)
+    x2, y2 = eigenvectors(a, b, c, d, second)
+    keep = (np.maximum.reduce([np.abs(x1), np.abs(y1), np.abs(x2), np.abs(y2)]) <= max_vector_entry)
+    keep &= nice_spans(x1, y1) & nice_spans(x2, y2)
+    a, b, c, d, discriminant, first, second, x1, y1, x2, y2 = (
+        array[keep] for array in (a, b, c, d, discriminant, first, second, x1, y1, x2, y2)
+    )
+
+    steps, fill = steps_on_screen(a, b, c, d, limit=max(MAX_ITERATIONS, iterations or 0))
+    if iterations is not None:
+        keep = (np.abs(first) > 1) & (steps >= iterations)
+        a, b, c, d, discriminant, first, second, x1, y1, x2, y2, steps, fill = (
+            array[keep] for array in (a, b, c, d, discriminant, first, second, x1, y1, x2, y2, steps, fill)
+        )
+
+    cost = (
+        np.abs(a) + np.abs(b) + np.abs(c) + np.abs(d)
+        + np.abs(first) + np.abs(second)
+        + np.abs(x1) + np.abs(y1) + np.abs(x2) + np.abs(y2)
+        # A negative entry or eigenvalue costs a sign in every step written out.
+        + (a < 0) + (b < 0) + (c < 0) + (d < 0) + (first < 0) + (second < 0)
+    )
+    order = np.lexsort((-fill, cost))[:top]
+
+    candidates = []
+    for i in order:
+        candidates.append({
+            "matrix": [[int(a[i]), int(b[i])], [int(c[i]), int(d[i])]],
+            "eigenvalues": [int(first[i]), int(second[i])],
+            "eigenvectors": [[int(x1[i]), int(y1[i])], [int(x2[i]), int(y2[i])]],
+            "discriminant": int(discriminant[i]),
+            "span_ends": [
+                [int(SPAN_EXTENT * x // max(abs(x), abs(y))), int(SPAN_EXTENT * y // max(abs(x), abs(y)))]
+                for x, y in ((x1[i], y1[i]), (x2[i], y2[i]))
+            ],
+            "steps_on_screen": int(steps[i]),
+            "cost": int(cost[i]),
+        })
+    return candidates, count
+
+
+def check_candidate(candidate):
+    # Raises AssertionError unless EigenSystem, which the scenes use, agrees with the search.
+    eigen = EigenSystem(candidate["matrix"])
+    assert eigen.eigenvalues == candidate["eigenvalues"], (eigen.eigenvalues, candidate)
+    assert [vector.tolist() for vector in eigen.eigenvectors] == candidate["eigenvectors"], (eigen.eigenvectors, candidate)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find small integer 2x2 matrices with presentable eigen data.")
+    parser.add_argument("--entries", nargs=2, type=int, default=[-20, 20], metavar=("LOW", "HIGH"), help="Range of the matrix entries.")
+    parser.add_argument("--max-eigenvalue", type=int, default=MAX_EIGENVALUE)
+    parser.add_argument("--max-vector-entry", type=int, default=MAX_VECTOR_ENTRY)
+    parser.add_argument("--iterations", type=int, default=None, help="Growth that stays on screen for this many applications.")
+    parser.add_argument("--nonnegative", action="store_true", help="Non-negative eigenvalues only, as PowerFlow needs.")
+    parser.add_argument("--diagonal", action="store_true", help="Keep diagonal matrices.")
+    parser.add_argument("--singular", action="store_true", help="Keep matrices with a zero eigenvalue.")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--check", action="store_true", help="Cross-check the listed candidates against EigenSystem.")
+    parser.add_argument("-o", "--output", default=None, help="JSON file for BatchRender.py --matrices.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    candidates, count = search(
+        args.entries, args.max_eigenvalue, args.max_vector_entry, args.iterations, args.nonnegative, args.diagonal, args.singular, args.top
+    )
+    elapsed = time.perf_counter() - start
+    if args.check:
+        for candidate in candidates:
+            check_candidate(candidate)
+
+    print(f"{'matrix':<22}{'eigenvalues':<14}{'eigenvectors':<20}{'span ends':<22}{'steps':>6}{'cost':>6}")
+    for candidate in candidates:
+        print(
+            f"{str(candidate['matrix']):<22}{str(candidate['eigenvalues']):<14}{str(candidate['eigenvectors']):<20}"
+            f"{str(candidate['span_ends']):<22}{candidate['steps_on_screen']:>6}{candidate['cost']:>6}"
+        )
+    print(f"Searched {count} matrices, listed {len(candidates)} in {elapsed:.2f}s")
+    if args.output:
+        Path(args.output).write_text(json.dumps([candidate["matrix"] for candidate in candidates]))
+        print(f"Matrices written to {args.output}")
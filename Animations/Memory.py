@@ -0,0 +1,247 @@
+from manim import *
+import gc
+import json
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Prompt release of removed mobjects, and memory accounting per section.
+# A removed mobject is not freed as soon as the scene lets go of it:
+#   - the last play's animations stay on the scene until the next play, and
+#     with them the copies a Transform makes of its mobject and a batched
+#     transform's start, target and delta buffers (BatchedTransform.py);
+#   - the static layer (StaticLayer.py) keeps its mobjects, and the camera
+#     keeps the layer's frame, until the next play begins;
+#   - points a batched transform leaves behind are views into one buffer
+#     shared by everything it moved, which stays alive in full while any one
+#     of those mobjects does;
+#   - grid LOD links each line and its plane in a reference cycle, so a 40x40
+#     plane is only freed when Python's cyclic collector next gets to it.
+# MemoryMixin drops the animations as soon as their play ends. When a remove()
+# or clear() takes away a grid-LOD plane or points viewing a shared buffer, it
+# copies shared points out and runs the collector before the next play or
+# section, so those are freed there and then rather than whenever the
+# collector runs. Other removals, such as the FadeOut at the end of every
+# slide, are left to reference counting and cost nothing extra. A mobject
+# construct() still holds in a local variable stays alive regardless; the
+# report below shows those as live mobjects that are not in the scene.
+#
+# With MEMORY_REPORT = True or EIGEN_MEMORY=1, every section also gets a row
+# with its plays, the mobjects in the scene, all live mobjects and the bytes
+# of their points (shared buffers counted once), the mobjects the collector
+# released during it, the time spent releasing, and the resident set size at
+# its end and at its peak (the report collects at every section end):
+#
+#     EIGEN_MEMORY=1 manim -ql DetailsAndIntuitionVisualization.py FinalVisualization
+#
+# The table is logged and written, with a JSON copy, to media/memory
+# (EIGEN_MEMORY_DIR). On Linux the peak is reset at the start of each section,
+# so it is the section's own; elsewhere it is the peak of the process so far.
+# The last section's peak includes combining the movie.
+MEMORY_DIR = Path(os.environ.get("EIGEN_MEMORY_DIR", Path(__file__).resolve().parent / "media" / "memory"))
+
+
+def memory_report_enabled(scene):
+    return getattr(scene, "MEMORY_REPORT", False) or os.environ.get("EIGEN_MEMORY", "0") not in ("", "0")
+
+
+def current_rss():
+    # Resident set size in bytes, or None where /proc is not available.
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def peak_rss():
+    # Peak resident set size in bytes since the last reset_peak_rss(), or since the process started.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def reset_peak_rss():
+    # Linux resets VmHWM to the current RSS when 5 is written to clear_refs.
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def live_mobjects():
+    return [obj for obj in gc.get_objects() if isinstance(obj, Mobject)]
+
+
+def point_bytes(mobjects):
+    # Bytes of the arrays holding the mobjects' points; a buffer several of them view is counted once.
+    buffers = {}
+    for mobject in mobjects:
+        array = getattr(mobject, "points", None)
+        if not isinstance(array, np.ndarray):
+            continue
+        while isinstance(array.base, np.ndarray):
+            array = array.base
+        buffers[id(array)] = array.nbytes
+    return sum(buffers.values())
+
+
+def needs_release(mobjects):
+    # True when the families hold what only the collector frees promptly: a
+    # grid-LOD plane or line, or points viewing part of a larger shared buffer.
+    for mobject in extract_mobject_family_members(mobjects):
+        if hasattr(mobject, "grid_lod") or hasattr(mobject, "grid_lod_index"):
+            return True
+        points = getattr(mobject, "points", None)
+        if isinstance(points, np.ndarray) and isinstance(points.base, np.ndarray) and points.base.size > points.size:
+            return True
+    return False
+
+
+def detach_points(mobjects):
+    # Gives every mobject whose points view a shared buffer a copy of its own.
+    for mobject in mobjects:
+        if isinstance(getattr(mobject, "points", None), np.ndarray) and mobject.points.base is not None:
+            mobject.points = mobject.points.copy()
+
+
+def format_bytes(count):
+    return "-" if count is None else f"{count / 2**20:.1f}M"
+
+
+class MemoryReport:
+    def __init__(self, name):
+        self.name = name
+        self.sections = []
+        self.section = None
+        self.per_section_peak = False
+        self.start_section("(start)")
+
+    def start_section(self, name):
+        self.per_section_peak = reset_peak_rss()
+        self.section = {"name": name, "plays": 0, "released": 0, "releases": 0, "release_seconds": 0.0}
+
+    def end_section(self, scene):
+        live = live_mobjects()
+        self.section.update({
+            "scene_mobjects": len(scene.get_mobject_family_members()),
+            "live_mobjects": len(live),
+            "point_bytes": point_bytes(live),
+            "rss": current_rss(),
+            "peak_rss": peak_rss(),
+            "peak_scope": "section" if self.per_section_peak else "process",
+        })
+        self.sections.append(self.section)
+        self.section = None
+
+    def write(self, directory=MEMORY_DIR):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        json_path = directory / f"{self.name}.json"
+        json_path.write_text(json.dumps({"scene": self.name, "sections": self.sections}, indent=1))
+        table = self.summary_table()
+        (directory / f"{self.name}.txt").write_text(table + "\n")
+        return json_path, table
+
+    def summary_table(self):
+        lines = [
+            f"{self.name}: peak RSS {format_bytes(max((section['peak_rss'] or 0 for section in self.sections), default=None))}",
+            f"{'section':<20}{'plays':>6}{'scene':>8}{'live':>8}{'points':>9}{'released':>9}{'release':>9}{'rss':>9}{'peak':>9}",
+        ]
+        for section in self.sections:
+            peak = format_bytes(section["peak_rss"]) + ("" if section["peak_scope"] == "section" else "*")
+            lines.append(
+                f"{section['name'][:19]:<20}{section['plays']:>6}{section['scene_mobjects']:>8}{section['live_mobjects']:>8}"
+                f"{format_bytes(section['point_bytes']):>9}{section['released']:>9}{section['release_seconds']:>8.3f}s"
+                f"{format_bytes(section['rss']):>9}{peak:>9}"
+            )
+        releases = sum(section["releases"] for section in self.sections)
+        seconds = sum(section["release_seconds"] for section in self.sections)
+        lines.append(f"{releases} releases took {seconds:.3f}s")
+        if any(section["peak_scope"] != "section" for section in self.sections):
+            lines.append("* peak of the process so far")
+        return "\n".join(lines)
+
+
+class MemoryMixin:
+    # Mix into a scene ahead of Scene, and ahead of ProfilingMixin, which
+    # reads a play's animations after the play: class MyScene(MemoryMixin, Scene).
+    MEMORY_REPORT = False
+    memory_report = None
+    _release_pending = False
+
+    def render(self, *args, **kwargs):
+        if not memory_report_enabled(self):
+            return super().render(*args, **kwargs)
+        report = self.memory_report = MemoryReport(type(self).__name__)
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            self.release_memory()
+            report.end_section(self)
+            json_path, table = report.write()
+            logger.info(f"Memory of {report.name}:\n{table}\nWritten to {json_path}")
+
+    def play(self, *args, **kwargs):
+        if self._release_pending:
+            self.release_memory()
+        try:
+            return super().play(*args, **kwargs)
+        finally:
+            # The animations hold copies of their mobjects; nothing needs them once the play is over.
+            self.animations = None
+            self.moving_mobjects = []
+            self.static_mobjects = []
+            if self.memory_report is not None:
+                self.memory_report.section["plays"] += 1
+
+    def remove(self, *mobjects):
+        # manim calls this after every FadeOut and ReplacementTransform; most of those need no collection.
+        super().remove(*mobjects)
+        self._release_pending = self._release_pending or needs_release(mobjects)
+        return self
+
+    def clear(self):
+        pending = needs_release(self.mobjects + self.foreground_mobjects)
+        super().clear()
+        self._release_pending = self._release_pending or pending
+        return self
+
+    def next_section(self, name="unnamed", *args, **kwargs):
+        report = self.memory_report
+        if self._release_pending or report is not None:
+            self.release_memory()
+        if report is not None:
+            report.end_section(self)
+            report.start_section(name)
+        return super().next_section(name, *args, **kwargs)
+
+    def release_memory(self):
+        # Frees whatever the scene no longer references; returns the number of mobjects freed when reporting.
+        self._release_pending = False
+        report = self.memory_report
+        if report is None:
+            detach_points(self.get_mobject_family_members())
+            gc.collect()
+            return None
+        before = len(live_mobjects())
+        start = time.perf_counter()
+        detach_points(self.get_mobject_family_members())
+        gc.collect()
+        report.section["release_seconds"] += time.perf_counter() - start
+        report.section["releases"] += 1
+        released = max(before - len(live_mobjects()), 0)
+        report.section["released"] += released
+        return released
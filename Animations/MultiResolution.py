@@ -0,0 +1,172 @@
+from manim import *
+import argparse
+import math
+import time
+from pathlib import Path
+
+from manim import constants
+
+from SceneRunner import QUALITIES, load_scene_class, render_config, with_renderer
+
+# Render one scene at several qualities in a single run.
+# Rendering -ql, -qh and -qk separately runs construct(), TeX layout and every
+# interpolation three times. Here the scene runs once, at the quality with the
+# highest frame rate, and every frame state it reaches is also rasterized by a
+# camera per extra quality and written by that quality's own file writer, whose
+# encoder threads run alongside the others.
+#
+#     python MultiResolution.py DetailsAndIntuitionVisualization.py FinalVisualization -q l h k
+#
+# Outputs with a lower frame rate take every n-th frame of each play (15 fps
+# takes every 4th of 60), so their frame rate has to divide the highest one.
+# Each output lands where manim would put it for that quality
+# (media/videos/<module>/480p15/...), with its own partial movie cache. The
+# scene has to build its renderer from renderer_class, as EigenScene does.
+
+# File writer calls every output has to see; everything else goes to the primary writer.
+FANNED_OUT = (
+    "add_partial_movie_file",
+    "begin_animation",
+    "end_animation",
+    "next_section",
+    "add_sound",
+    "finish",
+    "abort_encode_jobs",
+)
+
+
+def quality_settings(letter):
+    return constants.QUALITIES[QUALITIES[letter]]
+
+
+class FanOutFileWriter:
+    def __init__(self, primary, others):
+        self.primary = primary
+        self.others = others
+        for writer in others:
+            # The scene appends subcaptions to the primary's list.
+            writer.subcaptions = primary.subcaptions
+
+    def __getattr__(self, name):
+        attribute = getattr(self.primary, name)
+        if name not in FANNED_OUT:
+            return attribute
+
+        def fanned_out(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            for writer in self.others:
+                getattr(writer, name)(*args, **kwargs)
+            return result
+
+        return fanned_out
+
+    def is_already_cached(self, hash_invocation):
+        # A play is only skipped when every output has it.
+        return all(writer.is_already_cached(hash_invocation) for writer in (self.primary, *self.others))
+
+
+class ResolutionOutput:
+    def __init__(self, renderer, stride):
+        self.renderer = renderer
+        self.stride = stride
+        # Frames of the current play seen so far, at the primary frame rate.
+        self.position = 0
+
+
+class MultiResolutionRenderer(CairoRenderer):
+    outputs = ()
+
+    def init_scene(self, scene, session_spec, file_writer_settings):
+        super().init_scene(scene, session_spec, file_writer_settings)
+        self.outputs = []
+        self.last_update = None
+        for letter in scene.extra_qualities:
+            with tempconfig(render_config(letter)):
+                renderer = CairoRenderer(file_writer_class=self._file_writer_class, camera_class=type(self.camera))
+                # The scene's __init__ resolves this quality's output paths and
+                # encoder settings and hands them to the renderer.
+                type(scene)(renderer=renderer)
+            if hasattr(self.camera, "frame"):
+                # A moving camera's frame is shared, so every output follows it.
+                renderer.camera.frame = self.camera.frame
+            stride = round(self.camera.frame_rate / renderer.camera.frame_rate)
+            self.outputs.append(ResolutionOutput(renderer, stride))
+        self.file_writer = FanOutFileWriter(self.file_writer, [output.renderer.file_writer for output in self.outputs])
+
+    @property
+    def cameras(self):
+        return [self.camera, *(output.renderer.camera for output in self.outputs)]
+
+    def play(self, scene, *args, **kwargs):
+        for output in self.outputs:
+            output.position = 0
+        super().play(scene, *args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        for output in self.outputs:
+            if self.skip_animations:
+                output.renderer.static_image = None
+            else:
+                output.renderer.save_static_frame_data(scene, static_mobjects)
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        # Remembered so that add_frame can draw the same frame for the other outputs.
+        self.last_update = (scene, mobjects, include_submobjects, kwargs)
+        super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+
+    def add_frame(self, frame, num_frames=1):
+        super().add_frame(frame, num_frames)
+        if self.skip_animations or not self.outputs:
+            return
+        scene, mobjects, include_submobjects, kwargs = self.last_update
+        for output in self.outputs:
+            # Only the frames that fall on the output's own frame times are drawn.
+            start = output.position
+            output.position += num_frames
+            count = math.ceil(output.position / output.stride) - math.ceil(start / output.stride)
+            if count:
+                output.renderer.update_frame(scene, mobjects, include_submobjects, **kwargs)
+                output.renderer.file_writer.write_frame(output.renderer.get_frame(), repeat=count)
+
+
+def multi_resolution_scene(scene_class, qualities):
+    # Returns a subclass that renders at all the qualities, and the quality to render it with.
+    qualities = sorted(
+        set(qualities),
+        key=lambda letter: (quality_settings(letter)["frame_rate"], quality_settings(letter)["pixel_height"]),
+        reverse=True,
+    )
+    primary_rate = quality_settings(qualities[0])["frame_rate"]
+    for letter in qualities[1:]:
+        if primary_rate % quality_settings(letter)["frame_rate"]:
+            raise ValueError(f"-q{letter} runs at {quality_settings(letter)['frame_rate']} fps, which does not divide {primary_rate} fps")
+    return with_renderer(scene_class, MultiResolutionRenderer, extra_qualities=qualities[1:]), qualities[0]
+
+
+def render_multi_resolution(path, scene_name, qualities, **options):
+    # Render one scene at several qualities; returns {quality: movie path}.
+    scene_class, primary = multi_resolution_scene(load_scene_class(path, scene_name), qualities)
+    with tempconfig(render_config(primary, **options)):
+        scene = scene_class()
+        scene.render()
+        file_writer = scene.renderer.file_writer
+        writers = [file_writer.primary, *file_writer.others]
+        return {
+            letter: Path(writer.movie_file_path)
+            for letter, writer in zip([primary, *scene_class.extra_qualities], writers)
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a scene at several qualities in one run.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", nargs="+", choices=sorted(QUALITIES), default=["l", "h", "k"])
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    movies = render_multi_resolution(args.file, args.scene, args.quality)
+    print(f"{args.scene} at {len(movies)} qualities in {time.perf_counter() - start:.2f}s")
+    for letter, movie in movies.items():
+        print(f"  -q{letter}: {movie}")
@@ -0,0 +1,175 @@
+from manim import *
+import argparse
+import os
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from SceneRunner import QUALITIES, load_scene_class, render_config, with_renderer
+
+# Pipelined frame path: interpolate, rasterize and encode on separate cores.
+# manim draws every frame of a play in turn: update_to_time(), then the camera
+# rasterizes the frame, then it is handed to the encoder, and only then does
+# the next frame start. Here the main thread only interpolates. After each
+# update it takes a snapshot of what the frame draws (points and colours
+# copied into detached mobjects) and hands it to a pool of raster threads,
+# each with a camera of its own. Finished frames are collected in order and
+# passed to the file writer, whose encoder thread works alongside.
+#
+#     python PipelinedRenderer.py DetailsAndIntuitionVisualization.py FinalVisualization -q h -j 4
+#
+# Cairo releases the GIL while it fills and strokes, which is where a frame
+# of a 40x40 grid spends its time, so threads overlap without copying the
+# scene into other processes. At most `depth` frames per thread are in flight,
+# which bounds the memory held by pending frames. The pipeline is drained
+# before a play ends, so the scene code between plays sees the usual state.
+#
+# Only mobjects an animation or updater touches are copied; the rest cannot
+# change during the play and are drawn as they are, which also keeps them
+# recognisable to the static layer (StaticLayer.py). The scene has to build
+# its renderer from renderer_class, as EigenScene does.
+PIPELINE_DEPTH = 2
+
+# Arrays that change as a mobject is animated; an image's pixels are shared.
+SNAPSHOT_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas", "sheen_direction")
+
+
+def snapshot(mobject):
+    # A detached copy of the mobject as it is now, without its submobjects.
+    copy = object.__new__(type(mobject))
+    state = dict(mobject.__dict__)
+    for name in SNAPSHOT_ARRAYS:
+        value = state.get(name)
+        if isinstance(value, np.ndarray):
+            state[name] = value.copy()
+    state["submobjects"] = []
+    # The main camera has already applied grid LOD, which reads the live plane.
+    state.pop("grid_lod_index", None)
+    copy.__dict__ = state
+    return copy
+
+
+class PipelinedRenderer(CairoRenderer):
+    raster_cameras = ()
+
+    def init_scene(self, scene, session_spec, file_writer_settings):
+        super().init_scene(scene, session_spec, file_writer_settings)
+        self.threads = getattr(scene, "render_threads", None) or min(os.cpu_count() or 1, 8)
+        self.depth = getattr(scene, "pipeline_depth", PIPELINE_DEPTH)
+        self.raster_cameras = [type(self.camera)() for _ in range(self.threads)]
+        self.idle_cameras = queue.SimpleQueue()
+        for camera in self.raster_cameras:
+            self.idle_cameras.put(camera)
+        self.pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="raster")
+        self.pending = deque()
+        self.changing = set()
+
+        end_animation = self.file_writer.end_animation
+
+        def drained_end_animation(*args, **kwargs):
+            self.drain()
+            return end_animation(*args, **kwargs)
+
+        self.file_writer.end_animation = drained_end_animation
+
+    @property
+    def cameras(self):
+        return [self.camera, *self.raster_cameras]
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # Called once per play, after the animations have begun.
+        for camera in self.raster_cameras:
+            camera.background = self.camera.background
+        animated = [animation.mobject for animation in scene.animations or ()]
+        updated = [mobject for mobject in scene.get_mobject_family_members() if mobject.updaters]
+        self.changing = {
+            id(mobject)
+            for mobject in extract_mobject_family_members([*animated, *updated, *scene.foreground_mobjects])
+        }
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects=None):
+        if self.skip_animations:
+            return super().render(scene, time, moving_mobjects)
+        if not moving_mobjects:
+            moving_mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        # Culling and grid LOD look at the live scene, so they run here.
+        mobjects = [
+            snapshot(mobject) if id(mobject) in self.changing else mobject
+            for mobject in self.camera.get_mobjects_to_display(moving_mobjects)
+        ]
+        frame = snapshot(self.camera.frame) if hasattr(self.camera, "frame") else None
+        if len(self.pending) >= self.threads * self.depth:
+            self.write_oldest()
+        self.pending.append(self.pool.submit(self.rasterize, mobjects, frame, self.static_image))
+        self.time += 1 / self.camera.frame_rate
+
+    def rasterize(self, mobjects, frame, static_image):
+        # Runs on a raster thread.
+        camera = self.idle_cameras.get()
+        try:
+            if frame is not None:
+                camera.frame = frame
+            if static_image is not None:
+                camera.set_frame_to_background(static_image)
+            else:
+                camera.reset()
+            camera.capture_mobjects(mobjects, include_submobjects=False)
+            return camera.pixel_array.copy()
+        finally:
+            self.idle_cameras.put(camera)
+
+    def write_oldest(self):
+        self.file_writer.write_frame(self.pending.popleft().result())
+
+    def drain(self):
+        while self.pending:
+            self.write_oldest()
+        # Curves the raster cameras clipped count towards the main camera's totals.
+        if hasattr(self.camera, "culling_stats"):
+            for camera in self.raster_cameras:
+                for name, count in camera.culling_stats.items():
+                    self.camera.culling_stats[name] += count
+                camera.reset_culling_stats()
+
+    def add_frame(self, frame, num_frames=1):
+        # Frames written directly (a frozen wait, say) come after the ones still in flight.
+        self.drain()
+        super().add_frame(frame, num_frames)
+
+    def scene_finished(self, scene):
+        try:
+            self.drain()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+        super().scene_finished(scene)
+
+
+def pipelined_scene(scene_class, threads=None):
+    # Returns a subclass of the scene that renders through the pipeline.
+    return with_renderer(scene_class, PipelinedRenderer, render_threads=threads)
+
+
+def render_pipelined(path, scene_name, quality="l", threads=None, **options):
+    scene_class = pipelined_scene(load_scene_class(path, scene_name), threads)
+    with tempconfig(render_config(quality, **options)):
+        scene = scene_class()
+        scene.render()
+        return Path(scene.renderer.file_writer.movie_file_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a scene with rasterization on a pool of threads.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--threads", type=int, default=None, help="Raster threads, default one per core up to 8.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    movie = render_pipelined(args.file, args.scene, args.quality, args.threads)
+    print(f"{args.scene} written to {movie} in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,49 @@
+from manim import *
+
+from GridLOD import enable_grid_lod
+
+# Prototype cache for the NumberPlanes shared by all scenes.
+# Building a 40x40 plane lays out every grid line, axis and tick from scratch,
+# so each distinct plane is built once and scenes receive deep copies of it.
+_PLANE_PROTOTYPES = {}
+_PLANE_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _style_key(style):
+    # Colors are ManimColor objects, so key them by their string form.
+    return tuple(sorted((name, str(value)) for name, value in style.items()))
+
+
+def cached_plane(x_range=(-20, 20, 1), y_range=(-20, 20, 1), background_line_style=None, scale=1, lod=False):
+    # Return a fresh copy of the plane with the given range, style and scale.
+    # lod=True thins the grid lines when they get too dense or faint; see GridLOD.py.
+    background_line_style = background_line_style or {}
+    key = (tuple(x_range), tuple(y_range), _style_key(background_line_style), scale, lod)
+
+    prototype = _PLANE_PROTOTYPES.get(key)
+    if prototype is None:
+        _PLANE_CACHE_STATS["misses"] += 1
+        prototype = NumberPlane(
+            x_range=list(x_range),
+            y_range=list(y_range),
+            background_line_style=dict(background_line_style),
+        )
+        if scale != 1:
+            prototype.scale(scale)
+        if lod:
+            enable_grid_lod(prototype)
+        _PLANE_PROTOTYPES[key] = prototype
+    else:
+        _PLANE_CACHE_STATS["hits"] += 1
+
+    return prototype.copy()
+
+
+def plane_cache_stats():
+    return dict(_PLANE_CACHE_STATS, size=len(_PLANE_PROTOTYPES))
+
+
+def clear_plane_cache():
+    _PLANE_PROTOTYPES.clear()
+    _PLANE_CACHE_STATS["hits"] = 0
+    _PLANE_CACHE_STATS["misses"] = 0
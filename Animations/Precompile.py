@@ -0,0 +1,213 @@
+from manim import *
+import manim.mobject.text.tex_mobject as tex_mobject
+import ast
+import inspect
+import os
+import sys
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from TexCache import enable_tex_cache, tex_entry_exists
+
+# Parallel prescan of the TeX and Pango strings a scene needs.
+# Normally every MathTex and Text is compiled at the point construct() creates it,
+# one after another. PrecompileMixin collects them before construct() runs and
+# builds them all in a process pool. The workers leave their results in the shared
+# caches (TexCache entries for LaTeX, manim's text_dir for Pango), so the real
+# construct() finds every expression already compiled.
+#
+# Strings are found in two ways:
+#   - a static scan of the scene's source for MathTex/Tex/Text calls whose
+#     arguments only use literals, module-level names and their attributes
+#     (e.g. font_size=28, YELLOW, config.frame_width), joined with + or in
+#     f-strings; nothing in them is called, so the scan cannot run scene code;
+#   - an optional TEX_MANIFEST class attribute for strings built at runtime,
+#     as (class_name, args) or (class_name, args, kwargs) tuples, and an
+#     optional tex_manifest() classmethod returning more of them, for strings
+#     that depend on class attributes such as the scene's matrix.
+# Strings already in the caches are left out, and when that is all of them no
+# pool is started, so a warm re-render pays only for the scan.
+PRECOMPILED_CLASSES = ("MathTex", "Tex", "SingleStringMathTex", "Text", "MarkupText")
+
+
+def _call_name(node):
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _is_static(node):
+    # True for expressions the scan may evaluate: no calls, subscripts or comprehensions.
+    if isinstance(node, (ast.Constant, ast.Name)):
+        return True
+    if isinstance(node, ast.Attribute):
+        return _is_static(node.value)
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, (ast.USub, ast.UAdd)) and isinstance(node.operand, ast.Constant)
+    if isinstance(node, ast.BinOp):
+        return isinstance(node.op, ast.Add) and _is_static(node.left) and _is_static(node.right)
+    if isinstance(node, ast.JoinedStr):
+        return all(_is_static(value) for value in node.values)
+    if isinstance(node, ast.FormattedValue):
+        return _is_static(node.value) and (node.format_spec is None or _is_static(node.format_spec))
+    return False
+
+
+def scan_scene(scene_class):
+    # Return the (class_name, args, kwargs) of every statically evaluable call.
+    namespace = dict(vars(sys.modules[scene_class.__module__]))
+    specs = []
+    for cls in scene_class.__mro__:
+        if cls.__module__.startswith("manim") or cls is object:
+            continue
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(cls)))
+        except (OSError, TypeError):
+            continue
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or _call_name(node) not in PRECOMPILED_CLASSES:
+                continue
+            if any(isinstance(arg, ast.Starred) for arg in node.args) or any(kw.arg is None for kw in node.keywords):
+                continue
+            if not all(_is_static(value) for value in [*node.args, *(kw.value for kw in node.keywords)]):
+                continue
+            try:
+                args = tuple(eval(compile(ast.Expression(arg), "<prescan>", "eval"), namespace) for arg in node.args)
+                kwargs = {
+                    kw.arg: eval(compile(ast.Expression(kw.value), "<prescan>", "eval"), namespace)
+                    for kw in node.keywords
+                }
+            except Exception:
+                # Depends on local state (trackers, loop variables); built at render time.
+                continue
+            specs.append((_call_name(node), args, kwargs))
+
+    manifest = list(getattr(scene_class, "TEX_MANIFEST", ()))
+    if hasattr(scene_class, "tex_manifest"):
+        try:
+            manifest += scene_class.tex_manifest()
+        except Exception as error:
+            # A matrix the scene cannot show; construct() raises the same error.
+            logger.warning(f"{scene_class.__name__}.tex_manifest() failed: {type(error).__name__}: {error}")
+    for spec in manifest:
+        name, args, kwargs = spec if len(spec) == 3 else (*spec, {})
+        specs.append((name, tuple(args), dict(kwargs)))
+
+    # Drop duplicates while keeping the order they appear in.
+    unique = {}
+    for name, args, kwargs in specs:
+        unique.setdefault(repr((name, args, sorted(kwargs.items()))), (name, args, kwargs))
+    return list(unique.values())
+
+
+class _Probe(Exception):
+    # Stops a probed constructor at the point it would compile.
+    pass
+
+
+def is_cached(spec):
+    # True when building the spec would find its LaTeX in TexCache, or its Pango
+    # output in manim's text_dir. The constructor runs up to that point only.
+    name, args, kwargs = spec
+    found = []
+
+    def probe_tex(expression, environment=None, tex_template=None):
+        found.append(tex_entry_exists(expression, environment, tex_template))
+        raise _Probe()
+
+    def probe_text(self, color):
+        # MarkupText hashes the parsed color, Text the hex string it is given.
+        color = ManimColor(color) if isinstance(self, MarkupText) else color
+        found.append((config.get_dir("text_dir") / f"{self._text2hash(color)}.svg").exists())
+        raise _Probe()
+
+    patches = [(tex_mobject, "tex_to_svg_file", probe_tex), (Text, "_text2svg", probe_text), (MarkupText, "_text2svg", probe_text)]
+    originals = [(target, attribute, vars(target)[attribute]) for target, attribute, _ in patches]
+    for target, attribute, probe in patches:
+        setattr(target, attribute, probe)
+    try:
+        globals()[name](*args, **kwargs)
+    except _Probe:
+        pass
+    except Exception:
+        # Let the pool compile it and report the error.
+        return False
+    finally:
+        for target, attribute, original in originals:
+            setattr(target, attribute, original)
+    return found == [True]
+
+
+def _init_worker(media_dir, tex_template):
+    enable_tex_cache()
+    config.media_dir = media_dir
+    config.tex_template = tex_template
+    # Workers share tex_dir; cleanup in one worker would delete another's .tex/.dvi mid-compile.
+    config.no_latex_cleanup = True
+
+
+def _compile_one(spec):
+    name, args, kwargs = spec
+    start = time.perf_counter()
+    try:
+        globals()[name](*args, **kwargs)
+    except Exception as error:
+        return name, args, time.perf_counter() - start, f"{type(error).__name__}: {error}"
+    return name, args, time.perf_counter() - start, None
+
+
+def precompile(specs, workers=None):
+    # Compile every spec that is not cached yet concurrently. Failures are only
+    # logged: construct() compiles the same expression again and reports the real error there.
+    total = len(specs)
+    specs = [spec for spec in specs if not is_cached(spec)]
+    if not specs:
+        if total:
+            logger.info(f"All {total} TeX/Text strings already compiled; no precompile pool needed")
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(specs))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(config.media_dir, config.tex_template),
+    ) as pool:
+        results = list(pool.map(_compile_one, specs))
+
+    for name, args, _, error in results:
+        if error is not None:
+            logger.warning(f"Precompiling {name}{args!r} failed: {error}")
+    logger.info(
+        f"Precompiled {len(specs)} of {total} TeX/Text strings with {workers} workers in "
+        f"{time.perf_counter() - start:.2f}s (serial cost {sum(r[2] for r in results):.2f}s)"
+    )
+    return results
+
+
+class PrecompileMixin:
+    # Mix into a scene ahead of Scene: class MyScene(PrecompileMixin, Scene).
+    # PRECOMPILE_WORKERS = None uses every core, 0 turns the prescan off.
+    PRECOMPILE_WORKERS = None
+
+    def setup(self):
+        super().setup()
+        if self.PRECOMPILE_WORKERS != 0:
+            precompile(scan_scene(type(self)), workers=self.PRECOMPILE_WORKERS)
+
+
+if __name__ == "__main__":
+    # Warm the caches for one scene without rendering it:
+    #     python Precompile.py MathematicalComputation.py DetailedEigenvalueExample
+    import importlib.util
+
+    path, scene_name = sys.argv[1], sys.argv[2]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    for name, args, elapsed, error in precompile(scan_scene(getattr(module, scene_name))):
+        print(f"{elapsed:7.2f}s  {name}{args!r}" + (f"  FAILED: {error}" if error else ""))
@@ -0,0 +1,290 @@
+from manim import *
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+# Opt-in render profiling, one row per play() and wait().
+# Every play is timed and its wall time split into phases:
+#   construct    construct() code run since the previous play (building
+#                mobjects, TeX and Pango included)
+#   begin        compiling and beginning the animations
+#   interpolate  update_to_time() for every frame
+#   rasterize    drawing frames with the camera
+#   queue        handing frames to the encoder (blocks while its queue is full)
+#   other        what is left: the play's cache hash, bookkeeping
+# The encoder itself runs on a thread of its own per play; its time is
+# reported next to the play it belongs to but is not part of the play's wall
+# time. Each row also has the frames written, the size of the scene's
+# mobject family and its total number of points at the end of the play.
+#
+# Profiling is off unless the scene sets PROFILE = True or the EIGEN_PROFILE
+# environment variable is set:
+#
+#     EIGEN_PROFILE=1 manim -ql DetailsAndIntuitionVisualization.py FinalVisualization
+#
+# Each render writes <Scene>.trace.json, which chrome://tracing and
+# https://ui.perfetto.dev open, and <Scene>.txt with the summary table to
+# media/profiles (EIGEN_PROFILE_DIR). The rows are also in the trace, under
+# "otherData", for scripts to read.
+PROFILE_DIR = Path(os.environ.get("EIGEN_PROFILE_DIR", Path(__file__).resolve().parent / "media" / "profiles"))
+PHASES = ("construct", "begin", "interpolate", "rasterize", "queue")
+
+# Outermost instances of these are timed as TeX and text spans inside construct.
+TIMED_CLASSES = {MathTex: "tex", SingleStringMathTex: "tex", Tex: "tex", Text: "text", MarkupText: "text"}
+
+
+def profiling_enabled(scene):
+    return getattr(scene, "PROFILE", False) or os.environ.get("EIGEN_PROFILE", "0") not in ("", "0")
+
+
+class Profiler:
+    def __init__(self, name):
+        self.name = name
+        self.origin = time.perf_counter()
+        self.events = []
+        self.plays = []
+        self.scene_phases = {}
+        self.play_index = None
+        self.last_mark = None
+        self.frames = 0
+        self.thread_names = {}
+        self.lock = threading.Lock()
+        self.restore = []
+
+    def now(self):
+        return time.perf_counter() - self.origin
+
+    def record(self, name, category, start, end, **args):
+        # One complete ("X") event of the Chrome trace format, in microseconds.
+        with self.lock:
+            # Encoder threads are short-lived and their ids get reused, so they share one name.
+            self.thread_names.setdefault(threading.get_ident(), "main" if threading.current_thread() is threading.main_thread() else "encoder")
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round(start * 1e6, 1),
+                "dur": round((end - start) * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    @contextmanager
+    def span(self, name, category=None, **args):
+        play = self.play_index
+        start = self.now()
+        try:
+            yield
+        finally:
+            end = self.now()
+            if play is not None:
+                args["play"] = play
+            self.record(name, category or name, start, end, **args)
+
+    def wrap(self, owner, method_name, name, category=None, on_call=None):
+        # Time every call of owner.method_name; undone by unwrap_all().
+        original = getattr(owner, method_name)
+
+        def timed(*args, **kwargs):
+            if on_call is not None:
+                on_call(*args, **kwargs)
+            with self.span(name, category):
+                return original(*args, **kwargs)
+
+        setattr(owner, method_name, timed)
+        if isinstance(owner, type):
+            self.restore.append(lambda: setattr(owner, method_name, original))
+        else:
+            # Instance attributes shadow the class method; deleting them restores it.
+            self.restore.append(lambda: owner.__dict__.pop(method_name, None))
+        return original
+
+    def wrap_constructors(self):
+        depth = threading.local()
+        for cls, category in TIMED_CLASSES.items():
+            original = cls.__dict__.get("__init__")
+            if original is None:
+                continue
+
+            def timed_init(mobject, *args, _original=original, _category=category, **kwargs):
+                if getattr(depth, "value", 0):
+                    return _original(mobject, *args, **kwargs)
+                depth.value = 1
+                try:
+                    source = " ".join(str(arg) for arg in args if isinstance(arg, str))
+                    with self.span(type(mobject).__name__, _category, source=source[:80]):
+                        return _original(mobject, *args, **kwargs)
+                finally:
+                    depth.value = 0
+
+            cls.__init__ = timed_init
+            self.restore.append(lambda cls=cls, original=original: setattr(cls, "__init__", original))
+
+    def unwrap_all(self):
+        while self.restore:
+            self.restore.pop()()
+
+    def count_frames(self, pixels, repeat=1, **kwargs):
+        self.frames += repeat
+
+    def wrap_encoder(self, encoder):
+        # Runs on the encoder thread; the events keep the index of the play they encode.
+        play = self.play_index
+        for method_name in ("write_frame", "finish"):
+            original = getattr(encoder, method_name)
+
+            def timed(*args, _original=original, _name=method_name, **kwargs):
+                start = self.now()
+                try:
+                    return _original(*args, **kwargs)
+                finally:
+                    self.record(f"encode {_name}", "encode", start, self.now(), play=play)
+
+            setattr(encoder, method_name, timed)
+        return encoder
+
+    def play_summary(self, index):
+        phases = Counter()
+        for event in self.events:
+            if event["args"].get("play") == index and event["cat"] in PHASES + ("encode",):
+                phases[event["cat"]] += event["dur"] / 1e6
+        return phases
+
+    def write(self, directory=PROFILE_DIR):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for play in self.plays:
+            phases = self.play_summary(play["index"])
+            play.update({phase: round(phases[phase], 6) for phase in PHASES + ("encode",)})
+            play["other"] = round(max(play["wall"] - sum(phases[phase] for phase in PHASES if phase != "construct"), 0), 6)
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        trace_path = directory / f"{self.name}.trace.json"
+        trace_path.write_text(json.dumps({
+            "traceEvents": metadata + self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"scene": self.name, "phases": self.scene_phases, "plays": self.plays},
+        }))
+        table_path = directory / f"{self.name}.txt"
+        table = self.summary_table()
+        table_path.write_text(table + "\n")
+        return trace_path, table_path, table
+
+    def summary_table(self):
+        total = sum(self.scene_phases.values())
+        lines = [
+            f"{self.name}: {total:.2f}s ("
+            + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.scene_phases.items())
+            + ")",
+            f"{'#':>4}  {'call':<28}{'wall':>8}{'constr':>8}{'begin':>8}{'interp':>8}{'raster':>8}{'queue':>8}"
+            f"{'other':>8}{'encode':>8}{'frames':>8}{'family':>8}{'points':>9}",
+        ]
+        columns = ("wall", "construct", "begin", "interpolate", "rasterize", "queue", "other", "encode")
+        for play in self.plays:
+            lines.append(
+                f"{play['index']:>4}  {play['call'][:27]:<28}"
+                + "".join(f"{play[column]:>8.3f}" for column in columns)
+                + f"{play['frames']:>8}{play['family']:>8}{play['points']:>9}"
+            )
+        if self.plays:
+            lines.append(
+                f"{'':>4}  {'total':<28}"
+                + "".join(f"{sum(play[column] for play in self.plays):>8.3f}" for column in columns)
+                + f"{sum(play['frames'] for play in self.plays):>8}"
+            )
+        return "\n".join(lines)
+
+
+def describe_call(animations):
+    counts = Counter(type(animation).__name__ for animation in animations or ())
+    if list(counts) == ["Wait"]:
+        return "wait"
+    return ", ".join(name if count == 1 else f"{name} x{count}" for name, count in counts.items())
+
+
+class ProfilingMixin:
+    # Mix into a scene ahead of Scene: class MyScene(ProfilingMixin, Scene).
+    PROFILE = False
+    profiler = None
+
+    def render(self, *args, **kwargs):
+        if not profiling_enabled(self):
+            return super().render(*args, **kwargs)
+
+        profiler = self.profiler = Profiler(type(self).__name__)
+        renderer = self.renderer
+        file_writer = renderer.file_writer
+
+        def start_construct():
+            profiler.last_mark = profiler.now()
+
+        profiler.wrap(self, "setup", "setup", "scene")
+        profiler.wrap(self, "construct", "construct", "scene", on_call=start_construct)
+        profiler.wrap(self, "tear_down", "tear_down", "scene")
+        profiler.wrap(renderer, "scene_finished", "finish", "scene")
+        profiler.wrap(self, "compile_animation_data", "compile", "begin")
+        profiler.wrap(self, "begin_animations", "begin", "begin")
+        profiler.wrap(self, "update_to_time", "interpolate")
+        profiler.wrap(renderer, "update_frame", "rasterize")
+        profiler.wrap(file_writer, "write_frame", "queue", on_call=profiler.count_frames)
+        profiler.wrap(file_writer, "end_animation", "queue")
+        original_create_encoder = file_writer._create_segment_encoder
+        file_writer._create_segment_encoder = lambda target: profiler.wrap_encoder(original_create_encoder(target))
+        profiler.restore.append(lambda: file_writer.__dict__.pop("_create_segment_encoder", None))
+        profiler.wrap_constructors()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            profiler.unwrap_all()
+            for event in profiler.events:
+                if event["cat"] == "scene":
+                    profiler.scene_phases[event["name"]] = round(profiler.scene_phases.get(event["name"], 0) + event["dur"] / 1e6, 6)
+            trace_path, table_path, table = profiler.write()
+            logger.info(f"Profile of {profiler.name}:\n{table}\nTrace written to {trace_path}")
+
+    def play(self, *args, **kwargs):
+        profiler = self.profiler
+        if profiler is None or profiler.play_index is not None:
+            return super().play(*args, **kwargs)
+
+        index = len(profiler.plays)
+        start = profiler.now()
+        mark = start if profiler.last_mark is None else profiler.last_mark
+        construct = start - mark
+        profiler.record("construct", "construct", mark, start, play=index)
+        profiler.play_index = index
+        profiler.frames = 0
+        skipped = False
+        try:
+            super().play(*args, **kwargs)
+            skipped = self.renderer.skip_animations
+        finally:
+            profiler.play_index = None
+            end = profiler.now()
+            profiler.last_mark = end
+            members = self.get_mobject_family_members()
+            call = describe_call(self.animations)
+            row = {
+                "index": index,
+                "call": call,
+                "start": round(start, 6),
+                "wall": round(end - start, 6),
+                "frames": profiler.frames,
+                "family": len(members),
+                "points": sum(len(mobject.points) for mobject in members),
+                "skipped": skipped,
+            }
+            profiler.plays.append(row)
+            profiler.record(
+                call or "play", "play", start, end,
+                index=index, construct=round(construct, 6), frames=row["frames"],
+                family=row["family"], points=row["points"], skipped=skipped,
+            )
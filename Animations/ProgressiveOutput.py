@@ -0,0 +1,203 @@
+from manim import *
+import argparse
+import math
+import os
+import threading
+import time
+from fractions import Fraction
+
+import av
+from manim.utils.file_ops import modify_atime, open_file
+
+from HoldEncoding import HoldFileWriter
+from SceneRunner import QUALITIES, load_scene_class, render_config
+
+# Progressive HLS output, playable while the scene is still rendering.
+# Normally the movie only exists once every play is encoded and the partial
+# movies are concatenated. In progressive mode each partial movie is remuxed
+# (packets copied, no re-encoding) into an MPEG-TS segment as soon as its
+# encoder finishes, and appended to an HLS playlist next to where the movie
+# would go:
+#
+#     media/videos/<module>/480p15/<Scene>.m3u8
+#     media/videos/<module>/480p15/<Scene>_segments/00000.ts, ...
+#
+# The playlist is an EVENT playlist: players that open it early (VLC, mpv,
+# ffplay, Safari) start at the first slide and keep reloading it as segments
+# are added. It is closed with #EXT-X-ENDLIST when the render ends, and it
+# replaces the final movie, so the concatenation pass is skipped. Segments are
+# timestamped back to back, so a static hold keeps its full length.
+#
+#     EIGEN_PROGRESSIVE=1 manim -p -ql MathematicalComputation.py DetailedEigenvalueExample
+#     python ProgressiveOutput.py MathematicalComputation.py DetailedEigenvalueExample -q l --preview
+#
+# With -p (or --preview) the playlist opens as soon as its first segment is
+# written rather than at the end. Sound added with add_sound() is not part of
+# the playlist, and GIF output is written as usual.
+# Segment timestamps start here; the first frames' decode times lie before
+# their presentation times and MPEG-TS has no negative timestamps.
+START_OFFSET = Fraction(1)
+
+
+def progressive_enabled(scene):
+    return getattr(scene, "PROGRESSIVE", False) or os.environ.get("EIGEN_PROGRESSIVE", "0") not in ("", "0")
+
+
+def remux_segment(movie_path, segment_path, offset):
+    # Copies the movie's video packets into an MPEG-TS file, shifted by offset
+    # seconds. Returns the movie's duration in seconds.
+    with av.open(str(movie_path)) as source:
+        stream = source.streams.video[0]
+        duration = Fraction(source.duration, av.time_base)
+        with av.open(str(segment_path), "w", format="mpegts") as target:
+            output_stream = target.add_stream_from_template(stream)
+            shift = round(offset / stream.time_base)
+            for packet in source.demux(stream):
+                # Skip the empty packets demux ends with.
+                if packet.dts is None:
+                    continue
+                packet.pts += shift
+                packet.dts += shift
+                packet.stream = output_stream
+                target.mux(packet)
+    return duration
+
+
+class ProgressiveFileWriter(HoldFileWriter):
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.progressive = self.output_spec.is_video and not self.output_spec.is_gif
+        self.lock = threading.Lock()
+        # Per play, in order: its partial movie, or None when it has nothing to show.
+        self.play_movies = []
+        self.ready = set()
+        # Plays whose partial movie is still being encoded, by movie path.
+        self.waiting = {}
+        self.segments = []
+        self.offset = START_OFFSET
+        self.previewed = False
+        if self.progressive:
+            self.playlist_path = self.movie_file_path.with_suffix(".m3u8")
+            self.segment_dir = self.movie_file_path.with_name(f"{self.movie_file_path.stem}_segments")
+            self.segment_dir.mkdir(parents=True, exist_ok=True)
+            for old_segment in self.segment_dir.glob("*.ts"):
+                old_segment.unlink()
+            self.write_playlist()
+
+    def begin_animation(self, allow_write=False, *, animation_index, file_path=None):
+        if not self.progressive:
+            return super().begin_animation(allow_write, animation_index=animation_index, file_path=file_path)
+        movie = file_path or self.partial_movie_files[animation_index]
+        with self.lock:
+            index = len(self.play_movies)
+            self.play_movies.append(movie)
+            if movie is not None and (allow_write or str(movie) in self._inflight_by_path):
+                # Ready once the encoder that writes it has finished.
+                self.waiting.setdefault(str(movie), []).append(index)
+            else:
+                # Skipped, or a finished movie from manim's partial movie cache.
+                self.ready.add(index)
+        super().begin_animation(allow_write, animation_index=animation_index, file_path=file_path)
+        self.publish()
+
+    def _create_segment_encoder(self, target):
+        encoder = super()._create_segment_encoder(target)
+        if self.progressive:
+            finish = encoder.finish
+
+            def finish_and_publish():
+                # Runs on the encoder thread.
+                finish()
+                with self.lock:
+                    self.ready.update(self.waiting.pop(str(target), []))
+                self.publish()
+
+            encoder.finish = finish_and_publish
+        return encoder
+
+    def publish(self):
+        # Appends the plays that are ready, in order, up to the first that is not.
+        with self.lock:
+            added = False
+            while len(self.segments) < len(self.play_movies) and len(self.segments) in self.ready:
+                movie = self.play_movies[len(self.segments)]
+                if movie is None:
+                    self.segments.append(None)
+                    continue
+                segment_path = self.segment_dir / f"{len(self.segments):05}.ts"
+                duration = remux_segment(movie, segment_path, self.offset)
+                self.offset += duration
+                self.segments.append((segment_path, duration))
+                added = True
+            if added:
+                self.write_playlist()
+                self.preview()
+
+    def write_playlist(self, ended=False):
+        segments = [segment for segment in self.segments if segment is not None]
+        target_duration = max([math.ceil(duration) for _, duration in segments] + [1])
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            # Players take this as the reload interval; it grows if a later play is longer.
+            f"#EXT-X-TARGETDURATION:{target_duration}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+        ]
+        for segment_path, duration in segments:
+            lines += [f"#EXTINF:{float(duration):.6f},", segment_path.relative_to(self.playlist_path.parent).as_posix()]
+        if ended:
+            lines.append("#EXT-X-ENDLIST")
+        # Replaced in one step, so a player reloading it never sees half a playlist.
+        temporary = self.playlist_path.with_name(f".{self.playlist_path.name}.tmp")
+        temporary.write_text("\n".join(lines) + "\n")
+        os.replace(temporary, self.playlist_path)
+
+    def preview(self):
+        if self.previewed or not config.preview:
+            return
+        self.previewed = True
+        logger.info(f"Opening {self.playlist_path} while the rest renders")
+        # open_file waits for the player when a preview command is configured.
+        threading.Thread(target=open_file, args=(self.playlist_path,), daemon=True).start()
+
+    def combine_to_movie(self):
+        if not self.progressive:
+            return super().combine_to_movie()
+        # Every encoder has finished by now.
+        self.publish()
+        self.write_playlist(ended=True)
+        if self.includes_sound:
+            logger.warning(f"{self.playlist_path.name} has no sound; render without EIGEN_PROGRESSIVE for the soundtrack")
+        for movie in self.play_movies:
+            if movie is not None:
+                # Keeps manim's partial movie cache pruning oldest-used first, as after concatenation.
+                modify_atime(movie)
+        if self.previewed:
+            # The player already follows the playlist; don't open a second one at the end.
+            logger.info(f"Playlist complete at '{self.playlist_path}'")
+        else:
+            self.print_file_ready_message(self.playlist_path)
+
+
+def render_progressive(path, scene_name, quality="l", preview=False, **options):
+    # Renders one scene as an HLS playlist; returns the playlist's path.
+    scene_class = load_scene_class(path, scene_name)
+    scene_class = type(scene_class.__name__, (scene_class,), {"PROGRESSIVE": True, "__module__": scene_class.__module__})
+    with tempconfig(render_config(quality, preview=preview, **options)):
+        scene = scene_class()
+        scene.render()
+        return scene.renderer.file_writer.playlist_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a scene as an HLS playlist that can be watched while it renders.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("--preview", action="store_true", help="Open the playlist as soon as its first segment is written.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    playlist = render_progressive(args.file, args.scene, args.quality, args.preview)
+    print(f"{args.scene} written to {playlist} in {time.perf_counter() - start:.2f}s")
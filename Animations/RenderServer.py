@@ -0,0 +1,209 @@
+from manim import *
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from SceneRunner import QUALITIES, render_scene
+
+# Imported here so that every worker starts with them loaded; EigenScene brings
+# in the shared helpers and enables the TeX cache.
+import EigenScene
+import numpy
+import sympy
+
+# A render daemon that keeps manim imported.
+# Starting `manim -ql ...` spends a large part of a short preview importing
+# manim, NumPy and SymPy and setting up Cairo and Pango. The server does that
+# once, then accepts jobs on a local Unix socket and forks a worker per job.
+# Workers start from the warm parent (imports done, font and TeX caches loaded)
+# and pay only for the render itself.
+#
+#     python RenderServer.py serve &
+#     python RenderServer.py render DetailsAndIntuitionVisualization.py FinalVisualization -q l
+#
+# Scene files are imported fresh by every worker, so edits to a scene show up
+# in the next job. The shared helpers (EigenScene and what it imports) are
+# loaded by the server; restart it after changing them.
+#
+# Protocol: the client sends one JSON line and receives one JSON line back.
+#     {"file": "...", "scene": "...", "quality": "l", "options": {...}}
+#         -> {"ok": true, "movie": "...", "seconds": 1.2}
+#     {"command": "ping"} / {"command": "shutdown"}
+SOCKET_PATH = Path(os.environ.get("RENDER_SERVER_SOCKET", Path(__file__).resolve().parent / "media" / "render_server.sock"))
+
+
+def send_line(connection, message):
+    connection.sendall((json.dumps(message) + "\n").encode())
+
+
+def receive_line(connection):
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data) if data else None
+
+
+def warm_up():
+    # Load fonts and fill the caches the first Text and MathTex of every job would.
+    start = time.perf_counter()
+    for build in (lambda: Text("0"), lambda: MathTex("0")):
+        try:
+            build()
+        except Exception as error:
+            logger.warning(f"Warm-up skipped {type(error).__name__}: {error}")
+    logger.info(f"Render server warmed up in {time.perf_counter() - start:.2f}s")
+
+
+def run_job(connection, job):
+    # Worker, in the forked child: render, report, exit.
+    start = time.perf_counter()
+    try:
+        path = Path(job["file"])
+        if not path.is_absolute():
+            path = Path(job.get("cwd", ".")) / path
+        movie = render_scene(path, job["scene"], job.get("quality", "l"), **job.get("options", {}))
+        result = {"ok": True, "movie": str(movie), "seconds": round(time.perf_counter() - start, 3)}
+    except BaseException as error:
+        result = {
+            "ok": False,
+            "error": f"{type(error).__name__}: {error}",
+            "traceback": traceback.format_exc(),
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+    try:
+        send_line(connection, result)
+    finally:
+        connection.close()
+
+
+def reap(workers):
+    # Collect finished workers without blocking.
+    while workers:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            workers.clear()
+            return
+        if pid == 0:
+            return
+        workers.discard(pid)
+
+
+def serve(socket_path=SOCKET_PATH, max_workers=None, warm=True):
+    max_workers = max_workers or os.cpu_count() or 1
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    if warm:
+        warm_up()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+    server.settimeout(0.5)
+    workers = set()
+    logger.info(f"Render server listening on {socket_path} with up to {max_workers} workers")
+    try:
+        while True:
+            reap(workers)
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                continue
+            connection.settimeout(None)
+            job = receive_line(connection)
+            command = (job or {}).get("command", "render")
+
+            if command == "ping":
+                send_line(connection, {"ok": True, "pid": os.getpid(), "workers": len(workers)})
+                connection.close()
+                continue
+            if command == "shutdown":
+                send_line(connection, {"ok": True})
+                connection.close()
+                break
+            if job is None or "file" not in job or "scene" not in job:
+                send_line(connection, {"ok": False, "error": "expected a job with 'file' and 'scene'"})
+                connection.close()
+                continue
+
+            while len(workers) >= max_workers:
+                # Wait for a worker to finish before starting another.
+                try:
+                    workers.discard(os.waitpid(-1, 0)[0])
+                except ChildProcessError:
+                    workers.clear()
+
+            pid = os.fork()
+            if pid == 0:
+                # Worker: the listening socket belongs to the parent.
+                server.close()
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                try:
+                    run_job(connection, job)
+                finally:
+                    os._exit(0)
+            workers.add(pid)
+            connection.close()
+            logger.info(f"Job {job['scene']} ({job['file']}) started in worker {pid}")
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+        for pid in workers:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+
+def request(message, socket_path=SOCKET_PATH):
+    # Client side: send one message, wait for the reply.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        send_line(connection, message)
+        return receive_line(connection)
+
+
+def render_remote(path, scene_name, quality="l", socket_path=SOCKET_PATH, **options):
+    # Like SceneRunner.render_scene, but rendered by a running server.
+    return request(
+        {"file": str(path), "scene": scene_name, "quality": quality, "options": options, "cwd": os.getcwd()},
+        socket_path,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep manim loaded and render scenes on request.")
+    parser.add_argument("--socket", default=str(SOCKET_PATH))
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve")
+    serve_parser.add_argument("-j", "--workers", type=int, default=None)
+    serve_parser.add_argument("--no-warm-up", action="store_true")
+    render_parser = commands.add_parser("render")
+    render_parser.add_argument("file")
+    render_parser.add_argument("scene")
+    render_parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    commands.add_parser("ping")
+    commands.add_parser("shutdown")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket, args.workers, warm=not args.no_warm_up)
+    elif args.command == "render":
+        start = time.perf_counter()
+        reply = render_remote(args.file, args.scene, args.quality, args.socket)
+        if not reply["ok"]:
+            print(reply.get("traceback") or reply["error"], file=sys.stderr)
+            sys.exit(1)
+        print(f"{reply['movie']} ({reply['seconds']:.2f}s render, {time.perf_counter() - start:.2f}s turnaround)")
+    else:
+        print(request({"command": args.command}, args.socket))
@@ -0,0 +1,80 @@
+from manim import *
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Helpers for rendering scenes from Python instead of the manim command line,
+# used by the tools that render in worker processes.
+FFMPEG = os.environ.get("FFMPEG", "ffmpeg")
+
+# Same letters as manim's -q flag.
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def load_scene_class(path, scene_name):
+    # Import a scene file the way manim does, with its folder on sys.path so
+    # sibling helpers (PlaneFactory, TexCache, ...) resolve.
+    path = Path(path).resolve()
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    module = sys.modules.get(path.stem)
+    if module is None or Path(getattr(module, "__file__", "")).resolve() != path:
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[path.stem] = module
+        spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def with_renderer(scene_class, renderer_class, **attributes):
+    # A subclass of the scene, under the same name, that renders with renderer_class;
+    # attributes are set on the subclass as well.
+    if not hasattr(scene_class, "renderer_class"):
+        raise TypeError(f"{scene_class.__name__} does not build its renderer from renderer_class")
+    return type(scene_class.__name__, (scene_class,), {
+        "renderer_class": renderer_class,
+        **attributes,
+        "__module__": scene_class.__module__,
+    })
+
+
+def render_config(quality="l", **options):
+    # Options for tempconfig, e.g. render_config("h", media_dir="media/worker_3").
+    return {"quality": QUALITIES[quality], **options}
+
+
+def render_scene(path, scene_name, quality="l", **options):
+    # Render one scene and return the path of its movie.
+    scene_class = load_scene_class(path, scene_name)
+    with tempconfig(render_config(quality, **options)):
+        scene = scene_class()
+        scene.render()
+        return Path(scene.renderer.file_writer.movie_file_path)
+
+
+def concat_movies(movie_paths, output_path):
+    # Join movies with identical encoding settings without re-encoding them.
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as manifest:
+        for movie_path in movie_paths:
+            escaped = str(Path(movie_path).resolve()).replace("'", "'\\''")
+            manifest.write(f"file '{escaped}'\n")
+    try:
+        subprocess.run(
+            [FFMPEG, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", manifest.name, "-c", "copy", str(output_path)],
+            check=True,
+        )
+    finally:
+        os.unlink(manifest.name)
+    return output_path
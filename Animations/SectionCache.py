@@ -0,0 +1,204 @@
+from manim import *
+import argparse
+import hashlib
+import linecache
+import os
+import random
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import manim
+import numpy as np
+
+from SceneRunner import QUALITIES, concat_movies, load_scene_class, render_config
+from SegmentRender import render_section
+from StaticLayer import STYLE_ATTRIBUTES
+
+# Incremental rendering, one cached movie per section.
+# manim's partial movie cache is keyed per play() by everything in the scene,
+# so changing one step of a long scene usually re-renders the plays after it
+# as well. Here every section (next_section() splits a scene into them) is
+# cached on its own, under a key made of
+#   - the state of the scene when the section starts and when it ends: every
+#     mobject's points and styles, the camera frame and the random state,
+#   - the source text of every line of this folder's code the section runs,
+#     helpers included, and the scene class's data attributes (its matrix),
+#   - the quality and the manim version.
+# A planning pass runs construct() with all animations skipped to compute the
+# keys. Only sections whose key is not cached are rendered, each in a worker
+# as in SegmentRender, and the movie is remuxed from the cached sections.
+#
+#     python SectionCache.py MathematicalComputation.py DetailedEigenvalueExample -q h -j 4
+#
+# Values from outside the section's own lines (module-level constants, earlier
+# sections' locals, code outside this folder) only count through what they do
+# to those two states. After changing one that only affects the frames in
+# between, such as a run time, render once with --force.
+SECTION_CACHE_DIR = Path(__file__).resolve().parent / "media" / "section_cache"
+
+
+def scene_state_fingerprint(scene):
+    # Everything a section starts from, without the ids that change between runs.
+    digest = hashlib.blake2b(digest_size=16)
+    for mobject in [*scene.mobjects, *scene.foreground_mobjects]:
+        for member in mobject.get_family():
+            digest.update(f"{type(member).__name__}:{len(member.submobjects)}".encode())
+            digest.update(np.ascontiguousarray(member.points).tobytes())
+            for name in STYLE_ATTRIBUTES:
+                value = getattr(member, name, None)
+                digest.update(np.ascontiguousarray(value).tobytes() if isinstance(value, np.ndarray) else repr(value).encode())
+    frame = getattr(scene.renderer.camera, "frame", None)
+    if frame is not None:
+        digest.update(np.ascontiguousarray(frame.points).tobytes())
+    digest.update(repr(random.getstate()).encode())
+    digest.update(repr(np.random.get_state()[1].tolist()).encode())
+    return digest.hexdigest()
+
+
+def class_data(scene_class):
+    # The data attributes of the scene's own classes, e.g. the matrix BatchRender sets.
+    data = {}
+    for cls in reversed(scene_class.__mro__):
+        if cls.__module__.startswith("manim") or cls is object:
+            continue
+        for name, value in vars(cls).items():
+            if not name.startswith("__") and not callable(value) and not isinstance(value, (classmethod, staticmethod, property)):
+                data[name] = value
+    return repr(sorted(data.items()))
+
+
+class SectionPlanner:
+    # Follows a skipped run of construct() and computes every section's key.
+    def __init__(self, scene, quality):
+        self.scene = scene
+        self.folder = str(Path(sys.modules[type(scene).__module__].__file__).resolve().parent)
+        self.traced_files = {}
+        self.sections = []
+        self.lines = set()
+        self.start_state = None
+        self.name = "(start)"
+        self.context = hashlib.blake2b(
+            f"{manim.__version__}|{quality}|{config.pixel_width}x{config.pixel_height}@{config.frame_rate}|"
+            f"{config.background_color}|{type(scene).__name__}|{class_data(type(scene))}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+        construct = scene.construct
+        next_section = scene.next_section
+
+        def traced_construct():
+            self.start_state = scene_state_fingerprint(scene)
+            sys.settrace(self.trace_calls)
+            try:
+                construct()
+            finally:
+                sys.settrace(None)
+            self.close_section()
+
+        def planned_next_section(name="unnamed", *args, **kwargs):
+            self.close_section()
+            self.name = name
+            next_section(name, *args, **kwargs)
+
+        scene.construct = traced_construct
+        scene.next_section = planned_next_section
+
+    def trace_calls(self, frame, event, arg):
+        filename = frame.f_code.co_filename
+        if filename not in self.traced_files:
+            path = os.path.abspath(filename)
+            self.traced_files[filename] = path.startswith(self.folder + os.sep) and path != os.path.abspath(__file__)
+        return self.trace_lines if self.traced_files[filename] else None
+
+    def trace_lines(self, frame, event, arg):
+        if event == "line":
+            self.lines.add((frame.f_code.co_filename, frame.f_lineno))
+        return self.trace_lines
+
+    def close_section(self):
+        # Only the text of the lines counts, so edits elsewhere that shift line numbers don't.
+        code = hashlib.blake2b(digest_size=16)
+        for filename, lineno in sorted(self.lines):
+            code.update(f"{os.path.basename(filename)}\0{linecache.getline(filename, lineno).strip()}\n".encode())
+        end_state = scene_state_fingerprint(self.scene)
+        key = hashlib.blake2b(f"{self.context}|{self.start_state}|{end_state}|{code.hexdigest()}".encode(), digest_size=16).hexdigest()
+        self.sections.append({"index": len(self.sections), "name": self.name, "key": key})
+        self.lines = set()
+        # The next section starts where this one ends.
+        self.start_state = end_state
+
+
+def plan_sections(path, scene_name, quality="l"):
+    # One pass with every animation skipped and nothing written; returns the sections in order.
+    scene_class = load_scene_class(path, scene_name)
+    with tempconfig(render_config(quality, dry_run=True)):
+        scene = scene_class(skip_animations=True)
+        planner = SectionPlanner(scene, quality)
+        scene.render()
+    return planner.sections
+
+
+def cached_movie(cache_dir, key):
+    # The section's movie, "empty" for a section without animations, or None.
+    if (cache_dir / f"{key}.mp4").exists():
+        return cache_dir / f"{key}.mp4"
+    if (cache_dir / f"{key}.empty").exists():
+        return "empty"
+    return None
+
+
+def render_incremental(path, scene_name, quality="l", workers=None, output_path=None, force=False, keep_stale=False):
+    start = time.perf_counter()
+    sections = plan_sections(path, scene_name, quality)
+    cache_dir = SECTION_CACHE_DIR / scene_name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Identical sections share a key; render each key once.
+    missing = {}
+    for section in sections:
+        if force or cached_movie(cache_dir, section["key"]) is None:
+            missing.setdefault(section["key"], section)
+    logger.info(f"{scene_name}: {len(missing)} of {len(sections)} sections to render")
+
+    if missing:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(missing))) as pool:
+            futures = {
+                pool.submit(render_section, str(path), scene_name, section["index"], quality): section
+                for section in missing.values()
+            }
+            for future in as_completed(futures):
+                section = futures[future]
+                _, movie_path, elapsed = future.result()
+                if movie_path is None:
+                    (cache_dir / f"{section['key']}.empty").touch()
+                else:
+                    shutil.move(movie_path, cache_dir / f"{section['key']}.mp4")
+                logger.info(f"Section {section['index']} ({section['name']}) rendered in {elapsed:.1f}s")
+
+    movies = [cached_movie(cache_dir, section["key"]) for section in sections]
+    output_path = Path(output_path or cache_dir / f"{scene_name}.mp4")
+    concat_movies([movie for movie in movies if movie != "empty"], output_path)
+
+    if not keep_stale:
+        # Sections this version of the scene no longer has.
+        keys = {section["key"] for section in sections}
+        for entry in cache_dir.iterdir():
+            if entry.suffix in (".mp4", ".empty") and entry.stem not in keys and entry.stem != scene_name:
+                entry.unlink()
+    logger.info(f"{scene_name} written to {output_path} in {time.perf_counter() - start:.1f}s")
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-render only the sections of a scene that changed.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("-o", "--output", default=None)
+    parser.add_argument("--force", action="store_true", help="Render every section again.")
+    parser.add_argument("--keep-stale", action="store_true", help="Keep cached sections the scene no longer uses.")
+    args = parser.parse_args()
+    render_incremental(args.file, args.scene, args.quality, args.workers, args.output, args.force, args.keep_stale)
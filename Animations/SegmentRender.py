@@ -0,0 +1,111 @@
+from manim import *
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from manim.utils.exceptions import EndSceneEarlyException
+
+from SceneRunner import QUALITIES, concat_movies, load_scene_class, render_config
+
+# Segment-parallel rendering.
+# A scene's next_section() calls split it into sections. Every section is rendered
+# by its own worker process: the worker runs the whole construct(), but every
+# section except its own is skipped (no frames are drawn or encoded), and it stops
+# as soon as its section ends. The section therefore starts from exactly the state
+# a full render would reach, and the workers' movies are joined losslessly in order.
+#
+# Section 0 is everything before the first next_section() call. Sections that
+# the scene itself marks skip_animations=True stay skipped.
+#
+#     python SegmentRender.py MathematicalComputation.py DetailedEigenvalueExample -q h -j 16
+SEGMENT_DIR = Path(__file__).resolve().parent / "media" / "segments"
+
+
+def limit_to_section(scene, index):
+    # Make an already constructed scene render only section `index`.
+    original_next_section = scene.next_section
+    sections_started = [0]
+
+    def next_section(name="unnamed", section_type=DefaultSectionType.NORMAL, skip_animations=False):
+        sections_started[0] += 1
+        if sections_started[0] > index:
+            # Everything after the target section is somebody else's work.
+            raise EndSceneEarlyException()
+        original_next_section(name, section_type, skip_animations or sections_started[0] != index)
+
+    scene.next_section = next_section
+    if index > 0:
+        # Replaces the empty section the file writer opens by default.
+        scene.renderer.file_writer.next_section("prelude", DefaultSectionType.NORMAL, True)
+    return scene
+
+
+def count_sections(path, scene_name):
+    # One pass with every animation skipped and nothing written, to find how many sections the scene has.
+    # dry_run alone only drops the output; the camera would still draw every frame.
+    scene_class = load_scene_class(path, scene_name)
+    with tempconfig({"dry_run": True}):
+        scene = scene_class(skip_animations=True)
+        original_next_section = scene.next_section
+        sections = [1]
+
+        def next_section(*args, **kwargs):
+            sections[0] += 1
+            original_next_section(*args, **kwargs)
+
+        scene.next_section = next_section
+        scene.render()
+    return sections[0]
+
+
+def render_section(path, scene_name, index, quality="l"):
+    # Worker: render one section into its own media directory.
+    start = time.perf_counter()
+    scene_class = load_scene_class(path, scene_name)
+    # count_sections already filled the TeX caches; don't start a pool per worker.
+    scene_class.PRECOMPILE_WORKERS = 0
+    media_dir = SEGMENT_DIR / scene_name / f"section_{index:03d}"
+    with tempconfig(render_config(quality, media_dir=str(media_dir), output_file=f"{scene_name}_{index:03d}")):
+        scene = limit_to_section(scene_class(), index)
+        movie_path = Path(scene.renderer.file_writer.movie_file_path)
+        # Don't mistake a movie from an earlier run for this one.
+        movie_path.unlink(missing_ok=True)
+        scene.render()
+    # A section without any animation writes no movie.
+    return index, movie_path if movie_path.exists() else None, time.perf_counter() - start
+
+
+def render_segmented(path, scene_name, quality="l", workers=None, output_path=None):
+    num_sections = count_sections(path, scene_name)
+    workers = min(workers or os.cpu_count() or 1, num_sections)
+    logger.info(f"Rendering {num_sections} sections of {scene_name} with {workers} workers")
+
+    start = time.perf_counter()
+    movies = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(render_section, str(path), scene_name, index, quality)
+            for index in range(num_sections)
+        ]
+        for future in as_completed(futures):
+            index, movie_path, elapsed = future.result()
+            movies[index] = movie_path
+            logger.info(f"Section {index} of {scene_name} rendered in {elapsed:.1f}s")
+
+    output_path = Path(output_path or SEGMENT_DIR / scene_name / f"{scene_name}.mp4")
+    concat_movies([movies[i] for i in sorted(movies) if movies[i] is not None], output_path)
+    logger.info(f"{scene_name} written to {output_path} in {time.perf_counter() - start:.1f}s")
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the sections of a scene in parallel.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args()
+    render_segmented(args.file, args.scene, args.quality, args.workers, args.output)
@@ -0,0 +1,154 @@
+from manim import *
+import hashlib
+import numpy as np
+
+# A background layer that is rasterized once per camera state.
+# manim's Cairo renderer already draws non-moving mobjects only once per
+# play(), but it does so again for every play and every wait, and a 40x40
+# grid is most of the stroke work in those frames. Mobjects added with
+# add_static_layer() are drawn once, kept as a finished frame, and later
+# frames start from a copy of it and draw only what comes after.
+#
+# The cached frame is keyed by the camera frame (center and size), the pixel
+# shape and a fingerprint of the layer's points and styles, so it is rebuilt
+# when the camera moves (self.camera.frame.animate.set_height(20)) or when
+# something changes the layer. During a play() that animates part of the
+# layer, or while the camera itself is moving, frames are drawn as usual.
+#
+# The layer only replaces the bottom of the drawing order: it is used for the
+# run of static-layer mobjects that would be drawn first, so anything drawn
+# below them still shows. Add the layer before the things that go on top.
+#
+#     self.add_static_layer(plane, legend)
+
+STYLE_ATTRIBUTES = (
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "z_index",
+)
+
+
+def layer_fingerprint(mobjects):
+    # Changes whenever a point or a colour of any of the mobjects does.
+    digest = hashlib.blake2b(digest_size=16)
+    for mobject in mobjects:
+        digest.update(id(mobject).to_bytes(8, "little"))
+        digest.update(np.ascontiguousarray(mobject.points).tobytes())
+        for name in STYLE_ATTRIBUTES:
+            value = getattr(mobject, name, None)
+            digest.update(np.ascontiguousarray(value).tobytes() if isinstance(value, np.ndarray) else repr(value).encode())
+    return digest.hexdigest()
+
+
+class StaticLayerCameraMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.static_layer_stats = {"hits": 0, "misses": 0}
+        self._static_layer_ids = set()
+        self._static_layer_fingerprint = None
+        self._static_layer_cache = None
+        self._last_camera_state = None
+        self._pristine = False
+
+    def forget_static_layer(self):
+        # Drops the layer and its cached frame, so nothing here keeps removed mobjects alive.
+        self._static_layer_ids = set()
+        self._static_layer_fingerprint = None
+        self._static_layer_cache = None
+
+    def set_static_layer(self, mobjects, moving_mobjects=()):
+        # Called at the start of every play(). While any of the layer moves there is nothing to cache.
+        members = extract_mobject_family_members(mobjects, only_those_with_points=True)
+        moving = {id(mobject) for mobject in extract_mobject_family_members(moving_mobjects)}
+        self._static_layer_ids = {id(mobject) for mobject in members}
+        if moving & self._static_layer_ids:
+            self._static_layer_fingerprint = None
+        else:
+            self._static_layer_fingerprint = layer_fingerprint(members)
+
+    def get_camera_state(self):
+        return (
+            tuple(np.round(self.frame_center, 9)),
+            round(self.frame_width, 9),
+            round(self.frame_height, 9),
+            self.pixel_array.shape,
+            id(self.background),
+        )
+
+    def reset(self):
+        super().reset()
+        # Only a frame that starts from the bare background can start from the cached layer instead.
+        self._pristine = True
+        return self
+
+    def set_frame_to_background(self, background):
+        super().set_frame_to_background(background)
+        self._pristine = False
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        pristine, self._pristine = self._pristine, False
+        camera_state = self.get_camera_state()
+        camera_moved, self._last_camera_state = camera_state != self._last_camera_state, camera_state
+        if not pristine or camera_moved or self._static_layer_fingerprint is None:
+            return super().capture_mobjects(mobjects, **kwargs)
+
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        count = 0
+        while count < len(mobjects) and id(mobjects[count]) in self._static_layer_ids:
+            count += 1
+        if count:
+            key = (camera_state, self._static_layer_fingerprint, tuple(id(mobject) for mobject in mobjects[:count]))
+            if self._static_layer_cache is not None and self._static_layer_cache[0] == key:
+                self.set_pixel_array(self._static_layer_cache[1])
+                self.static_layer_stats["hits"] += 1
+            else:
+                super().capture_mobjects(mobjects[:count], include_submobjects=False)
+                self._static_layer_cache = (key, self.pixel_array.copy())
+                self.static_layer_stats["misses"] += 1
+        super().capture_mobjects(mobjects[count:], include_submobjects=False)
+
+
+class StaticLayerMixin:
+    # Mix into a scene ahead of Scene: class MyScene(StaticLayerMixin, Scene).
+    def setup(self):
+        super().setup()
+        self.static_layer = []
+
+    def add_static_layer(self, *mobjects):
+        # Mobjects already in the scene keep their place in the drawing order.
+        self.static_layer += [mobject for mobject in mobjects if mobject not in self.static_layer]
+        self.add(*(mobject for mobject in mobjects if mobject not in self.mobjects))
+        return self
+
+    def remove(self, *mobjects):
+        super().remove(*mobjects)
+        self.prune_static_layer()
+        return self
+
+    def clear(self):
+        super().clear()
+        self.prune_static_layer()
+        return self
+
+    def prune_static_layer(self):
+        # Forget removed layer mobjects, and the cameras' cached frame of them, as soon as they leave
+        # the scene; begin_animations() hands the cameras what is left.
+        static_layer = [mobject for mobject in self.static_layer if mobject in self.mobjects]
+        if len(static_layer) == len(self.static_layer):
+            return
+        self.static_layer = static_layer
+        for camera in getattr(self.renderer, "cameras", [self.renderer.camera]):
+            if hasattr(camera, "forget_static_layer"):
+                camera.forget_static_layer()
+
+    def begin_animations(self):
+        super().begin_animations()
+        # Forget layer mobjects that have been removed from the scene.
+        self.static_layer = [mobject for mobject in self.static_layer if mobject in self.mobjects]
+        # A renderer drawing at several resolutions lists all of its cameras.
+        for camera in getattr(self.renderer, "cameras", [self.renderer.camera]):
+            if hasattr(camera, "set_static_layer"):
+                camera.set_static_layer(self.static_layer, self.moving_mobjects)
@@ -0,0 +1,212 @@
+from manim import *
+import manim.mobject.text.tex_mobject as tex_mobject
+import hashlib
+import os
+from pathlib import Path
+import numpy as np
+
+# Persistent, content-addressed cache for compiled LaTeX.
+# manim keeps the .svg files of compiled expressions, but every run still parses
+# them again, and each media directory keeps its own copy. This cache stores the
+# parsed result instead: the bezier points and style of every glyph plus the named
+# groups MathTex uses to split substrings. A cached expression skips both the LaTeX
+# compile and the SVG parse, in every scene and every later run.
+#
+# Entries are keyed by a hash of the expression, its environment and the full TeX
+# template, so a changed template or preamble never returns stale glyphs. Font size
+# is not part of the key: MathTex applies it by scaling after the glyphs are built,
+# so every font size of an expression shares one entry.
+#
+# Usage, once at the top of a scene file:
+#     from TexCache import enable_tex_cache
+#     enable_tex_cache()
+TEX_CACHE_DIR = Path(os.environ.get("TEX_CACHE_DIR", Path(__file__).resolve().parent / "media" / "tex_cache"))
+TEX_CACHE_MAX_BYTES = int(os.environ.get("TEX_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+_TEX_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+# Maps the svg path handed to SingleStringMathTex back to its TeX source.
+_SVG_SOURCES = {}
+_ORIGINAL_TEX_TO_SVG_FILE = tex_mobject.tex_to_svg_file
+_ORIGINAL_GENERATE_MOBJECT = SingleStringMathTex.generate_mobject
+
+
+def _hash(*parts):
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(repr(part).encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:32]
+
+
+def _tex_key(expression, environment, tex_template):
+    return _hash(expression, environment, tex_template.body, tex_template.tex_compiler, tex_template.output_format)
+
+
+def tex_entry_exists(expression, environment=None, tex_template=None):
+    # True when the expression has a parsed entry in some style, so LaTeX would not run for it.
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    return any(TEX_CACHE_DIR.glob(f"{_tex_key(expression, environment, tex_template)}_*.npz"))
+
+
+def _entry_path(mob):
+    # The same expression parsed with different SVG defaults gives different styles.
+    tex_key = _SVG_SOURCES[str(mob.file_name)][0]
+    style_key = _hash(sorted((k, str(v)) for k, v in mob.svg_default.items()), sorted(mob.path_string_config.items()))
+    return TEX_CACHE_DIR / f"{tex_key}_{style_key[:16]}.npz"
+
+
+def _cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    # Stands in for tex_to_svg_file inside SingleStringMathTex. When any parsed
+    # entry exists for the expression, LaTeX is not run at all; the returned path
+    # only identifies the expression and is compiled later if the entry turns out
+    # to be missing for this style.
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    tex_key = _tex_key(expression, environment, tex_template)
+    if any(TEX_CACHE_DIR.glob(f"{tex_key}_*.npz")):
+        svg_file = TEX_CACHE_DIR / f"{tex_key}.svg"
+    else:
+        svg_file = _ORIGINAL_TEX_TO_SVG_FILE(expression, environment=environment, tex_template=tex_template)
+    _SVG_SOURCES[str(svg_file)] = (tex_key, expression, environment, tex_template)
+    return svg_file
+
+
+def _save_entry(mob, path):
+    leaves = mob.submobjects
+    group_names = list(mob.id_to_vgroup_dict)
+    index_of = {id(leaf): i for i, leaf in enumerate(leaves)}
+    group_indices = [
+        [index_of[id(leaf)] for leaf in mob.id_to_vgroup_dict[name].submobjects if id(leaf) in index_of]
+        for name in group_names
+    ]
+
+    arrays = {
+        "points": np.concatenate([leaf.points for leaf in leaves]) if leaves else np.zeros((0, 3)),
+        "point_counts": np.array([len(leaf.points) for leaf in leaves], dtype=int),
+        "fill_rgbas": np.concatenate([leaf.fill_rgbas for leaf in leaves]) if leaves else np.zeros((0, 4)),
+        "fill_counts": np.array([len(leaf.fill_rgbas) for leaf in leaves], dtype=int),
+        "stroke_rgbas": np.concatenate([leaf.stroke_rgbas for leaf in leaves]) if leaves else np.zeros((0, 4)),
+        "stroke_counts": np.array([len(leaf.stroke_rgbas) for leaf in leaves], dtype=int),
+        "stroke_widths": np.array([leaf.stroke_width for leaf in leaves], dtype=float),
+        "group_names": np.array(group_names, dtype=str),
+        "group_members": np.array([i for indices in group_indices for i in indices], dtype=int),
+        "group_counts": np.array([len(indices) for indices in group_indices], dtype=int),
+    }
+
+    # Write under a temporary name and rename, so parallel renders never read half an entry.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # The temporary name must not end in .npz, or other workers would count and evict it.
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    # Through a file object, since np.savez adds .npz to any other file name.
+    with open(temporary_path, "wb") as file:
+        np.savez(file, **arrays)
+    os.replace(temporary_path, path)
+    _evict()
+
+
+def _load_entry(mob, path):
+    with np.load(path) as data:
+        leaves = []
+        point_chunks = np.split(data["points"], np.cumsum(data["point_counts"])[:-1])
+        fill_chunks = np.split(data["fill_rgbas"], np.cumsum(data["fill_counts"])[:-1])
+        stroke_chunks = np.split(data["stroke_rgbas"], np.cumsum(data["stroke_counts"])[:-1])
+        for points, fill_rgbas, stroke_rgbas, stroke_width in zip(
+            point_chunks, fill_chunks, stroke_chunks, data["stroke_widths"]
+        ):
+            leaf = VMobject()
+            leaf.set_points(points)
+            leaf.fill_rgbas = fill_rgbas
+            leaf.stroke_rgbas = stroke_rgbas
+            leaf.stroke_width = float(stroke_width)
+            leaves.append(leaf)
+
+        group_members = np.split(data["group_members"], np.cumsum(data["group_counts"])[:-1])
+        id_to_vgroup_dict = {
+            str(name): VGroup(*(leaves[i] for i in members))
+            for name, members in zip(data["group_names"], group_members)
+        }
+
+    mob.add(*leaves)
+    mob.id_to_vgroup_dict = id_to_vgroup_dict
+    # Mark the entry as recently used for LRU eviction.
+    os.utime(path)
+    return mob
+
+
+def _cached_generate_mobject(self):
+    if str(self.file_name) not in _SVG_SOURCES:
+        return _ORIGINAL_GENERATE_MOBJECT(self)
+
+    path = _entry_path(self)
+    if path.exists():
+        try:
+            _load_entry(self, path)
+            _TEX_CACHE_STATS["hits"] += 1
+            return self
+        except (OSError, ValueError, KeyError):
+            # Unreadable or evicted mid-read: fall back to compiling.
+            self.submobjects = []
+            self.id_to_vgroup_dict = {}
+
+    _TEX_CACHE_STATS["misses"] += 1
+    if not Path(self.file_name).exists():
+        # LaTeX was skipped for an entry of another style; compile it now.
+        source = _SVG_SOURCES[str(self.file_name)]
+        _, expression, environment, tex_template = source
+        self.file_name = Path(_ORIGINAL_TEX_TO_SVG_FILE(expression, environment=environment, tex_template=tex_template))
+        _SVG_SOURCES[str(self.file_name)] = source
+    _ORIGINAL_GENERATE_MOBJECT(self)
+    _save_entry(self, path)
+    return self
+
+
+def _cache_entries():
+    # (mtime, size, path) of every entry; parallel workers may evict any of them while we look.
+    entries = []
+    for path in TEX_CACHE_DIR.glob("*.npz"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def _evict():
+    # Drop least recently used entries until the cache fits its byte budget.
+    entries = _cache_entries()
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= TEX_CACHE_MAX_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        _TEX_CACHE_STATS["evictions"] += 1
+
+
+def enable_tex_cache():
+    tex_mobject.tex_to_svg_file = _cached_tex_to_svg_file
+    SingleStringMathTex.generate_mobject = _cached_generate_mobject
+
+
+def disable_tex_cache():
+    tex_mobject.tex_to_svg_file = _ORIGINAL_TEX_TO_SVG_FILE
+    SingleStringMathTex.generate_mobject = _ORIGINAL_GENERATE_MOBJECT
+
+
+def tex_cache_stats():
+    entries = _cache_entries()
+    return dict(
+        _TEX_CACHE_STATS,
+        entries=len(entries),
+        bytes=sum(size for _, size, _ in entries),
+    )
+
+
+def clear_tex_cache():
+    for path in TEX_CACHE_DIR.glob("*.npz"):
+        path.unlink(missing_ok=True)
+    _SVG_SOURCES.clear()
+    for name in _TEX_CACHE_STATS:
+        _TEX_CACHE_STATS[name] = 0
@@ -0,0 +1,422 @@
+from manim import *
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+from SceneRunner import QUALITIES, load_scene_class, render_config, with_renderer
+
+# Keyframe timeline export, an alternative to the rendered movie.
+# These scenes are mostly linear maps applied to planes and arrows plus text
+# and TeX fading or writing in, and all of that can be replayed from a few
+# numbers. The exporter runs construct() once with nothing rasterized or
+# encoded and samples every mobject at each frame time. Each mobject's path is
+# stored once, as SVG path data, and its samples are reduced to keyframes:
+#   - an affine map of the path (ApplyMatrix, batched_apply_matrix, GrowArrow,
+#     shifts and scales),
+#   - how much of the path is drawn (Write, Create),
+#   - fill, stroke and background stroke colours, opacities and widths
+#     (FadeIn, FadeOut, the fill phase of Write),
+# with one of manim's rate functions as the easing between two keyframes.
+# Keyframes are only added where the easing would miss a sample by more
+# than TOLERANCE, so an ApplyMatrix is two keyframes per mobject.
+#
+#     python TimelineExport.py GeometricInterpretation.py GeometricEigenvectorVisualization
+#
+# writes <Scene>.json and <Scene>.html, the bundled player (TimelinePlayer.html)
+# with the timeline inlined, to media/timelines (EIGEN_TIMELINE_DIR). Open the
+# .html in a browser; TimelinePlayer.html?src=<Scene>.json plays a timeline
+# served next to it.
+#
+# A sample that is none of the above, such as a Transform between two
+# different shapes, keeps its own path data and is shown as it is until the
+# next sample. Only vectorized mobjects are exported; point clouds and images
+# are left out with a warning, and gradients are drawn in their first colour.
+TIMELINE_DIR = Path(os.environ.get("EIGEN_TIMELINE_DIR", Path(__file__).resolve().parent / "media" / "timelines"))
+PLAYER_PATH = Path(__file__).resolve().parent / "TimelinePlayer.html"
+TIMELINE_VERSION = 1
+
+# Largest error, in frame units, of a point the player draws at a sample time.
+TOLERANCE = 0.002
+COLOR_TOLERANCE = 0.004
+WIDTH_TOLERANCE = 0.02
+
+# Easings between two keyframes, in the order they are tried. The player
+# (TimelinePlayer.html) implements the same functions under the same names;
+# "step" holds the earlier keyframe until the later one.
+EASINGS = {
+    "step": None,
+    "linear": linear,
+    "smooth": smooth,
+    "rush_into": rush_into,
+    "rush_from": rush_from,
+    "double_smooth": double_smooth,
+    "slow_into": slow_into,
+}
+EASING_NAMES = list(EASINGS)
+
+# The values of a keyframe, after its time and easing. a to f map a point
+# (x, y) of the path to (a x + c y + e, b x + d y + f), as in SVG and canvas.
+KEY_FIELDS = (
+    "a", "b", "c", "d", "e", "f", "reveal",
+    "fill_r", "fill_g", "fill_b", "fill_a",
+    "stroke_r", "stroke_g", "stroke_b", "stroke_a", "stroke_width",
+    "background_r", "background_g", "background_b", "background_a", "background_width",
+)
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0)
+CAMERA_FIELDS = ("x", "y", "width", "height")
+
+LINE_JOINS = {LineJointType.AUTO: "miter", LineJointType.ROUND: "round", LineJointType.BEVEL: "bevel", LineJointType.MITER: "miter"}
+LINE_CAPS = {CapStyleType.AUTO: "butt", CapStyleType.ROUND: "round", CapStyleType.BUTT: "butt", CapStyleType.SQUARE: "square"}
+
+
+def path_data(points):
+    # SVG path data for cubic Bezier points (anchor, handle, handle, anchor, ...),
+    # split into subpaths and closed the way manim's Cairo camera does it.
+    commands = []
+    start = end = None
+    for curve in points.reshape(-1, 4, 2):
+        if end is None or not np.allclose(curve[0], end, rtol=1e-5, atol=1e-6):
+            if start is not None and np.allclose(start, end, rtol=1e-5, atol=1e-6):
+                commands.append("Z")
+            start = curve[0]
+            commands.append(f"M{curve[0][0]:.4f} {curve[0][1]:.4f}")
+        commands.append("C" + " ".join(f"{x:.4f} {y:.4f}" for x, y in curve[1:]))
+        end = curve[3]
+    if start is not None and np.allclose(start, end, rtol=1e-5, atol=1e-6):
+        commands.append("Z")
+    return "".join(commands).replace("-0.0000", "0.0000")
+
+
+def partial_curve(curve, t):
+    # The part of a cubic Bezier curve from 0 to t (de Casteljau).
+    a = curve[:-1] + t * (curve[1:] - curve[:-1])
+    b = a[:-1] + t * (a[1:] - a[:-1])
+    c = b[:-1] + t * (b[1:] - b[:-1])
+    return np.array([curve[0], a[0], b[0], c[0]])
+
+
+def reveal_fraction(reference, points):
+    # The r for which points is reference.pointwise_become_partial(reference, 0, r),
+    # i.e. the first r of the path as Write and Create draw it, or None.
+    count = len(points)
+    if count == 0 or count % 4 or count > len(reference):
+        return None
+    head = count - 4
+    if not np.allclose(points[:head], reference[:head], atol=TOLERANCE / 4):
+        return None
+    curve = reference[head:count]
+    # The drawn part of the last curve ends at its point t; search t, then refine.
+    candidates = np.linspace(0, 1, 65)
+    errors = [np.abs(partial_curve(curve, t) - points[head:]).max() for t in candidates]
+    best = int(np.argmin(errors))
+    low, high = candidates[max(best - 1, 0)], candidates[min(best + 1, len(candidates) - 1)]
+    for _ in range(30):
+        left, right = low + (high - low) / 3, high - (high - low) / 3
+        if np.abs(partial_curve(curve, left) - points[head:]).max() <= np.abs(partial_curve(curve, right) - points[head:]).max():
+            high = right
+        else:
+            low = left
+    t = (low + high) / 2
+    if np.abs(partial_curve(curve, t) - points[head:]).max() > TOLERANCE / 2:
+        return None
+    return (head // 4 + t) / (len(reference) // 4)
+
+
+def fitting_easing(times, values, tolerance):
+    # The first easing that takes values[0] to values[-1] through every sample in between.
+    u = (times[1:-1] - times[0]) / (times[-1] - times[0])
+    delta = values[-1] - values[0]
+    for name in EASING_NAMES[1:]:
+        progress = np.array([EASINGS[name](x) for x in u])
+        if np.all(np.abs(values[0] + progress[:, None] * delta - values[1:-1]) <= tolerance):
+            return name
+    return None
+
+
+def reduce_track(times, values, tolerance, fixed=None):
+    # Keyframes, as (sample, easing) pairs, that reproduce every sample within tolerance.
+    # Fixed samples cannot be interpolated to or from, and samples at the time of
+    # the one before are jumps (a change between two plays).
+    count = len(times)
+    fixed = np.zeros(count, bool) if fixed is None else fixed
+    # The inside of a run of equal samples is reproduced by any easing; only the
+    # ends are kept, and no keyframe reaches across either end of the run.
+    same = np.all(values[1:] == values[:-1], axis=1)
+    inside = np.zeros(count, bool)
+    inside[1:-1] = same[:-1] & same[1:]
+    stops = np.zeros(count, bool)
+    stops[:-1] |= inside[1:]
+    stops[1:] |= inside[:-1]
+    stops &= ~inside
+    kept = np.flatnonzero(~inside)
+    times, values, fixed, stops = times[kept], values[kept], fixed[kept], stops[kept]
+
+    keys = [(0, "step")]
+    i, last = 0, len(times) - 1
+    while i < last:
+        if fixed[i] or fixed[i + 1] or times[i + 1] == times[i]:
+            i += 1
+            keys.append((i, "step"))
+            continue
+        # The start of an eased change only fits as part of all of it, so the
+        # longest keyframe is tried first.
+        limit = i + 1
+        while limit < last and not stops[limit] and not fixed[limit + 1] and times[limit + 1] != times[limit]:
+            limit += 1
+        end, easing = i + 1, "linear"
+        for j in range(limit, i + 1, -1):
+            fitting = fitting_easing(times[i:j + 1], values[i:j + 1], tolerance)
+            if fitting is not None:
+                end, easing = j, fitting
+                break
+        keys.append((end, easing))
+        i = end
+    # Trailing keyframes that change nothing.
+    while len(keys) > 1 and np.array_equal(values[keys[-1][0]], values[keys[-2][0]]):
+        keys.pop()
+    return [(int(kept[index]), easing) for index, easing in keys]
+
+
+def key_row(time, easing, values, decimals):
+    # + 0.0 writes -0.0 as 0.0.
+    return [round(float(time), 4) + 0.0, EASING_NAMES.index(easing), *(round(float(value), places) + 0.0 for value, places in zip(values, decimals))]
+
+
+class ElementTrack:
+    # The samples of one mobject: (sample number, points, style).
+    def __init__(self, mobject):
+        # Holding the mobject keeps its id from being reused by another.
+        self.mobject = mobject
+        self.samples = []
+        self.join = LINE_JOINS.get(getattr(mobject, "joint_type", None), "miter")
+        self.cap = LINE_CAPS.get(getattr(mobject, "cap_style", None), "butt")
+        self.gradient = False
+
+    def sample(self, index, mobject):
+        points = mobject.points[:, :2]
+        fill = mobject.get_fill_rgbas()
+        stroke = mobject.get_stroke_rgbas()
+        background = mobject.get_stroke_rgbas(background=True)
+        self.gradient |= len(fill) > 1 or len(stroke) > 1
+        style = np.array([
+            *fill[0], *stroke[0], mobject.get_stroke_width(),
+            *background[0], mobject.get_stroke_width(background=True),
+        ], float)
+        if self.samples:
+            # Unchanged samples share arrays, so they are fitted once.
+            _, last_points, last_style = self.samples[-1]
+            if np.array_equal(last_points, points):
+                points = last_points
+            if np.array_equal(last_style, style):
+                style = last_style
+        if not self.samples or points is not self.samples[-1][1]:
+            points = points.copy()
+        self.samples.append((index, points, style))
+
+    def export(self, times, duration):
+        count = max(len(points) for _, points, _ in self.samples)
+        if count < 4:
+            return None
+        # The path is stored as its largest full sample, the latest of equals.
+        full = [points for _, points, _ in reversed(self.samples) if len(points) == count]
+        reference = max(full, key=lambda points: np.ptp(points, axis=0).sum())
+        basis = np.column_stack([reference, np.ones(count)])
+        inverse = np.linalg.pinv(basis)
+        scale = np.abs(reference).max(axis=0).sum() + 1
+
+        geometry = {}
+        paths = {}
+        for _, points, _ in self.samples:
+            if id(points) in geometry:
+                continue
+            if len(points) == count:
+                mapping = inverse @ points
+                if np.abs(basis @ mapping - points).max() <= TOLERANCE / 2:
+                    geometry[id(points)] = (*mapping[:2].ravel(), *mapping[2], 1.0)
+                    continue
+            reveal = reveal_fraction(reference, points)
+            if reveal is not None:
+                geometry[id(points)] = (*IDENTITY[:6], reveal)
+            elif len(points) >= 4 and len(points) % 4 == 0:
+                geometry[id(points)] = IDENTITY
+                paths[id(points)] = path_data(points)
+            else:
+                # Too few points to draw.
+                geometry[id(points)] = (*IDENTITY[:6], 0.0)
+
+        values = np.array([(*geometry[id(points)], *style) for _, points, style in self.samples])
+        fixed = np.array([id(points) in paths for _, points, _ in self.samples])
+        curves = count // 4
+        tolerance = np.array(
+            [TOLERANCE / scale] * 6 + [TOLERANCE / (2 * scale * curves)]
+            + [COLOR_TOLERANCE] * 8 + [WIDTH_TOLERANCE] + [COLOR_TOLERANCE] * 4 + [WIDTH_TOLERANCE]
+        )
+        decimals = [5] * 6 + [5] + [3] * 8 + [3] + [3] * 4 + [3]
+
+        # One span per run of consecutive samples the mobject is on screen for.
+        indices = np.array([index for index, _, _ in self.samples])
+        breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+        spans = []
+        for run in np.split(np.arange(len(indices)), breaks):
+            run_times = times[indices[run]]
+            end = indices[run[-1]] + 1
+            span = {"from": round(float(run_times[0]), 4), "to": round(float(times[end] if end < len(times) else duration), 4), "keys": []}
+            for number, (sample, easing) in enumerate(reduce_track(run_times, values[run], tolerance, fixed[run])):
+                points = self.samples[run[sample]][1]
+                span["keys"].append(key_row(run_times[sample], easing, values[run[sample]], decimals))
+                if id(points) in paths:
+                    span.setdefault("paths", {})[str(number)] = paths[id(points)]
+            spans.append(span)
+        return {"d": path_data(reference), "join": self.join, "cap": self.cap, "spans": spans}
+
+
+class TimelineRenderer(CairoRenderer):
+    # Samples the scene at every frame time instead of drawing and encoding it.
+    def init_scene(self, scene, session_spec, file_writer_settings):
+        super().init_scene(scene, session_spec, file_writer_settings)
+        self.times = []
+        self.tracks = {}
+        self.order = []
+        self.camera_samples = []
+        self.skipped = {}
+
+    def record(self, scene):
+        index = len(self.times)
+        self.times.append(self.time)
+        camera = self.camera
+        self.camera_samples.append((*camera.frame_center[:2], camera.frame_width, camera.frame_height))
+        members = extract_mobject_family_members(
+            list_update(scene.mobjects, scene.foreground_mobjects),
+            use_z_index=camera.use_z_index,
+            only_those_with_points=True,
+        )
+        previous = None
+        for mobject in members:
+            if not isinstance(mobject, VMobject):
+                self.skipped[type(mobject).__name__] = self.skipped.get(type(mobject).__name__, 0) + 1
+                continue
+            track = self.tracks.get(id(mobject))
+            if track is None:
+                # Drawn just above whatever was drawn before it the first time it shows.
+                track = self.tracks[id(mobject)] = ElementTrack(mobject)
+                self.order.insert(self.order.index(previous) + 1 if previous else 0, track)
+            track.sample(index, mobject)
+            previous = track
+
+    def render(self, scene, time, moving_mobjects=None):
+        if self.skip_animations:
+            # A skipped play; its end is recorded after it.
+            return
+        self.record(scene)
+        self.time += 1 / self.camera.frame_rate
+
+    def play(self, scene, *args, **kwargs):
+        self.scene = scene
+        super().play(scene, *args, **kwargs)
+        # Where the play leaves things; the next play's first sample has the same time.
+        self.record(scene)
+
+    def freeze_current_frame(self, duration):
+        self.record(self.scene)
+        self.add_frame(None, num_frames=int(duration * self.camera.frame_rate))
+
+    def add_frame(self, frame, num_frames=1):
+        if not self.skip_animations:
+            self.time += num_frames / self.camera.frame_rate
+
+    def update_frame(self, scene, mobjects=None, **kwargs):
+        # Nothing is drawn; the player draws the timeline.
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+        return None
+
+    def scene_finished(self, scene):
+        self.record(scene)
+        super().scene_finished(scene)
+
+    def timeline(self, name):
+        times = np.array(self.times)
+        duration = float(times[-1]) if len(times) else 0.0
+        if self.skipped:
+            logger.warning(f"Not in the timeline: {', '.join(f'{count} samples of {kind}' for kind, count in sorted(self.skipped.items()))}")
+        elements = []
+        gradients = 0
+        for track in self.order:
+            element = track.export(times, duration)
+            if element is not None:
+                elements.append(element)
+                gradients += track.gradient
+        if gradients:
+            logger.warning(f"{gradients} mobjects with gradients are drawn in their first colour")
+        camera_values = np.array(self.camera_samples)
+        camera_keys = reduce_track(times, camera_values, np.full(4, TOLERANCE)) if len(times) else []
+        return {
+            "version": TIMELINE_VERSION,
+            "scene": name,
+            "duration": round(duration, 4),
+            "pixel_width": config.pixel_width,
+            "pixel_height": config.pixel_height,
+            "background": ManimColor(config.background_color).to_hex(),
+            "background_opacity": config.background_opacity,
+            "easings": EASING_NAMES,
+            "fields": list(KEY_FIELDS),
+            "camera": {
+                "fields": list(CAMERA_FIELDS),
+                "keys": [key_row(times[sample], easing, camera_values[sample], [5] * 4) for sample, easing in camera_keys],
+            },
+            "elements": elements,
+        }
+
+
+def timeline_scene(scene_class):
+    # Returns a subclass of the scene that records a timeline instead of a movie.
+    return with_renderer(scene_class, TimelineRenderer)
+
+
+def player_html(timeline_json):
+    # The player with the timeline inlined, so it opens from disk without a server.
+    player = PLAYER_PATH.read_text()
+    placeholder = '<script id="timeline" type="application/json"></script>'
+    # "</" would end the script element early.
+    inlined = timeline_json.replace("</", "<\\/")
+    return player.replace(placeholder, f'<script id="timeline" type="application/json">{inlined}</script>')
+
+
+def export_timeline(path, scene_name, quality="l", output_dir=None, frame_rate=None):
+    # Runs the scene once and writes <Scene>.json and <Scene>.html; returns both paths.
+    scene_class = timeline_scene(load_scene_class(path, scene_name))
+    options = {"dry_run": True, "disable_caching": True}
+    if frame_rate:
+        options["frame_rate"] = frame_rate
+    with tempconfig(render_config(quality, **options)):
+        scene = scene_class()
+        scene.render()
+        timeline = scene.renderer.timeline(scene_name)
+    output_dir = Path(output_dir or TIMELINE_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timeline_json = json.dumps(timeline, separators=(",", ":"))
+    json_path = output_dir / f"{scene_name}.json"
+    json_path.write_text(timeline_json)
+    html_path = output_dir / f"{scene_name}.html"
+    html_path.write_text(player_html(timeline_json))
+    return json_path, html_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a scene as a keyframe timeline and a player for it.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l", help="Sets the player's size and the sample rate.")
+    parser.add_argument("-o", "--output-dir", default=None)
+    parser.add_argument("--rate", type=float, default=None, help="Samples per second, default the quality's frame rate.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    json_path, html_path = export_timeline(args.file, args.scene, args.quality, args.output_dir, args.rate)
+    print(f"{args.scene} exported in {time.perf_counter() - start:.2f}s: {json_path} ({json_path.stat().st_size / 1024:.1f} KB), {html_path}")
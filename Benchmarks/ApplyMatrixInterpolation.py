@@ -0,0 +1,90 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Animations"))
+
+from manim import *
+
+from BatchedTransform import batched_apply_matrix
+from PlaneFactory import cached_plane
+
+# Per-frame benchmark for the transformation in GeometricEigenvectorVisualization:
+# a 40x40 plane and three arrows under one matrix, interpolated for one second
+# at 60 fps, with ApplyMatrix and with batched_apply_matrix. Rendering is not timed.
+MATRIX = [[2, 1], [1, 2]]
+FRAMES = 60
+# Points are also compared part way through, where the rate function matters.
+CHECK_ALPHA = 0.3
+TOLERANCE = 1e-9
+
+
+def build_mobjects():
+    plane = cached_plane(background_line_style={"stroke_color": BLUE, "stroke_width": 1, "stroke_opacity": 0.5})
+    arrows = [Arrow(ORIGIN, end, buff=0) for end in ([1, 1, 0], [1, -1, 0], [2, 0.5, 0])]
+    return [plane, *arrows]
+
+
+def run(animations):
+    for animation in animations:
+        animation.begin()
+    for frame in range(1, FRAMES + 1):
+        for animation in animations:
+            animation.interpolate(frame / FRAMES)
+    for animation in animations:
+        animation.finish()
+
+
+def points_at(make_animations, alpha):
+    mobjects = build_mobjects()
+    animations = make_animations(mobjects)
+    for animation in animations:
+        animation.begin()
+    for animation in animations:
+        animation.interpolate(alpha)
+    return [submobject.points.copy() for mobject in mobjects for submobject in mobject.family_members_with_points()]
+
+
+def max_difference(alpha):
+    expected = points_at(lambda mobjects: [ApplyMatrix(MATRIX, mobject) for mobject in mobjects], alpha)
+    actual = points_at(lambda mobjects: batched_apply_matrix(MATRIX, *mobjects), alpha)
+    return max(np.abs(a - b).max(initial=0) for a, b in zip(expected, actual))
+
+
+def time_apply_matrix():
+    mobjects = build_mobjects()
+    start = time.perf_counter()
+    run([ApplyMatrix(MATRIX, mobject) for mobject in mobjects])
+    return time.perf_counter() - start, mobjects
+
+
+def time_batched():
+    mobjects = build_mobjects()
+    start = time.perf_counter()
+    run(batched_apply_matrix(MATRIX, *mobjects))
+    return time.perf_counter() - start, mobjects
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    stock = min(time_apply_matrix()[0] for _ in range(repeats))
+    batched = min(time_batched()[0] for _ in range(repeats))
+
+    # Both paths have to pass through and end on the same points.
+    expected = time_apply_matrix()[1]
+    actual = time_batched()[1]
+    max_error = max(
+        np.abs(a.points - b.points).max(initial=0)
+        for x, y in zip(expected, actual)
+        for a, b in zip(x.family_members_with_points(), y.family_members_with_points())
+    )
+    midway_error = max_difference(CHECK_ALPHA)
+
+    print(f"plane + 3 arrows, {FRAMES} frames, best of {repeats}")
+    print(f"  ApplyMatrix:           {stock * 1000:8.1f} ms")
+    print(f"  batched_apply_matrix:  {batched * 1000:8.1f} ms")
+    print(f"  speedup:               {stock / batched:8.2f}x")
+    print(f"  max point difference:  {max_error:.2e}")
+    print(f"  at alpha {CHECK_ALPHA}:          {midway_error:.2e}")
+    if max(max_error, midway_error) > TOLERANCE:
+        sys.exit("batched_apply_matrix does not follow ApplyMatrix")
@@ -0,0 +1,56 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Animations"))
+
+from manim import *
+
+from PlaneFactory import cached_plane, clear_plane_cache, plane_cache_stats
+
+# Construct-time benchmark for the planes built by FinalVisualization:
+# eight 40x40 planes in two styles, built directly and through the cache.
+STYLES = [
+    {"stroke_color": GREY, "stroke_width": 1, "stroke_opacity": 0.5},
+    {"stroke_color": BLUE, "stroke_width": 2, "stroke_opacity": 0.7},
+]
+BUILDS = [0, 1, 1, 0, 1, 0, 1, 1]
+
+
+def build_direct():
+    for style in BUILDS:
+        NumberPlane(
+            x_range=[-20, 20, 1],
+            y_range=[-20, 20, 1],
+            background_line_style=STYLES[style],
+        )
+
+
+def build_cached():
+    for style in BUILDS:
+        cached_plane(background_line_style=STYLES[style])
+
+
+def best_of(func, repeats, setup=None):
+    times = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    direct = best_of(build_direct, repeats)
+    cold = best_of(build_cached, repeats, setup=clear_plane_cache)
+    warm = best_of(build_cached, repeats)
+
+    print(f"{len(BUILDS)} planes, best of {repeats}")
+    print(f"  direct NumberPlane:  {direct * 1000:8.1f} ms")
+    print(f"  cache, cold start:   {cold * 1000:8.1f} ms")
+    print(f"  cache, warm:         {warm * 1000:8.1f} ms")
+    print(f"  speedup (cold):      {direct / cold:8.2f}x")
+    print(f"  cache stats:         {plane_cache_stats()}")
@@ -0,0 +1,199 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ANIMATIONS = Path(__file__).resolve().parent.parent / "Animations"
+sys.path.insert(0, str(ANIMATIONS))
+
+from manim import *
+
+from BatchRender import DEFAULT_SCENES, SCENES
+from SceneRunner import load_scene_class, render_config
+
+# Regression suite for the four scenes, in three tiers:
+#   construct  animations skipped, only the last frame drawn (manim -s)
+#   tiny       every frame drawn and encoded at 160x90
+#   low        the -ql render
+# Each case runs in a fresh process with manim's partial movie cache off and a
+# throwaway media folder, and records its render time, the process's peak RSS
+# and hashes of the frames handed to the encoder (one per play and one over the
+# whole scene), so output is compared before encoding and does not depend on
+# the codec. The persistent TeX cache is used as in a normal render.
+#
+#     python Benchmarks/SceneSuite.py --update-baseline    # record
+#     python Benchmarks/SceneSuite.py                      # compare
+#     python Benchmarks/SceneSuite.py --tier construct tiny --scene FinalVisualization
+#
+# A case fails when it is slower than its baseline by more than --tolerance,
+# uses more memory than --memory-tolerance allows, or draws different frames.
+# The exit status is 1 if any case failed. Timings only compare on the machine
+# that recorded them; the baseline notes which one that was.
+BASELINE = Path(__file__).resolve().parent / "SceneSuite.baseline.json"
+TIERS = {
+    "construct": render_config("l", format="png"),
+    "tiny": render_config("l", pixel_width=160, pixel_height=90),
+    "low": render_config("l"),
+}
+
+
+class FrameHasher:
+    # Hashes every frame written, overall and per play.
+    def __init__(self, file_writer):
+        self.frames = 0
+        self.scene_digest = hashlib.blake2b(digest_size=16)
+        self.play_digests = []
+        write_frame = file_writer.write_frame
+        begin_animation = file_writer.begin_animation
+
+        def hashed_write_frame(pixels, *, repeat=1):
+            self.add(pixels, repeat)
+            return write_frame(pixels, repeat=repeat)
+
+        def hashed_begin_animation(*args, **kwargs):
+            self.play_digests.append(hashlib.blake2b(digest_size=8))
+            return begin_animation(*args, **kwargs)
+
+        file_writer.write_frame = hashed_write_frame
+        file_writer.begin_animation = hashed_begin_animation
+
+    def add(self, pixels, repeat=1):
+        frame = hashlib.blake2b(pixels.tobytes(), digest_size=16).digest() + repeat.to_bytes(4, "little")
+        self.frames += repeat
+        self.scene_digest.update(frame)
+        if self.play_digests:
+            self.play_digests[-1].update(frame)
+
+
+def run_case(scene_name, tier, media_dir):
+    # Worker, in a fresh process: render one scene in one tier.
+    os.environ.pop("EIGEN_PROFILE", None)
+    scene_class = load_scene_class(ANIMATIONS / SCENES[scene_name], scene_name)
+    options = {
+        **TIERS[tier],
+        "media_dir": media_dir,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        "notify_outdated_version": False,
+    }
+    with tempconfig(options):
+        scene = scene_class()
+        hasher = FrameHasher(scene.renderer.file_writer)
+        start = time.perf_counter()
+        scene.render()
+        seconds = time.perf_counter() - start
+        if hasher.frames == 0:
+            # Nothing was encoded (construct tier): hash the last frame instead.
+            scene.renderer.update_frame(scene)
+            hasher.add(scene.renderer.get_frame())
+    return {
+        "seconds": round(seconds, 4),
+        # ru_maxrss is in KiB on Linux.
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "frames": hasher.frames,
+        "digest": hasher.scene_digest.hexdigest(),
+        "play_digests": [digest.hexdigest() for digest in hasher.play_digests],
+    }
+
+
+def measure(scene_name, tier, repeats):
+    # Best time and highest peak RSS over the repeats; the frames must not change between them.
+    runs = []
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory(prefix="scene_suite_") as media_dir:
+            with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+                runs.append(pool.submit(run_case, scene_name, tier, media_dir).result())
+    result = min(runs, key=lambda run: run["seconds"])
+    result["peak_rss_mb"] = max(run["peak_rss_mb"] for run in runs)
+    result["deterministic"] = len({run["digest"] for run in runs}) == 1
+    return result
+
+
+def compare(result, baseline, tolerance, memory_tolerance):
+    # Problems with one case, empty when it passes.
+    problems = []
+    if not result["deterministic"]:
+        problems.append("frames differ between repeats")
+    if baseline is None:
+        return problems
+    if result["seconds"] > baseline["seconds"] * (1 + tolerance):
+        problems.append(f"time {result['seconds']:.2f}s vs {baseline['seconds']:.2f}s")
+    if result["peak_rss_mb"] > baseline["peak_rss_mb"] * (1 + memory_tolerance):
+        problems.append(f"peak RSS {result['peak_rss_mb']:.0f} MB vs {baseline['peak_rss_mb']:.0f} MB")
+    if result["digest"] != baseline["digest"]:
+        changed = [
+            index
+            for index, (digest, expected) in enumerate(zip(result["play_digests"], baseline["play_digests"]))
+            if digest != expected
+        ]
+        if changed:
+            problems.append(f"frames differ from play {changed[0]} on")
+        else:
+            problems.append(f"frames differ ({result['frames']} frames vs {baseline['frames']})")
+    return problems
+
+
+def machine():
+    return {"host": platform.node(), "processor": platform.processor() or platform.machine(), "python": platform.python_version()}
+
+
+def print_table(rows):
+    print(f"{'scene':<36}{'tier':<11}{'seconds':>9}{'base':>9}{'change':>9}{'RSS MB':>9}{'frames':>8}  result")
+    for row in rows:
+        result, baseline = row["result"], row["baseline"]
+        if baseline is None:
+            base, change = "-", "-"
+        else:
+            base = f"{baseline['seconds']:.2f}"
+            change = f"{(result['seconds'] / baseline['seconds'] - 1) * 100:+.1f}%" if baseline["seconds"] else "-"
+        status = "; ".join(row["problems"]) or ("new" if baseline is None else "ok")
+        print(
+            f"{row['scene']:<36}{row['tier']:<11}{result['seconds']:>9.2f}{base:>9}{change:>9}"
+            f"{result['peak_rss_mb']:>9.0f}{result['frames']:>8}  {status}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the scenes and compare them with a stored baseline.")
+    parser.add_argument("--scene", action="append", choices=DEFAULT_SCENES, help="Scene to run; repeatable, default all four.")
+    parser.add_argument("--tier", nargs="+", choices=list(TIERS), default=list(TIERS))
+    parser.add_argument("-r", "--repeats", type=int, default=1)
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative slowdown, e.g. 0.15 for 15%%.")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="Allowed relative growth of peak RSS.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline.")
+    args = parser.parse_args()
+
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"machine": None, "cases": {}}
+    if stored["machine"] and stored["machine"]["host"] != machine()["host"]:
+        print(f"warning: baseline was recorded on {stored['machine']['host']}, timings may not compare", file=sys.stderr)
+
+    rows = []
+    for scene_name in args.scene or DEFAULT_SCENES:
+        for tier in args.tier:
+            result = measure(scene_name, tier, args.repeats)
+            baseline = None if args.update_baseline else stored["cases"].get(f"{scene_name}/{tier}")
+            rows.append({
+                "scene": scene_name,
+                "tier": tier,
+                "result": result,
+                "baseline": baseline,
+                "problems": compare(result, baseline, args.tolerance, args.memory_tolerance),
+            })
+    print_table(rows)
+
+    if args.update_baseline:
+        stored["machine"] = machine()
+        for row in rows:
+            stored["cases"][f"{row['scene']}/{row['tier']}"] = row["result"]
+        args.baseline.write_text(json.dumps(stored, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    sys.exit(1 if any(row["problems"] for row in rows) else 0)